@@ -0,0 +1,27 @@
+"""add profile embeddings for candidate search
+
+Revision ID: 2f6c8e0a4b13
+Revises: 9b3d5f7a1c42
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '2f6c8e0a4b13'
+down_revision: Union[str, None] = '9b3d5f7a1c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resume_features', sa.Column('profile_embedding', sa.LargeBinary(), nullable=True))
+    op.add_column('external_applications', sa.Column('resume_embedding', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('external_applications', 'resume_embedding')
+    op.drop_column('resume_features', 'profile_embedding')
@@ -0,0 +1,31 @@
+"""add resume_sha256 to external_applications
+
+Revision ID: 3c9e1f0a7b24
+Revises: f1e2d3c4b5a6
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3c9e1f0a7b24'
+down_revision: Union[str, None] = 'f1e2d3c4b5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('external_applications', sa.Column('resume_sha256', sa.String(length=64), nullable=True))
+    op.create_index(
+        'ix_external_applications_job_id_resume_sha256',
+        'external_applications',
+        ['job_id', 'resume_sha256'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_external_applications_job_id_resume_sha256', table_name='external_applications')
+    op.drop_column('external_applications', 'resume_sha256')
@@ -0,0 +1,41 @@
+"""add resume_features table
+
+Revision ID: 5e7a9c1d3f20
+Revises: 8d4b2a6e1c97
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision: str = '5e7a9c1d3f20'
+down_revision: Union[str, None] = '8d4b2a6e1c97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resume_features',
+        sa.Column('resume_id', sa.UUID(), nullable=False),
+        sa.Column('pipeline_version', sa.String(length=32), nullable=False),
+        sa.Column('segments', JSONB(), nullable=False),
+        sa.Column('skill_text', sa.Text(), nullable=False),
+        sa.Column('skill_tuples', JSONB(), nullable=False),
+        sa.Column('soft_skills', JSONB(), nullable=False),
+        sa.Column('years_experience', sa.Integer(), nullable=False),
+        sa.Column('skill_embeddings', sa.LargeBinary(), nullable=True),
+        sa.Column('embedding_dim', sa.Integer(), nullable=True),
+        sa.Column('resume_updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('resume_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resume_features')
@@ -0,0 +1,25 @@
+"""add profile_embedding to job_features
+
+Revision ID: 6a0e2c4f8d35
+Revises: 2f6c8e0a4b13
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '6a0e2c4f8d35'
+down_revision: Union[str, None] = '2f6c8e0a4b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_features', sa.Column('profile_embedding', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('job_features', 'profile_embedding')
@@ -0,0 +1,43 @@
+"""add minhash and near-duplicate columns to external_applications
+
+Revision ID: 8d4b2a6e1c97
+Revises: 3c9e1f0a7b24
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision: str = '8d4b2a6e1c97'
+down_revision: Union[str, None] = '3c9e1f0a7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('external_applications', sa.Column('resume_minhash', JSONB(), nullable=True))
+    op.add_column('external_applications', sa.Column('duplicate_of_id', sa.UUID(), nullable=True))
+    op.add_column('external_applications', sa.Column('duplicate_similarity', sa.Float(), nullable=True))
+    op.create_foreign_key(
+        'external_applications_duplicate_of_id_fkey',
+        'external_applications', 'external_applications',
+        ['duplicate_of_id'], ['id'],
+        ondelete='SET NULL',
+    )
+    op.create_index(
+        op.f('ix_external_applications_duplicate_of_id'),
+        'external_applications',
+        ['duplicate_of_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_external_applications_duplicate_of_id'), table_name='external_applications')
+    op.drop_constraint('external_applications_duplicate_of_id_fkey', 'external_applications', type_='foreignkey')
+    op.drop_column('external_applications', 'duplicate_similarity')
+    op.drop_column('external_applications', 'duplicate_of_id')
+    op.drop_column('external_applications', 'resume_minhash')
@@ -0,0 +1,43 @@
+"""add job_features table
+
+Revision ID: 9b3d5f7a1c42
+Revises: 5e7a9c1d3f20
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision: str = '9b3d5f7a1c42'
+down_revision: Union[str, None] = '5e7a9c1d3f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_features',
+        sa.Column('job_id', sa.UUID(), nullable=False),
+        sa.Column('pipeline_version', sa.String(length=32), nullable=False),
+        sa.Column('ontology_version', sa.String(length=32), nullable=False),
+        sa.Column('description_hash', sa.String(length=64), nullable=False),
+        sa.Column('segments', JSONB(), nullable=False),
+        sa.Column('full_text', sa.Text(), nullable=False),
+        sa.Column('skill_tuples', JSONB(), nullable=False),
+        sa.Column('alternatives', JSONB(), nullable=False),
+        sa.Column('soft_skills', JSONB(), nullable=False),
+        sa.Column('skill_embeddings', sa.LargeBinary(), nullable=True),
+        sa.Column('embedding_dim', sa.Integer(), nullable=True),
+        sa.Column('build_ms', sa.Float(), nullable=True),
+        sa.Column('built_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_features')
@@ -0,0 +1,25 @@
+"""add users.token_version for token revocation
+
+Revision ID: a7d4e2c9f1b6
+Revises: f3c6a9d2b8e4
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a7d4e2c9f1b6'
+down_revision: Union[str, None] = 'f3c6a9d2b8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
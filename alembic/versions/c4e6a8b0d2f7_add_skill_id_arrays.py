@@ -0,0 +1,54 @@
+"""add matched/missing skill id arrays with GIN indexes
+
+Revision ID: c4e6a8b0d2f7
+Revises: 6a0e2c4f8d35
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+revision: str = 'c4e6a8b0d2f7'
+down_revision: Union[str, None] = '6a0e2c4f8d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_TABLES = ('job_applications', 'external_applications')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        for column in ('matched_skill_ids', 'missing_skill_ids'):
+            op.add_column(table, sa.Column(column, ARRAY(sa.Text()), nullable=False, server_default='{}'))
+
+        # Backfill from the stored analyses
+        op.execute(f"""
+            UPDATE {table} SET
+                matched_skill_ids = ARRAY(
+                    SELECT DISTINCT s->>'canonical_id'
+                    FROM jsonb_array_elements(ai_analysis->'matched_skills') AS s
+                    WHERE s->>'canonical_id' IS NOT NULL
+                ),
+                missing_skill_ids = ARRAY(
+                    SELECT DISTINCT s->>'canonical_id'
+                    FROM jsonb_array_elements(ai_analysis->'missing_skills') AS s
+                    WHERE s->>'canonical_id' IS NOT NULL
+                )
+            WHERE jsonb_typeof(ai_analysis->'matched_skills') = 'array'
+              AND jsonb_typeof(ai_analysis->'missing_skills') = 'array'
+        """)
+
+        for column in ('matched_skill_ids', 'missing_skill_ids'):
+            op.create_index(f'ix_{table}_{column}', table, [column], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        for column in ('matched_skill_ids', 'missing_skill_ids'):
+            op.drop_index(f'ix_{table}_{column}', table_name=table)
+            op.drop_column(table, column)
@@ -0,0 +1,35 @@
+"""add scoring_queued_at to external_applications
+
+Revision ID: c9f2e4a6b8d1
+Revises: b8e5f3a1c7d2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c9f2e4a6b8d1'
+down_revision: Union[str, None] = 'b8e5f3a1c7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'external_applications',
+        sa.Column('scoring_queued_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        'ix_external_applications_unscored',
+        'external_applications',
+        ['uploaded_at'],
+        postgresql_where=sa.text('ai_scored_at IS NULL AND duplicate_of_id IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_external_applications_unscored', table_name='external_applications')
+    op.drop_column('external_applications', 'scoring_queued_at')
@@ -0,0 +1,52 @@
+"""add recruiter_stats rollup table
+
+Revision ID: d2a7c9e1f4b3
+Revises: c4e6a8b0d2f7
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd2a7c9e1f4b3'
+down_revision: Union[str, None] = 'c4e6a8b0d2f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'recruiter_stats',
+        sa.Column('recruiter_id', sa.UUID(), nullable=False),
+        sa.Column('job_id', sa.UUID(), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('source', sa.String(length=16), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['recruiter_id'], ['recruiter_profiles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recruiter_id', 'job_id', 'status', 'source', 'month'),
+    )
+
+    # Backfill (same rows as recruiter_stats_service.rollup_from_applications)
+    op.execute("""
+        INSERT INTO recruiter_stats (recruiter_id, job_id, status, source, month, count)
+        SELECT recruiter_id, job_id, status, source, month, count(*)
+        FROM (
+            SELECT j.recruiter_id, a.job_id, a.status::text AS status, 'PLATFORM' AS source,
+                   date_trunc('month', timezone('UTC', a.applied_at))::date AS month
+            FROM job_applications a JOIN jobs j ON j.id = a.job_id
+            UNION ALL
+            SELECT j.recruiter_id, e.job_id, e.status::text, e.source::text,
+                   date_trunc('month', timezone('UTC', e.uploaded_at))::date
+            FROM external_applications e JOIN jobs j ON j.id = e.job_id
+        ) AS apps
+        GROUP BY recruiter_id, job_id, status, source, month
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('recruiter_stats')
@@ -0,0 +1,45 @@
+"""add jobs full-text search vector and trigram indexes
+
+Revision ID: e5b8d1f3a6c9
+Revises: d2a7c9e1f4b3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+revision: str = 'e5b8d1f3a6c9'
+down_revision: Union[str, None] = 'd2a7c9e1f4b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same expression as src.models.job_model.JOB_SEARCH_VECTOR_SQL
+_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Generated column: filled for existing rows here, maintained by Postgres after
+    op.add_column('jobs', sa.Column('search_vector', TSVECTOR(), sa.Computed(_SEARCH_VECTOR_SQL, persisted=True)))
+    op.create_index('ix_jobs_search_vector', 'jobs', ['search_vector'], postgresql_using='gin')
+    op.create_index('ix_jobs_title_trgm', 'jobs', ['title'], postgresql_using='gin',
+                    postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_jobs_location_trgm', 'jobs', ['location'], postgresql_using='gin',
+                    postgresql_ops={'location': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_location_trgm', table_name='jobs')
+    op.drop_index('ix_jobs_title_trgm', table_name='jobs')
+    op.drop_index('ix_jobs_search_vector', table_name='jobs')
+    op.drop_column('jobs', 'search_vector')
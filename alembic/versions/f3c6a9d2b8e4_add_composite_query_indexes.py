@@ -0,0 +1,54 @@
+"""add composite indexes for hot service queries
+
+Revision ID: f3c6a9d2b8e4
+Revises: e5b8d1f3a6c9
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'f3c6a9d2b8e4'
+down_revision: Union[str, None] = 'e5b8d1f3a6c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, columns) — kept in sync with the models' __table_args__;
+# benchmarks/check_query_plans.py fails if a service query stops using them.
+_INDEXES = (
+    ('ix_job_applications_job_id_status', 'job_applications', ['job_id', 'status']),
+    ('ix_job_applications_job_id_applied_at', 'job_applications', ['job_id', 'applied_at', 'id']),
+    ('ix_job_applications_candidate_id_applied_at', 'job_applications', ['candidate_id', 'applied_at']),
+    ('ix_external_applications_job_id_status', 'external_applications', ['job_id', 'status']),
+    ('ix_external_applications_job_id_uploaded_at', 'external_applications', ['job_id', 'uploaded_at']),
+    ('ix_jobs_recruiter_id_status', 'jobs', ['recruiter_id', 'status']),
+    ('ix_jobs_status_created_at', 'jobs', ['status', 'created_at', 'id']),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY: no write lock on the (large) tables while the indexes build
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+        # notifications is created outside the migrations (create_all), so it may not
+        # exist yet. A DO block cannot build CONCURRENTLY, so this one is a plain CREATE INDEX.
+        op.execute("""
+            DO $$
+            BEGIN
+                IF to_regclass('notifications') IS NOT NULL THEN
+                    CREATE INDEX IF NOT EXISTS ix_notifications_user_id_is_read_created_at
+                        ON notifications (user_id, is_read, created_at);
+                END IF;
+            END $$
+        """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notifications_user_id_is_read_created_at")
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
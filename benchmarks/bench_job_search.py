@@ -0,0 +1,164 @@
+"""
+Benchmark: job board search, ILIKE scans vs tsvector / pg_trgm indexes
+Run from the repository root against a scratch database (DB_URL) that has
+the e5b8d1f3a6c9 migration applied:
+
+    python benchmarks/bench_job_search.py [--jobs 100000] [--limit 20]
+
+Seeds ``--jobs`` synthetic open jobs inside a transaction that is rolled
+back at the end. For each search term, ``ilike`` is the old filter
+(``%term%`` on title, description and location, newest first) and
+``search`` is ``list_jobs_service`` with ``q=term`` (ranked, with
+highlights); ``fuzzy`` runs the trigram title / location filters with typos.
+The plan column shows whether the query hit an index or a sequential scan.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import insert, or_, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+import src.models  # noqa: E402,F401
+from src.config.db import engine  # noqa: E402
+from src.models.job_model import EmploymentType, Job, JobStatus  # noqa: E402
+from src.models.recruiter_model import RecruiterProfile  # noqa: E402
+from src.models.user_model import User, UserRole  # noqa: E402
+from src.schema.jobs_schema import JobFilterSchema  # noqa: E402
+from src.services import job_search_service as job_search  # noqa: E402
+from src.services.job_services import list_jobs_service  # noqa: E402
+from src.utils.pagination import explain  # noqa: E402
+
+_CHUNK = 5000
+
+_ROLES = ["Backend Engineer", "Frontend Developer", "Data Scientist", "DevOps Engineer", "Product Manager",
+          "QA Engineer", "Mobile Developer", "Machine Learning Engineer", "Site Reliability Engineer",
+          "Technical Writer", "Security Analyst", "Database Administrator"]
+_SKILLS = ["python", "java", "kubernetes", "react", "postgres", "terraform", "golang", "rust", "django",
+           "fastapi", "spark", "kafka", "typescript", "aws", "gcp", "docker", "pytorch", "graphql"]
+_CITIES = ["Berlin", "London", "Bangalore", "Toronto", "Austin", "Singapore", "Lisbon", "Remote"]
+_FILLER = ("We are looking for a motivated engineer to join a fast growing team. You will own services "
+           "end to end, collaborate with product and design, and mentor other engineers.").split()
+
+_TERMS = ["kubernetes", "machine learning", "postgres terraform"]
+_FUZZY = {"title": "Enginer", "location": "Bangalor"}
+
+
+def _description(rng: random.Random) -> str:
+    words = rng.sample(_SKILLS, 4) + [rng.choice(_FILLER) for _ in range(rng.randint(120, 400))]
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+async def seed(conn, n_jobs: int, seed_value: int = 7) -> None:
+    rng = random.Random(seed_value)
+    now = datetime.now(timezone.utc)
+    run = uuid.uuid4().hex[:8]
+
+    user = {"id": uuid.uuid4(), "email": f"bench-{run}-recruiter@example.com",
+            "role": UserRole.RECRUITER, "is_verified": True}
+    recruiter = {"id": uuid.uuid4(), "user_id": user["id"], "full_name": "Bench Recruiter"}
+    await conn.execute(insert(User.__table__), [user])
+    await conn.execute(insert(RecruiterProfile.__table__), [recruiter])
+
+    for start in range(0, n_jobs, _CHUNK):
+        await conn.execute(insert(Job.__table__), [{
+            "id": uuid.uuid4(),
+            "recruiter_id": recruiter["id"],
+            "title": f"{rng.choice(['Senior', 'Junior', 'Staff', 'Lead'])} {rng.choice(_ROLES)}",
+            "description": _description(rng),
+            "location": rng.choice(_CITIES),
+            "employment_type": rng.choice(list(EmploymentType)),
+            "status": JobStatus.OPEN if rng.random() < 0.8 else JobStatus.CLOSED,
+            "created_at": now - timedelta(days=rng.uniform(0, 365)),
+        } for _ in range(start, min(start + _CHUNK, n_jobs))])
+
+
+def ilike_query(term: str, limit: int):
+    pattern = f"%{term}%"
+    return (
+        select(Job)
+        .where(Job.status == JobStatus.OPEN,
+               or_(Job.title.ilike(pattern), Job.description.ilike(pattern), Job.location.ilike(pattern)))
+        .order_by(Job.created_at.desc())
+        .limit(limit)
+    )
+
+
+async def plan_summary(db: AsyncSession, stmt) -> str:
+    nodes = []
+
+    def walk(node):
+        if "Scan" in node["Node Type"]:
+            nodes.append(f"{node['Node Type']}({node.get('Index Name', node.get('Relation Name', ''))})")
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(await explain(db, stmt))
+    return ", ".join(nodes)
+
+
+async def timed(fn, runs: int) -> tuple[float, float, object]:
+    timings, result = [], None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        result = await fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[min(len(timings) - 1, int(len(timings) * 0.95))], result
+
+
+async def run(args) -> None:
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            t0 = time.perf_counter()
+            await seed(conn, args.jobs)
+            await conn.exec_driver_sql("ANALYZE jobs")
+            print(f"seeded {args.jobs} jobs in {time.perf_counter() - t0:.1f}s")
+
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+            print(f"{'mode':<8} {'term':<20} {'rows':>5} {'median':>9} {'p95':>9}  plan")
+            for term in _TERMS:
+                stmt = ilike_query(term, args.limit)
+                median, p95, rows = await timed(lambda: db.execute(stmt), args.runs)
+                print(f"{'ilike':<8} {term:<20} {len(rows.all()):>5} {median:>7.1f}ms {p95:>7.1f}ms  "
+                      f"{await plan_summary(db, stmt)}")
+
+                filters = JobFilterSchema(q=term, limit=args.limit)
+                median, p95, (jobs, _, estimate) = await timed(
+                    lambda: list_jobs_service(db, None, filters), args.runs)
+                match = select(Job.id).where(Job.status == JobStatus.OPEN,
+                                             job_search.matches(job_search.search_query(term)))
+                print(f"{'search':<8} {term:<20} {len(jobs):>5} {median:>7.1f}ms {p95:>7.1f}ms  "
+                      f"{await plan_summary(db, match)}; ~{estimate} matches")
+
+            for field, term in _FUZZY.items():
+                filters = JobFilterSchema(**{field: term, "limit": args.limit})
+                median, p95, (jobs, _, _) = await timed(lambda: list_jobs_service(db, None, filters), args.runs)
+                print(f"{'fuzzy':<8} {field + '=' + term:<20} {len(jobs):>5} {median:>7.1f}ms {p95:>7.1f}ms")
+            await db.close()
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Benchmark: recruiter dashboard, per-metric queries vs the recruiter_stats rollup
+Run from the repository root against a scratch database (DB_URL):
+
+    python benchmarks/bench_recruiter_dashboard.py [--jobs 100] [--applications 50000] [--check]
+
+Seeds one recruiter with ``--jobs`` jobs and ``--applications`` applications
+(``--platform-share`` of them platform applications, the rest external,
+spread over the last year) inside a transaction that is rolled back at the
+end; the rollup is filled by the reconciliation job (its time is reported).
+``baseline`` replays the statements the dashboard used to issue one by one;
+``rollup`` is the current ``get_recruiter_dashboard_data``. Statements are
+counted with a cursor-execute listener on the engine.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event, func, insert, literal_column, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+import src.models  # noqa: E402,F401
+from src.config.db import engine  # noqa: E402
+from src.models.candidate_profile_model import CandidateProfile  # noqa: E402
+from src.models.external_application_model import (  # noqa: E402
+    ExternalApplication,
+    ExternalApplicationSource,
+    ExternalApplicationStatus,
+)
+from src.models.job_application_model import ApplicationStatus, JobApplication  # noqa: E402
+from src.models.job_model import EmploymentType, Job, JobStatus  # noqa: E402
+from src.models.recruiter_model import RecruiterProfile  # noqa: E402
+from src.models.resume_model import Resume  # noqa: E402
+from src.models.user_model import User, UserRole  # noqa: E402
+from src.services.recruiter_dashboard_service import get_recruiter_dashboard_data  # noqa: E402
+from src.services.recruiter_stats_service import rebuild_recruiter_stats  # noqa: E402
+
+_CHUNK = 5000
+
+
+async def _insert(conn, model, rows: list[dict]) -> None:
+    for i in range(0, len(rows), _CHUNK):
+        await conn.execute(insert(model.__table__), rows[i:i + _CHUNK])
+
+
+async def seed(conn, n_jobs: int, n_apps: int, platform_share: float, seed_value: int = 7) -> RecruiterProfile:
+    rng = random.Random(seed_value)
+    run = uuid.uuid4().hex[:8]
+    now = datetime.now(timezone.utc)
+
+    def when():
+        return now - timedelta(days=rng.uniform(0, 365))
+
+    recruiter_user = {"id": uuid.uuid4(), "email": f"bench-{run}-recruiter@example.com",
+                      "role": UserRole.RECRUITER, "is_verified": True}
+    recruiter = {"id": uuid.uuid4(), "user_id": recruiter_user["id"], "full_name": "Bench Recruiter"}
+    await _insert(conn, User, [recruiter_user])
+    await _insert(conn, RecruiterProfile, [recruiter])
+
+    jobs = [{
+        "id": uuid.uuid4(), "recruiter_id": recruiter["id"], "title": f"Job {i}",
+        "description": "Benchmark job", "employment_type": EmploymentType.FULL_TIME,
+        "status": rng.choice(list(JobStatus)),
+    } for i in range(n_jobs)]
+    await _insert(conn, Job, jobs)
+
+    n_platform = int(n_apps * platform_share)
+    n_candidates = -(-n_platform // n_jobs)      # each candidate applies to every job at most once
+    users, candidates, resumes = [], [], []
+    for i in range(n_candidates):
+        users.append({"id": uuid.uuid4(), "email": f"bench-{run}-{i}@example.com",
+                      "role": UserRole.JOB_SEEKER, "is_verified": True})
+        candidates.append({"id": uuid.uuid4(), "user_id": users[-1]["id"], "full_name": f"Candidate {i}"})
+        resumes.append({"id": uuid.uuid4(), "candidate_id": candidates[-1]["id"],
+                        "title": "Resume", "resume_data": {}})
+    await _insert(conn, User, users)
+    await _insert(conn, CandidateProfile, candidates)
+    await _insert(conn, Resume, resumes)
+
+    await _insert(conn, JobApplication, [{
+        "id": uuid.uuid4(),
+        "job_id": jobs[k % n_jobs]["id"],
+        "candidate_id": candidates[k // n_jobs]["id"],
+        "resume_id": resumes[k // n_jobs]["id"],
+        "status": rng.choice(list(ApplicationStatus)),
+        "applied_at": when(),
+    } for k in range(n_platform)])
+    await _insert(conn, ExternalApplication, [{
+        "id": uuid.uuid4(),
+        "job_id": rng.choice(jobs)["id"],
+        "candidate_name": f"External {k}",
+        "source": rng.choice(list(ExternalApplicationSource)),
+        "status": rng.choice(list(ExternalApplicationStatus)),
+        "resume_file_url": "https://example.com/resume.pdf",
+        "resume_filename": "resume.pdf",
+        "uploaded_at": when(),
+    } for k in range(n_apps - n_platform)])
+
+    return RecruiterProfile(id=recruiter["id"], user_id=recruiter_user["id"])
+
+
+async def baseline_dashboard(db: AsyncSession, recruiter_id) -> dict:
+    """The statements the dashboard issued before the aggregate rewrite, in order."""
+    job_ids = select(Job.id).where(Job.recruiter_id == recruiter_id)
+    six_months_ago = datetime.now(timezone.utc) - timedelta(days=183)
+
+    async def scalar(stmt):
+        return (await db.execute(stmt)).scalar() or 0
+
+    async def rows(stmt):
+        return (await db.execute(stmt)).all()
+
+    out = {"total_jobs": await scalar(select(func.count(Job.id)).where(Job.recruiter_id == recruiter_id))}
+    tables = (
+        (JobApplication, ApplicationStatus.ACCEPTED, ApplicationStatus.PENDING),
+        (ExternalApplication, ExternalApplicationStatus.ACCEPTED, ExternalApplicationStatus.PENDING),
+    )
+    for metric in ("total", "accepted", "pending"):
+        for model, accepted, pending in tables:
+            where = [model.job_id.in_(job_ids)]
+            if metric != "total":
+                where.append(model.status == (accepted if metric == "accepted" else pending))
+            out[f"{model.__tablename__}_{metric}"] = await scalar(select(func.count(model.id)).where(*where))
+
+    status_counts: dict[str, int] = {}
+    for model in (JobApplication, ExternalApplication):
+        for status, count in await rows(
+            select(model.status, func.count(model.id)).where(model.job_id.in_(job_ids)).group_by(model.status)
+        ):
+            status_counts[status.value] = status_counts.get(status.value, 0) + count
+    out["status"] = status_counts
+
+    job_counts: dict = {}
+    for model in (JobApplication, ExternalApplication):
+        for job_id, count in await rows(
+            select(model.job_id, func.count(model.id)).where(model.job_id.in_(job_ids)).group_by(model.job_id)
+        ):
+            job_counts[job_id] = job_counts.get(job_id, 0) + count
+    top5 = sorted(job_counts, key=job_counts.get, reverse=True)[:5]
+    if top5:
+        await rows(select(Job.id, Job.title).where(Job.id.in_(top5)))
+        await rows(select(JobApplication.job_id, func.count(JobApplication.id))
+                   .where(JobApplication.job_id.in_(top5), JobApplication.status == ApplicationStatus.ACCEPTED)
+                   .group_by(JobApplication.job_id))
+        await rows(select(ExternalApplication.job_id, func.count(ExternalApplication.id))
+                   .where(ExternalApplication.job_id.in_(top5),
+                          ExternalApplication.status == ExternalApplicationStatus.ACCEPTED)
+                   .group_by(ExternalApplication.job_id))
+
+    for model, column in ((JobApplication, JobApplication.applied_at),
+                          (ExternalApplication, ExternalApplication.uploaded_at)):
+        month = func.date_trunc(literal_column("'month'"), column)
+        await rows(select(month, func.count(model.id))
+                   .where(model.job_id.in_(job_ids), column >= six_months_ago).group_by(month))
+
+    await rows(select(Job.status, func.count(Job.id)).where(Job.recruiter_id == recruiter_id).group_by(Job.status))
+    await scalar(select(func.count(JobApplication.id)).where(JobApplication.job_id.in_(job_ids)))
+    source_rows = await rows(select(ExternalApplication.source, func.count(ExternalApplication.id))
+                             .where(ExternalApplication.job_id.in_(job_ids)).group_by(ExternalApplication.source))
+    out["sources"] = {source.value: count for source, count in source_rows}
+    return out
+
+
+async def run(args) -> None:
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            t0 = time.perf_counter()
+            profile = await seed(conn, args.jobs, args.applications, args.platform_share)
+            print(f"seeded {args.jobs} jobs / {args.applications} applications in {time.perf_counter() - t0:.1f}s")
+            for table in ("jobs", "job_applications", "external_applications"):
+                await conn.exec_driver_sql(f"ANALYZE {table}")
+
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+            rebuilt = await rebuild_recruiter_stats(db, profile.id)
+            print(f"recruiter_stats rebuilt: {rebuilt['rows']} rows in {rebuilt['rebuild_ms']}ms")
+            user = SimpleNamespace(id=profile.user_id, role=UserRole.RECRUITER, recruiter_profile=profile)
+            modes = {
+                "baseline": lambda: baseline_dashboard(db, profile.id),
+                "rollup": lambda: get_recruiter_dashboard_data(db, user),
+            }
+
+            event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+            print(f"{'mode':<12} {'queries':>7} {'median':>9} {'p95':>9}")
+            results = {}
+            for label, fn in modes.items():
+                timings = []
+                for _ in range(args.runs):
+                    statements = 0
+                    t0 = time.perf_counter()
+                    results[label] = await fn()
+                    timings.append((time.perf_counter() - t0) * 1000)
+                timings.sort()
+                p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+                print(f"{label:<12} {statements:>7} {statistics.median(timings):>7.1f}ms {p95:>7.1f}ms")
+            event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+            if args.check:
+                base, new = results["baseline"], results["rollup"]
+                total = base["job_applications_total"] + base["external_applications_total"]
+                assert new.summary.total_jobs == base["total_jobs"]
+                assert new.summary.total_applications == total
+                assert {i.status: i.count for i in new.application_status_breakdown} == {
+                    s.value: base["status"].get(s.value, 0) for s in ApplicationStatus}
+                sources = {i.source: i.count for i in new.application_source_breakdown}
+                assert sources.pop("PLATFORM") == base["job_applications_total"]
+                assert sources == {s.value: base["sources"].get(s.value, 0) for s in ExternalApplicationSource}
+                print("check: rollup matches baseline")
+            await db.close()
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--applications", type=int, default=50000)
+    parser.add_argument("--platform-share", type=float, default=0.4)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--check", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: Stage 3 skill matching, per-resume loop vs batch matrix mode
+Run from the repository root:
+
+    python benchmarks/bench_stage3_matrix.py [--resumes 100 1000 10000] [--check]
+
+Skill names are drawn from a synthetic vocabulary with typo / casing variants
+(so all three match types fire) and embeddings are random unit vectors passed
+through the embedding caches, exactly as stored feature sets provide them —
+no BGE model is loaded. ``--check`` asserts both modes return identical
+results (needs faiss for the per-resume semantic step).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.ai_pipeline_service import match_skills_batch, match_skills_semantic  # noqa: E402
+
+_BASE_SKILLS = [
+    "Python", "Java", "Go", "Rust", "TypeScript", "JavaScript", "Kotlin", "Scala", "C++", "C#",
+    "Django", "Flask", "FastAPI", "Spring Boot", "React", "Angular", "Vue.js", "Next.js", "Node.js",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Kafka", "RabbitMQ", "Elasticsearch", "Cassandra",
+    "Docker", "Kubernetes", "Terraform", "Ansible", "AWS", "GCP", "Azure", "CI/CD", "GitHub Actions",
+    "Jenkins", "GraphQL", "REST API", "gRPC", "Pandas", "NumPy", "PyTorch", "TensorFlow", "Spark",
+    "Airflow", "dbt", "Snowflake", "Tableau", "Power BI", "Linux", "Bash", "Git", "Jira",
+]
+
+
+def _variants(name: str, rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.15 and len(name) > 4:
+        i = rng.randrange(1, len(name) - 1)
+        return name[:i] + name[i + 1:]              # typo → fuzzy match
+    if roll < 0.25:
+        return name + " Framework"                   # extra token → semantic / no match
+    return name
+
+
+def make_case(n_resumes: int, dim: int, seed: int = 7):
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    vocab = _BASE_SKILLS + [f"{s} {suffix}" for s in _BASE_SKILLS for suffix in ("Advanced", "Internals")]
+
+    def unit(v):
+        return (v / np.linalg.norm(v)).astype("float32")
+
+    base_vectors = {name: unit(np_rng.standard_normal(dim)) for name in vocab}
+    vectors: dict[str, np.ndarray] = {}
+
+    def vector_for(name: str):
+        # One vector per name, like the BGE model; variants sit close to their base skill
+        if name not in vectors:
+            vectors[name] = base_vectors.get(name, unit(np_rng.standard_normal(dim)))
+            for base in _BASE_SKILLS:
+                if name != base and name.startswith(base):
+                    noise = np_rng.standard_normal(dim).astype("float32") * (0.6 / np.sqrt(dim))
+                    vectors[name] = unit(base_vectors[base] + noise)
+                    break
+        return vectors[name]
+
+    jd_skills = [(name, "technical") for name in rng.sample(_BASE_SKILLS, 25)]
+    jd_cache = {name: base_vectors[name] for name, _ in jd_skills}
+
+    resumes, caches = [], []
+    for _ in range(n_resumes):
+        names = list(dict.fromkeys(_variants(n, rng) for n in rng.sample(vocab, rng.randint(8, 30))))
+        resumes.append([(n, "technical") for n in names])
+        caches.append({n: vector_for(n) for n in names})
+    return resumes, caches, jd_skills, jd_cache
+
+
+def _as_comparable(result):
+    matched, missing, extra = result
+    return (
+        [(m.name, m.match_type, round(m.confidence, 4)) for m in matched],
+        [m.name for m in missing],
+        [e.name for e in extra],
+    )
+
+
+def run(args) -> None:
+    print(f"{'resumes':>8}  {'loop':>9}  {'matrix':>9}  {'speedup':>7}")
+    for n in args.resumes:
+        resumes, caches, jd_skills, jd_cache = make_case(n, args.dim)
+
+        t0 = time.perf_counter()
+        loop = [
+            match_skills_semantic(r, jd_skills, embedding_cache={**jd_cache, **c})
+            for r, c in zip(resumes, caches)
+        ]
+        loop_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        batch = match_skills_batch(resumes, jd_skills, embedding_caches=caches, jd_embedding_cache=jd_cache)
+        batch_s = time.perf_counter() - t0
+
+        print(f"{n:>8}  {loop_s:>8.2f}s  {batch_s:>8.2f}s  {loop_s / batch_s:>6.1f}x")
+        if args.check:
+            mismatches = sum(_as_comparable(a) != _as_comparable(b) for a, b in zip(loop, batch))
+            assert mismatches == 0, f"{mismatches} resumes differ between loop and matrix mode"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--check", action="store_true")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: bulk resume uploads, serial vs bounded-parallel
+Run from the repository root:
+
+    python benchmarks/bench_storage_uploads.py [--files 50] [--latency-ms 120] [--concurrency 8]
+
+Uses the local-disk storage backend wrapped with an artificial per-request
+latency to stand in for the round trip to the object store.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.storage_service import (  # noqa: E402
+    LocalStorageBackend,
+    UploadPayload,
+    set_storage,
+    store_many,
+    store_payload,
+)
+
+
+class _LatencyBackend(LocalStorageBackend):
+    def __init__(self, root: str, latency_s: float):
+        super().__init__(root, "http://localhost:8000/storage")
+        self.latency_s = latency_s
+
+    async def put(self, key, content, content_type=None):
+        await asyncio.sleep(self.latency_s)
+        return await super().put(key, content, content_type)
+
+
+def make_payloads(n: int, size: int) -> list[UploadPayload]:
+    payloads = []
+    for i in range(n):
+        content = os.urandom(size)
+        payloads.append(UploadPayload(
+            filename=f"resume_{i}.pdf",
+            content=content,
+            sha256=hashlib.sha256(content).hexdigest(),
+        ))
+    return payloads
+
+
+async def run(args) -> None:
+    for label in ("serial", "parallel"):
+        with tempfile.TemporaryDirectory() as root:
+            set_storage(_LatencyBackend(root, args.latency_ms / 1000))
+            payloads = make_payloads(args.files, args.size_kb * 1024)
+            t0 = time.perf_counter()
+            if label == "serial":
+                for p in payloads:
+                    await store_payload(p, prefix="external")
+            else:
+                await store_many(payloads, prefix="external", concurrency=args.concurrency)
+            elapsed = time.perf_counter() - t0
+            print(f"{label:<10} {args.files} files  {elapsed:6.2f}s  {args.files / elapsed:6.1f} files/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--size-kb", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=120)
+    parser.add_argument("--concurrency", type=int, default=8)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: document text extraction
+Run from the repository root:
+
+    python benchmarks/bench_text_extraction.py [CORPUS_DIR] [--rounds 5] [--concurrency 8]
+
+Every PDF / DOCX found under CORPUS_DIR (default: src/utils/extract_util) is
+pushed through the extraction worker pool ``rounds`` times with at most
+``concurrency`` documents in flight. Reports throughput and p50/p95/p99
+latency per document, plus timeouts and failures.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.text_extraction_service import (  # noqa: E402
+    TextExtractionError,
+    TextExtractionTimeout,
+    extract_text,
+    is_supported,
+    shutdown_extraction_pool,
+)
+
+
+def load_corpus(corpus_dir: str) -> list[tuple[str, bytes]]:
+    docs = []
+    for root, _, files in os.walk(corpus_dir):
+        for name in sorted(files):
+            if is_supported(name):
+                with open(os.path.join(root, name), "rb") as f:
+                    docs.append((name, f.read()))
+    return docs
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def run(docs: list[tuple[str, bytes]], rounds: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    chars = 0
+    timeouts = 0
+    failures = 0
+
+    async def one(name: str, data: bytes) -> None:
+        nonlocal chars, timeouts, failures
+        async with semaphore:
+            t0 = time.perf_counter()
+            try:
+                text = await extract_text(data, name)
+                chars += len(text)
+            except TextExtractionTimeout:
+                timeouts += 1
+            except TextExtractionError:
+                failures += 1
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    # Warm the pool so worker start-up is not counted
+    await extract_text(docs[0][1], docs[0][0])
+
+    jobs = [one(name, data) for _ in range(rounds) for name, data in docs]
+    t0 = time.perf_counter()
+    await asyncio.gather(*jobs)
+    elapsed = time.perf_counter() - t0
+
+    print(f"\n{'='*50}")
+    print(f"Documents     : {len(jobs)} ({len(docs)} files x {rounds} rounds)")
+    print(f"Concurrency   : {concurrency}")
+    print(f"Elapsed       : {elapsed:.2f}s")
+    print(f"Throughput    : {len(jobs) / elapsed:.1f} docs/s")
+    print(f"Chars         : {chars}")
+    print(f"Latency p50   : {percentile(latencies, 50):.1f} ms")
+    print(f"Latency p95   : {percentile(latencies, 95):.1f} ms")
+    print(f"Latency p99   : {percentile(latencies, 99):.1f} ms")
+    print(f"Timeouts      : {timeouts}")
+    print(f"Failures      : {failures}")
+    print(f"{'='*50}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("corpus", nargs="?", default="src/utils/extract_util")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    docs = load_corpus(args.corpus)
+    if not docs:
+        print(f"No PDF/DOCX files found in {args.corpus}")
+        sys.exit(1)
+
+    try:
+        asyncio.run(run(docs, args.rounds, args.concurrency))
+    finally:
+        shutdown_extraction_pool()
+
+
+if __name__ == "__main__":
+    main()
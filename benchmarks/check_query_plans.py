@@ -0,0 +1,242 @@
+"""
+Query-plan regression check for the hot service queries
+Run from the repository root against a scratch, fully migrated database (DB_URL):
+
+    python benchmarks/check_query_plans.py [--scale 1.0] [--max-seq-rows 10000]
+
+Seeds recruiters, jobs, candidates, applications and notifications inside a
+transaction that is rolled back at the end, then ANALYZEs. Each case calls
+the real service function while a cursor-execute listener records the SQL it
+sends. Every recorded SELECT is then EXPLAINed with the same parameters.
+A case fails when any of its plans sequentially scans a table whose
+row estimate (pg_class.reltuples) is above ``--max-seq-rows``. The exit
+status is 1 if anything failed, so it can gate CI.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event, insert, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+import src.models  # noqa: E402,F401
+from src.config.db import engine  # noqa: E402
+from src.models.candidate_profile_model import CandidateProfile  # noqa: E402
+from src.models.external_application_model import (  # noqa: E402
+    ExternalApplication,
+    ExternalApplicationSource,
+    ExternalApplicationStatus,
+)
+from src.models.job_application_model import ApplicationStatus, JobApplication  # noqa: E402
+from src.models.job_model import EmploymentType, Job, JobStatus  # noqa: E402
+from src.models.notification_model import Notification, NotificationType  # noqa: E402
+from src.models.recruiter_model import RecruiterProfile  # noqa: E402
+from src.models.resume_model import Resume  # noqa: E402
+from src.models.user_model import User, UserRole  # noqa: E402
+from src.schema.jobs_schema import JobFilterSchema  # noqa: E402
+from src.services.application_service import (  # noqa: E402
+    get_applications_for_job_service,
+    get_my_applications_service,
+)
+from src.services.candidate_dashboard_service import get_candidate_dashboard_service  # noqa: E402
+from src.services.external_application_service import get_external_applications_service  # noqa: E402
+from src.services.job_services import get_jobs_by_recruiter_service, list_jobs_service  # noqa: E402
+from src.services.notification_service import get_notifications_service, get_unread_count_service  # noqa: E402
+from src.services.recruiter_dashboard_service import get_recruiter_dashboard_data  # noqa: E402
+from src.services.recruiter_stats_service import rebuild_recruiter_stats  # noqa: E402
+
+_CHUNK = 5000
+_TABLES = ("users", "recruiter_profiles", "candidate_profiles", "resumes", "jobs", "job_applications",
+           "external_applications", "recruiter_stats", "notifications")
+
+
+# ─── Seeding ──────────────────────────────────────────────────────────────────
+
+async def _insert(conn, model, rows: list[dict]) -> None:
+    for i in range(0, len(rows), _CHUNK):
+        await conn.execute(insert(model.__table__), rows[i:i + _CHUNK])
+
+
+async def seed(conn, scale: float, seed_value: int = 7) -> SimpleNamespace:
+    rng = random.Random(seed_value)
+    run = uuid.uuid4().hex[:8]
+    now = datetime.now(timezone.utc)
+    n_recruiters, n_jobs, n_candidates = int(200 * scale), int(20000 * scale), int(5000 * scale)
+    apps_per_candidate, n_external = 20, int(40000 * scale)
+
+    def when():
+        return now - timedelta(days=rng.uniform(0, 365))
+
+    users, recruiters, candidates, resumes = [], [], [], []
+    for i in range(n_recruiters):
+        users.append({"id": uuid.uuid4(), "email": f"plans-{run}-r{i}@example.com",
+                      "role": UserRole.RECRUITER, "is_verified": True})
+        recruiters.append({"id": uuid.uuid4(), "user_id": users[-1]["id"], "full_name": f"Recruiter {i}"})
+    for i in range(n_candidates):
+        users.append({"id": uuid.uuid4(), "email": f"plans-{run}-c{i}@example.com",
+                      "role": UserRole.JOB_SEEKER, "is_verified": True})
+        candidates.append({"id": uuid.uuid4(), "user_id": users[-1]["id"], "full_name": f"Candidate {i}"})
+        resumes.append({"id": uuid.uuid4(), "candidate_id": candidates[-1]["id"],
+                        "title": "Resume", "resume_data": {}})
+    await _insert(conn, User, users)
+    await _insert(conn, RecruiterProfile, recruiters)
+    await _insert(conn, CandidateProfile, candidates)
+    await _insert(conn, Resume, resumes)
+
+    jobs = [{
+        "id": uuid.uuid4(), "recruiter_id": recruiters[i % n_recruiters]["id"], "title": f"Engineer {i}",
+        "description": f"Plan check job needing skill{rng.randrange(50)}",
+        "location": rng.choice(["Berlin", "London", "Remote"]),
+        "employment_type": rng.choice(list(EmploymentType)), "status": rng.choice(list(JobStatus)),
+        "created_at": when(),
+    } for i in range(n_jobs)]
+    await _insert(conn, Job, jobs)
+
+    apps = []
+    for k, candidate in enumerate(candidates):
+        for job in rng.sample(jobs, apps_per_candidate):
+            apps.append({"id": uuid.uuid4(), "job_id": job["id"], "candidate_id": candidate["id"],
+                         "resume_id": resumes[k]["id"], "status": rng.choice(list(ApplicationStatus)),
+                         "ai_score": rng.choice([None, rng.randint(0, 100)]), "applied_at": when()})
+    await _insert(conn, JobApplication, apps)
+    await _insert(conn, ExternalApplication, [{
+        "id": uuid.uuid4(), "job_id": rng.choice(jobs)["id"], "candidate_name": f"External {k}",
+        "source": rng.choice(list(ExternalApplicationSource)),
+        "status": rng.choice(list(ExternalApplicationStatus)),
+        "resume_file_url": "https://example.com/resume.pdf", "resume_filename": "resume.pdf",
+        "uploaded_at": when(),
+    } for k in range(n_external)])
+    await _insert(conn, Notification, [{
+        "id": uuid.uuid4(), "user_id": rng.choice(users)["id"], "type": NotificationType.SHORTLIST_RESULT,
+        "title": "Shortlisted", "message": "Plan check notification", "is_read": rng.random() < 0.7,
+        "created_at": when(),
+    } for _ in range(len(apps))])
+
+    # Fixtures for the cases: a job and its recruiter, a candidate with history
+    recruiter_job = jobs[0]
+    return SimpleNamespace(
+        recruiter_id=recruiter_job["recruiter_id"],
+        recruiter_user_id=next(r["user_id"] for r in recruiters if r["id"] == recruiter_job["recruiter_id"]),
+        job_id=recruiter_job["id"],
+        candidate_id=candidates[0]["id"],
+        candidate_user_id=candidates[0]["user_id"],
+    )
+
+
+# ─── Plans ────────────────────────────────────────────────────────────────────
+
+def seq_scans(plan: dict) -> list[str]:
+    found = [plan["Relation Name"]] if plan["Node Type"] == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        found += seq_scans(child)
+    return found
+
+
+def scan_summary(plan: dict) -> list[str]:
+    nodes = []
+    if "Scan" in plan["Node Type"]:
+        nodes.append(f"{plan['Node Type']}({plan.get('Index Name') or plan.get('Relation Name', '')})")
+    for child in plan.get("Plans", []):
+        nodes += scan_summary(child)
+    return nodes
+
+
+def cases(db: AsyncSession, f: SimpleNamespace) -> dict:
+    recruiter = SimpleNamespace(id=f.recruiter_user_id, role=UserRole.RECRUITER,
+                                recruiter_profile=SimpleNamespace(id=f.recruiter_id))
+
+    async def candidate_user():
+        profile = await db.get(CandidateProfile, f.candidate_id)
+        return SimpleNamespace(id=f.candidate_user_id, role=UserRole.JOB_SEEKER, candidate_profile=profile)
+
+    async def candidate_dashboard():
+        return await get_candidate_dashboard_service(db, await candidate_user())
+
+    async def my_applications():
+        return await get_my_applications_service(db, await candidate_user())
+
+    return {
+        "jobs: board (newest)": lambda: list_jobs_service(db, recruiter, JobFilterSchema()),
+        "jobs: board search": lambda: list_jobs_service(db, recruiter, JobFilterSchema(q="skill7")),
+        "jobs: recruiter's jobs": lambda: get_jobs_by_recruiter_service(db, recruiter),
+        "applications: job listing": lambda: get_applications_for_job_service(db, f.job_id, recruiter),
+        "applications: job listing by status": lambda: get_applications_for_job_service(
+            db, f.job_id, recruiter, status=ApplicationStatus.PENDING),
+        "applications: candidate's own": my_applications,
+        "external: job listing": lambda: get_external_applications_service(db, f.job_id, recruiter),
+        "dashboard: recruiter": lambda: get_recruiter_dashboard_data(db, recruiter),
+        "dashboard: candidate": candidate_dashboard,
+        "notifications: list": lambda: get_notifications_service(db, recruiter),
+        "notifications: unread count": lambda: get_unread_count_service(db, recruiter),
+    }
+
+
+async def run(args) -> int:
+    failures = 0
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            fixtures = await seed(conn, args.scale)
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+            await rebuild_recruiter_stats(db)
+            for table in _TABLES:
+                await conn.exec_driver_sql(f"ANALYZE {table}")
+            reltuples = dict((await conn.execute(
+                text("SELECT relname, reltuples FROM pg_class WHERE relname = ANY(:names)"),
+                {"names": list(_TABLES)},
+            )).all())
+
+            recorded: list[tuple[str, object]] = []
+
+            def record(conn_, cursor, statement, parameters, context, executemany):
+                if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                    recorded.append((statement, parameters))
+
+            for label, fn in cases(db, fixtures).items():
+                recorded.clear()
+                event.listen(engine.sync_engine, "before_cursor_execute", record)
+                try:
+                    await fn()
+                except Exception as e:
+                    print(f"ERROR {label}: {e}")
+                    failures += 1
+                    continue
+                finally:
+                    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+                for statement, parameters in list(recorded):
+                    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)).scalar_one()
+                    plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+                    bad = [t for t in seq_scans(plan) if reltuples.get(t, 0) > args.max_seq_rows]
+                    failures += bool(bad)
+                    status = f"FAIL seq scan on {', '.join(bad)}" if bad else "ok"
+                    print(f"{status:<40} {label:<38} {', '.join(scan_summary(plan)) or '-'}")
+                    if bad and args.verbose:
+                        print(f"    {statement}")
+            await db.close()
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+    print(f"{failures} plan regression(s)" if failures else "all plans use indexes")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--max-seq-rows", type=int, default=10000)
+    parser.add_argument("--verbose", action="store_true")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
+import asyncio
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from sqlalchemy import text
 
 from src.routes.candidate_dashboard_routes import candidate_dashbaord_router
 from src.routes.recruiter_dashboard_routes import recruiter_dashboard_router
@@ -15,22 +18,49 @@ from src.routes.jobs_routes import job_router
 from src.routes.resume_routes import resume_builder_router
 from src.routes.user_routes import user_router
 from src.routes.upload_routes import upload_router
+from src.routes.metrics_routes import metrics_router
+from src.routes.model_registry_routes import model_registry_router
+from src.services.dashboard_cache_service import get_dashboard_cache
+from src.services.email_outbox_service import run_email_outbox_sender
+from src.services.external_application_service import run_deferred_scoring
+from src.services.identity_cache_service import get_identity_cache
+from src.services.model_registry_service import run_idle_unloader, run_registry_watcher
+from src.services.recruiter_stats_service import run_recruiter_stats_reconciler
+from src.services.storage_service import local_storage_dir
+from src.services.text_extraction_service import shutdown_extraction_pool
 from src.utils.exceptions import AppException
+from src.utils.pagination import NEXT_CURSOR_HEADER, TOTAL_ESTIMATE_HEADER
 from src.utils.error_handler import app_exception_handler
 from src.utils.error_handler import validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
+from fastapi.staticfiles import StaticFiles
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create all DB tables
+    # Fail fast on a misconfigured cache backend (e.g. redis selected but not installed)
+    get_dashboard_cache()
+    get_identity_cache()
+
+    # Create all DB tables (the jobs trigram indexes need pg_trgm)
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
+    background = [
+        asyncio.create_task(run_idle_unloader()),
+        asyncio.create_task(run_registry_watcher()),
+        asyncio.create_task(run_recruiter_stats_reconciler()),
+        asyncio.create_task(run_email_outbox_sender()),
+        asyncio.create_task(run_deferred_scoring()),
+    ]
     yield
+    for task in background:
+        task.cancel()
+    shutdown_extraction_pool()
     await engine.dispose()
 
 
@@ -47,6 +77,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_ESTIMATE_HEADER],
 )
 
 # handles custom error
@@ -70,3 +101,10 @@ app.include_router(application_router, prefix="/api/applications")
 app.include_router(ollama_router, prefix="/api/ollama")
 app.include_router(skill_gap_router, prefix="/api/skill-gap")
 app.include_router(notification_router, prefix="/api/notifications")
+app.include_router(metrics_router, prefix="/api/metrics")
+app.include_router(model_registry_router, prefix="/api/models")
+
+# Local-disk storage backend (STORAGE_BACKEND=local) serves its files directly
+if local_storage_dir():
+    os.makedirs(local_storage_dir(), exist_ok=True)
+    app.mount("/storage", StaticFiles(directory=local_storage_dir()), name="storage")
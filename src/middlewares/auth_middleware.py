@@ -1,12 +1,16 @@
-from uuid import UUID
-
 from fastapi import Depends, Request, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.db import get_db
 from src.models.user_model import UserRole, User
-from src.services.user_services import get_user_by_id_service
+from src.services.identity_cache_service import (
+    Identity,
+    assert_token_current,
+    claims_user_id,
+    get_identity_from_claims,
+    load_current_user,
+)
 from src.utils.error_code import ErrorCode
 from src.utils.jwt_utils import decode_jwt_token
 from src.utils.exceptions import AppException
@@ -41,12 +45,7 @@ def require_role(required_role: UserRole):
     return role_checker
 
 
-# authenticate
-async def get_current_user(
-        req: Request,
-        credentials: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
-        db: AsyncSession = Depends(get_db)
-) -> User:
+def _claims_from_request(req: Request, credentials: HTTPAuthorizationCredentials | None) -> dict:
     token = _extract_token_from_request(req, credentials)
 
     if not token:
@@ -57,16 +56,25 @@ async def get_current_user(
 
     payload = decode_jwt_token(token)
 
-    user_id: str | None = payload.get("sub")
-
-    if not user_id:
+    if not payload.get("sub"):
         raise AppException(
             code="INVALID_TOKEN",
             status_code=401,
             message="Invalid token payload",
         )
 
-    user = await get_user_by_id_service(db, UUID(user_id))
+    return payload
+
+
+# authenticate
+async def get_current_user(
+        req: Request,
+        credentials: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
+        db: AsyncSession = Depends(get_db)
+) -> User:
+    payload = _claims_from_request(req, credentials)
+
+    user = await load_current_user(db, claims_user_id(payload))
 
     if not user:
         raise AppException(
@@ -75,4 +83,14 @@ async def get_current_user(
             message="User not found",
         )
 
+    assert_token_current(payload, user.token_version)
     return user
+
+
+# authenticate from the token claims alone (role and profile ids, no user load)
+async def get_identity(
+        req: Request,
+        credentials: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
+        db: AsyncSession = Depends(get_db)
+) -> Identity:
+    return await get_identity_from_claims(db, _claims_from_request(req, credentials))
@@ -19,3 +19,11 @@ from src.models.learning_roadmap_model import LearningRoadmap
 
 from src.models.notification_model import Notification
 
+
+from src.models.resume_features_model import ResumeFeatures
+
+from src.models.job_features_model import JobFeatures
+
+from src.models.recruiter_stats_model import RecruiterStats
+
+from src.models.email_outbox_model import EmailOutbox
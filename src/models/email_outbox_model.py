@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.config.base import Base
+
+
+class EmailOutboxStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    FAILED = "FAILED"     # gave up after EMAIL_OUTBOX_MAX_ATTEMPTS
+
+
+class EmailOutbox(Base):
+    """
+    Emails waiting for delivery. Rows are inserted in the same transaction as
+    the change that triggers them and sent by ``email_outbox_service``'s
+    background sender; a row is deleted once the message is accepted by SMTP.
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    to_address: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    html: Mapped[str] = mapped_column(Text, nullable=False)
+
+    status: Mapped[str] = mapped_column(    # EmailOutboxStatus value
+        String(16),
+        nullable=False,
+        default=EmailOutboxStatus.PENDING.value,
+        server_default=EmailOutboxStatus.PENDING.value,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
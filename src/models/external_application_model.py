@@ -5,8 +5,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Enum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, Enum, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -33,6 +33,19 @@ class ExternalApplicationStatus(enum.Enum):
 
 class ExternalApplication(Base):
     __tablename__ = "external_applications"
+    __table_args__ = (
+        Index("ix_external_applications_job_id_resume_sha256", "job_id", "resume_sha256"),
+        Index("ix_external_applications_matched_skill_ids", "matched_skill_ids", postgresql_using="gin"),
+        Index("ix_external_applications_missing_skill_ids", "missing_skill_ids", postgresql_using="gin"),
+        Index("ix_external_applications_job_id_status", "job_id", "status"),
+        Index("ix_external_applications_job_id_uploaded_at", "job_id", "uploaded_at"),
+        # Unscored originals, for the deferred-scoring poller
+        Index(
+            "ix_external_applications_unscored",
+            "uploaded_at",
+            postgresql_where=text("ai_scored_at IS NULL AND duplicate_of_id IS NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -59,6 +72,23 @@ class ExternalApplication(Base):
 
     resume_filename: Mapped[str] = mapped_column(String(512), nullable=False)
 
+    # sha256 of the uploaded file — same hash for the same job means the same resume
+    resume_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # MinHash signature of the extracted text, used for near-duplicate detection
+    resume_minhash: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+
+    # Set when this resume is a near-duplicate of an earlier application for the same job
+    duplicate_of_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("external_applications.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    duplicate_similarity: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    # float32 BGE profile vector (candidate search); set when the resume is scored
+    resume_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
     status: Mapped[ExternalApplicationStatus] = mapped_column(
         Enum(ExternalApplicationStatus),
         default=ExternalApplicationStatus.PENDING,
@@ -72,6 +102,13 @@ class ExternalApplication(Base):
     ai_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
     ai_analysis: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     ai_scored_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Set when a process queued this row for auto-scoring; NULL (or a stale
+    # claim) lets the deferred-scoring poller pick it up
+    scoring_queued_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Canonical skill ids from ai_analysis, kept in sync by set_analysis() (GIN-indexed)
+    matched_skill_ids: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, default=list, server_default="{}")
+    missing_skill_ids: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, default=list, server_default="{}")
 
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
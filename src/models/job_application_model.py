@@ -8,12 +8,13 @@ from typing import TYPE_CHECKING
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Text,
     Enum,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -37,6 +38,11 @@ class JobApplication(Base):
 
     __table_args__ = (
         UniqueConstraint("job_id", "candidate_id", name="uq_job_candidate"),
+        Index("ix_job_applications_matched_skill_ids", "matched_skill_ids", postgresql_using="gin"),
+        Index("ix_job_applications_missing_skill_ids", "missing_skill_ids", postgresql_using="gin"),
+        Index("ix_job_applications_job_id_status", "job_id", "status"),
+        Index("ix_job_applications_job_id_applied_at", "job_id", "applied_at", "id"),
+        Index("ix_job_applications_candidate_id_applied_at", "candidate_id", "applied_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -72,6 +78,10 @@ class JobApplication(Base):
     ai_analysis: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     ai_scored_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    # Canonical skill ids from ai_analysis, kept in sync by set_analysis() (GIN-indexed)
+    matched_skill_ids: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, default=list, server_default="{}")
+    missing_skill_ids: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, default=list, server_default="{}")
+
     recruiter_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     applied_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, LargeBinary, String, Text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.config.base import Base
+
+
+class JobFeatures(Base):
+    """
+    JD-only AI pipeline output (segments, normalized skills, alternative groups,
+    embeddings), built when a job is created or its description changes.
+    Stale once the pipeline/ontology version or ``description_hash`` differ.
+    """
+    __tablename__ = "job_features"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    pipeline_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    ontology_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    description_hash: Mapped[str] = mapped_column(String(64), nullable=False)   # sha256 hex
+
+    # ─── Features ───
+    segments: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    full_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    skill_tuples: Mapped[list] = mapped_column(JSONB, nullable=False)     # [[name, category], ...]
+    alternatives: Mapped[list] = mapped_column(JSONB, nullable=False)     # [[skill, ...], ...]
+    soft_skills: Mapped[list] = mapped_column(JSONB, nullable=False)
+
+    # float32 row-major matrix aligned with skill_tuples
+    skill_embeddings: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    embedding_dim: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # float32 BGE vector over the whole posting (job recommendations)
+    profile_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
+    # ─── Metadata ───
+    build_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
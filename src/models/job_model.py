@@ -6,14 +6,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
+    Computed,
     String,
     Text,
     Integer,
     DateTime,
     ForeignKey,
-    Enum
+    Enum,
+    Index,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -39,8 +41,28 @@ class JobStatus(enum.Enum):
     DRAFT = "DRAFT"
 
 
+# Text search configuration of ``jobs.search_vector`` (queries must use the same one)
+JOB_SEARCH_CONFIG = "english"
+
+JOB_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}', coalesce(location, '')), 'C')"
+)
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_recruiter_id_status", "recruiter_id", "status"),
+        # job board keyset order (status filter, newest first, id tie-break)
+        Index("ix_jobs_status_created_at", "status", "created_at", "id"),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        # pg_trgm: fuzzy and substring matching on title / location
+        Index("ix_jobs_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_jobs_location_trgm", "location", postgresql_using="gin",
+              postgresql_ops={"location": "gin_trgm_ops"}),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -95,6 +117,15 @@ class Job(Base):
         default=JobStatus.OPEN
     )
 
+    # ---------------- SEARCH ----------------
+
+    # Maintained by Postgres (generated column); never loaded with the row
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(JOB_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
+
     # ---------------- METADATA ----------------
 
     created_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.base import Base
+
+
+class RecruiterStats(Base):
+    """
+    Application counts per (recruiter, job, status, source, month), kept in
+    step with the application tables by ``recruiter_stats_service`` and
+    rebuilt from them by its reconciliation job. Backs the recruiter dashboard.
+    """
+    __tablename__ = "recruiter_stats"
+
+    recruiter_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("recruiter_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    status: Mapped[str] = mapped_column(String(16), primary_key=True)    # ApplicationStatus value
+    source: Mapped[str] = mapped_column(String(16), primary_key=True)    # PLATFORM | ExternalApplicationSource value
+    month: Mapped[date] = mapped_column(Date, primary_key=True)          # first day of the month (UTC)
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
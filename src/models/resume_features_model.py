@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, String, Text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.config.base import Base
+
+
+class ResumeFeatures(Base):
+    """
+    Resume-only AI pipeline output (segments, normalized skills, embeddings),
+    computed when a resume is saved. Stale once ``pipeline_version`` or the
+    resume's ``updated_at`` no longer match.
+    """
+    __tablename__ = "resume_features"
+
+    resume_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    pipeline_version: Mapped[str] = mapped_column(String(32), nullable=False)
+
+    # ─── Features ───
+    segments: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    skill_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    skill_tuples: Mapped[list] = mapped_column(JSONB, nullable=False)     # [[name, category], ...]
+    soft_skills: Mapped[list] = mapped_column(JSONB, nullable=False)
+    years_experience: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # float32 row-major matrix aligned with skill_tuples
+    skill_embeddings: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    embedding_dim: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # float32 BGE vector over the whole profile (candidate search)
+    profile_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
+    # ─── Metadata ───
+    resume_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import (String, Boolean, DateTime, func, Enum)
+from sqlalchemy import (String, Boolean, DateTime, Integer, func, Enum)
 
 from src.config.base import Base
 
@@ -62,6 +62,14 @@ class User(Base):
         server_default=func.now()
     )
 
+    # Bumped on logout / role change; tokens carrying an older "tv" claim are rejected
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+
     recruiter_profile: Mapped["RecruiterProfile"] = relationship(
         back_populates="user",
         uselist=False,
@@ -1,8 +1,8 @@
 import json
 import uuid
-from typing import List
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends, status, Response, UploadFile, File, Form
+from fastapi import APIRouter, Depends, Query, status, Response, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.db import get_db
@@ -14,6 +14,7 @@ from src.schema.application_schema import (
     ApplicationCreateSchema,
     ApplicationResponse,
     ApplicationDetailResponse,
+    ApplicantSortField,
     ApplicationResumeResponse,
     ApplicationScoresResponse,
     ApplicationStatusUpdateSchema,
@@ -21,6 +22,11 @@ from src.schema.application_schema import (
     BulkStatusUpdateSchema,
     NotifyShortlistedSchema,
     JobWithApplicantsSchema,
+    PipelineProfileName,
+    CandidateSearchRequest,
+    CandidateSearchResponse,
+    SkillFilterRequest,
+    SkillFilterResponse,
 )
 from src.schema.external_application_schema import (
     ExternalApplicationCreateSchema,
@@ -43,6 +49,8 @@ from src.services.application_service import (
     update_application_notes_service,
     notify_shortlisted_candidates_service,
 )
+from src.services.candidate_search_service import search_candidates_service
+from src.services.skill_index_service import filter_applicants_by_skills_service
 from src.services.external_application_service import (
     upload_external_application_service,
     bulk_upload_external_applications_service,
@@ -51,6 +59,7 @@ from src.services.external_application_service import (
     update_external_application_notes_service,
     bulk_update_external_status_service,
 )
+from src.utils.pagination import NEXT_CURSOR_HEADER
 
 application_router = APIRouter(tags=["Applications"])
 
@@ -102,18 +111,35 @@ async def check_application(
 
 
 # ─── GET /api/applications/job/{job_id} ──────────────────────────────────────
+# Keyset-paginated: pass the X-Next-Cursor response header back as ?cursor=
+# for the next page. ?include_analysis=false drops ai_analysis from the rows.
 @application_router.get(
     "/job/{job_id}",
     response_model=List[ApplicationDetailResponse],
 )
 async def get_applications_for_job(
     job_id: uuid.UUID,
+    response: Response,
+    status: ApplicationStatus | None = Query(None),
+    min_score: int | None = Query(None, ge=0, le=100),
+    max_score: int | None = Query(None, ge=0, le=100),
+    sort_by: ApplicantSortField = Query("applied_at"),
+    order: Literal["asc", "desc"] = Query("desc"),
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    include_analysis: bool = Query(True),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    applicants = await get_applications_for_job_service(db, job_id, current_user)
-    print(applicants)
-    return  applicants
+    applicants, next_cursor = await get_applications_for_job_service(
+        db, job_id, current_user,
+        status=status, min_score=min_score, max_score=max_score,
+        sort_by=sort_by, order=order, cursor=cursor, limit=limit,
+        include_analysis=include_analysis,
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return applicants
 
 # ─── GET /api/applications/job/{job_id}/with-applicants ──────────────────────
 @application_router.get(
@@ -129,16 +155,52 @@ async def get_job_with_applicants(
 
 
 # ─── GET /api/applications/job/{job_id}/ai-scores ────────────────────────────
+# ?profile=fast|balanced|thorough; ?upgrade_only=true re-scores only applicants
+# whose stored score came from a cheaper profile (or who have none).
 @application_router.get(
     "/job/{job_id}/ai-scores",
     response_model=ApplicationScoresResponse,
 )
 async def score_applications_for_job(
     job_id: uuid.UUID,
+    profile: PipelineProfileName | None = Query(None),
+    upgrade_only: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await score_applications_for_job_service(
+        db, job_id, current_user, profile=profile, upgrade_only=upgrade_only,
+    )
+
+
+# ─── POST /api/applications/job/{job_id}/search ──────────────────────────────
+# Semantic top-K search over the job's applicants (free text and/or skills).
+@application_router.post(
+    "/job/{job_id}/search",
+    response_model=CandidateSearchResponse,
+)
+async def search_candidates(
+    job_id: uuid.UUID,
+    payload: CandidateSearchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await search_candidates_service(db, job_id, payload, current_user)
+
+
+# ─── POST /api/applications/job/{job_id}/skill-filter ────────────────────────
+# Filter / sort applicants by matched & missing skills (GIN-indexed arrays).
+@application_router.post(
+    "/job/{job_id}/skill-filter",
+    response_model=SkillFilterResponse,
+)
+async def filter_applicants_by_skills(
+    job_id: uuid.UUID,
+    payload: SkillFilterRequest,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await score_applications_for_job_service(db, job_id, current_user)
+    return await filter_applicants_by_skills_service(db, job_id, payload, current_user)
 
 
 # ─── GET /api/applications/{application_id}/resume ───────────────────────────
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.db import get_db
 from src.middlewares.auth_middleware import get_current_user
 from src.models import User
+from src.models.user_model import UserRole
 from src.schema.candidate_dashboard_schema import CandidateDashboardResponse
 from src.services.candidate_dashboard_service import get_candidate_dashboard_service
+from src.services.dashboard_cache_service import CANDIDATE, cached_dashboard, dashboard_response
 
 candidate_dashbaord_router = APIRouter(tags=["Candidate Dashboard"])
 
@@ -15,11 +17,19 @@ candidate_dashbaord_router = APIRouter(tags=["Candidate Dashboard"])
     response_model=CandidateDashboardResponse,
 )
 async def get_candidate_dashboard_data(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Single endpoint that returns every piece of data required to render
     the candidate dashboard — KPIs, chart datasets, and recent activity.
+    Cached per candidate; sends an ETag and answers 304 when unchanged.
     """
-    return await get_candidate_dashboard_service(db, current_user)
+    candidate = getattr(current_user, "candidate_profile", None)
+    if current_user.role != UserRole.JOB_SEEKER or candidate is None:
+        return await get_candidate_dashboard_service(db, current_user)
+    body, etag = await cached_dashboard(
+        CANDIDATE, candidate.id, lambda: get_candidate_dashboard_service(db, current_user)
+    )
+    return dashboard_response(request, body, etag)
@@ -1,14 +1,22 @@
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.db import get_db
 from src.middlewares.auth_middleware import get_current_user, require_role
 from src.models import User
 from src.models.user_model import UserRole
-from src.schema.jobs_schema import JobCreateSchema, JobUpdateSchema, JobResponse, JobFilterSchema
+from src.schema.jobs_schema import (
+    JobCreateSchema,
+    JobUpdateSchema,
+    JobResponse,
+    JobFilterSchema,
+    JobListItem,
+    JobRecommendationsResponse,
+)
+from src.services.job_recommendation_service import recommend_jobs_service
 from src.services.job_services import (
     create_job_service,
     delete_job_service,
@@ -18,6 +26,7 @@ from src.services.job_services import (
 )
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
+from src.utils.pagination import NEXT_CURSOR_HEADER, TOTAL_ESTIMATE_HEADER
 
 job_router = APIRouter(tags=["Jobs"])
 
@@ -39,13 +48,29 @@ async def create_job(
 
 
 # ------------------------------- Get ALl Jobs - public route ---------------------------------------
-@job_router.get("/", response_model=list[JobResponse])
+@job_router.get("/", response_model=list[JobListItem])
 async def get_all_jobs(
+        response: Response,
         filters: JobFilterSchema = Depends(),
         db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ):
-    return await list_jobs_service(db, current_user, filters)
+    jobs, next_cursor, estimated_total = await list_jobs_service(db, current_user, filters)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    response.headers[TOTAL_ESTIMATE_HEADER] = str(estimated_total)
+    return jobs
+
+
+# ------------------- Private route - Recommended open jobs for a resume, ROLE REQUIRED: JOB_SEEKER -------------
+@job_router.get("/recommendations", response_model=JobRecommendationsResponse)
+async def get_job_recommendations(
+        resume_id: uuid.UUID,
+        limit: int = Query(10, ge=1, le=50),
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(require_role(UserRole.JOB_SEEKER)),
+):
+    return await recommend_jobs_service(db, resume_id, current_user, limit)
 
 
 # ---------------------------- Public Route - Get job by id--------------------------------------
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db import get_db
+from src.middlewares.auth_middleware import require_role
+from src.models.user_model import User, UserRole
+from src.schema.metrics_schema import MetricsResponse, RecruiterStatsRebuildResponse
+from src.services.dashboard_cache_service import dashboard_cache_stats
+from src.services.email_outbox_service import email_outbox_metrics
+from src.services.identity_cache_service import identity_cache_stats
+from src.services.job_feature_service import job_feature_metrics
+from src.services.recruiter_stats_service import rebuild_recruiter_stats
+from src.services.resume_feature_service import feature_queue_stats
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get(
+    "/",
+    response_model=MetricsResponse,
+)
+async def get_metrics(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    return MetricsResponse(
+        job_features=await job_feature_metrics(db),
+        resume_feature_queue=feature_queue_stats(),
+        dashboard_cache=dashboard_cache_stats(),
+        identity_cache=identity_cache_stats(),
+        email_outbox=await email_outbox_metrics(db),
+    )
+
+
+# ─── POST /api/metrics/recruiter-stats/rebuild ────────────────────────────────
+# Reconciles the dashboard rollup with the application tables now.
+@metrics_router.post(
+    "/recruiter-stats/rebuild",
+    response_model=RecruiterStatsRebuildResponse,
+)
+async def rebuild_recruiter_stats_now(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    result = await rebuild_recruiter_stats(db)
+    return RecruiterStatsRebuildResponse(**result)
@@ -0,0 +1,105 @@
+from fastapi import APIRouter, Depends
+
+from src.middlewares.auth_middleware import require_role
+from src.models.user_model import User, UserRole
+from src.schema.model_registry_schema import (
+    ActivateModelRequest,
+    ModelCandidateRequest,
+    ModelRegistryResponse,
+    RegisterModelVersionRequest,
+    RegisterModelVersionResponse,
+)
+from src.services.ai_pipeline_service import current_feature_version
+from src.services.model_registry_service import (
+    activate_version,
+    clear_candidate,
+    memory_status,
+    promote_candidate,
+    register_version,
+    registry_status,
+    set_candidate,
+    unload_model,
+)
+
+model_registry_router = APIRouter(tags=["Models"])
+
+
+def _status() -> ModelRegistryResponse:
+    return ModelRegistryResponse(
+        feature_version=current_feature_version(),
+        memory=memory_status(),
+        models=registry_status(),
+    )
+
+
+# ─── GET /api/models/ ─────────────────────────────────────────────────────────
+@model_registry_router.get("/", response_model=ModelRegistryResponse)
+async def get_model_registry(
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    return _status()
+
+
+# ─── POST /api/models/{kind}/versions ─────────────────────────────────────────
+@model_registry_router.post("/{kind}/versions", response_model=RegisterModelVersionResponse)
+async def register_model_version(
+    kind: str,
+    payload: RegisterModelVersionRequest,
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    result = await register_version(kind, payload.version, payload.path, payload.metrics)
+    return RegisterModelVersionResponse(kind=kind, **result)
+
+
+# ─── POST /api/models/{kind}/activate ─────────────────────────────────────────
+# Loads the version in the background and swaps it in; in-flight calls finish on the old model.
+@model_registry_router.post("/{kind}/activate", response_model=ModelRegistryResponse)
+async def activate_model_version(
+    kind: str,
+    payload: ActivateModelRequest,
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    await activate_version(kind, payload.version)
+    return _status()
+
+
+# ─── PUT /api/models/{kind}/candidate ─────────────────────────────────────────
+@model_registry_router.put("/{kind}/candidate", response_model=ModelRegistryResponse)
+async def set_model_candidate(
+    kind: str,
+    payload: ModelCandidateRequest,
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    await set_candidate(kind, payload.version, payload.mode, payload.percent)
+    return _status()
+
+
+# ─── DELETE /api/models/{kind}/candidate ──────────────────────────────────────
+@model_registry_router.delete("/{kind}/candidate", response_model=ModelRegistryResponse)
+async def clear_model_candidate(
+    kind: str,
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    clear_candidate(kind)
+    return _status()
+
+
+# ─── POST /api/models/{kind}/promote ──────────────────────────────────────────
+@model_registry_router.post("/{kind}/promote", response_model=ModelRegistryResponse)
+async def promote_model_candidate(
+    kind: str,
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    await promote_candidate(kind)
+    return _status()
+
+
+# ─── POST /api/models/{kind}/unload ───────────────────────────────────────────
+# Frees the model's memory now; it is reloaded on the next call that needs it.
+@model_registry_router.post("/{kind}/unload", response_model=ModelRegistryResponse)
+async def unload_model_now(
+    kind: str,
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+):
+    unload_model(kind)
+    return _status()
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.db import get_db
 from src.middlewares.auth_middleware import get_current_user
-from src.models.user_model import User
+from src.models.user_model import User, UserRole
 from src.schema.recruiter_dashboard_schema import RecruiterDashboardResponse
+from src.services.dashboard_cache_service import RECRUITER, cached_dashboard, dashboard_response
 from src.services.recruiter_dashboard_service import get_recruiter_dashboard_data
 
 recruiter_dashboard_router = APIRouter(tags=["Recruiter Dashboard"])
@@ -15,7 +16,15 @@ recruiter_dashboard_router = APIRouter(tags=["Recruiter Dashboard"])
     response_model=RecruiterDashboardResponse,
 )
 async def get_dashboard(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await get_recruiter_dashboard_data(db, current_user)
+    # Cached per recruiter profile; ETag lets unchanged dashboards return 304
+    profile = getattr(current_user, "recruiter_profile", None)
+    if current_user.role != UserRole.RECRUITER or profile is None:
+        return await get_recruiter_dashboard_data(db, current_user)
+    body, etag = await cached_dashboard(
+        RECRUITER, profile.id, lambda: get_recruiter_dashboard_data(db, current_user)
+    )
+    return dashboard_response(request, body, etag)
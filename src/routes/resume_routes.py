@@ -1,10 +1,7 @@
-import io
 import json
 import re
 import traceback
 
-import PyPDF2
-import docx
 from fastapi import APIRouter, Depends, File, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
@@ -22,24 +19,16 @@ from src.schema.resume_schema import (
 
 from src.services.groq_service import extract_resume_json
 from src.services.resume_service import ResumeService
+from src.services.text_extraction_service import (
+    extract_text,
+    TextExtractionError,
+    TextExtractionTimeout,
+)
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
 from src.utils.permissions import ownership_required
 
 
-# ─── Text extraction helpers ──────────────────────────────────────────────────
-
-def _extract_text_from_pdf(data: bytes) -> str:
-    reader = PyPDF2.PdfReader(io.BytesIO(data))
-    pages = [page.extract_text() or "" for page in reader.pages]
-    return "\n".join(pages)
-
-
-def _extract_text_from_docx(data: bytes) -> str:
-    doc = docx.Document(io.BytesIO(data))
-    return "\n".join(para.text for para in doc.paragraphs)
-
-
 def _normalize_date(value: str) -> str:
     """Convert common date formats to YYYY-MM or 'Present'."""
     if not value:
@@ -225,11 +214,11 @@ async def import_resume(
 
         # Step 1 — extract raw text
         try:
-            if filename.endswith(".pdf"):
-                raw_text = _extract_text_from_pdf(file_bytes)
-            else:
-                raw_text = _extract_text_from_docx(file_bytes)
-        except Exception as e:
+            raw_text = await extract_text(file_bytes, filename)
+        except TextExtractionTimeout:
+            raise AppException(ErrorCode.VALIDATION_ERROR,
+                               "The file took too long to process. Please upload a smaller document.")
+        except TextExtractionError as e:
             traceback.print_exc()
             raise AppException(ErrorCode.INTERNAL_SERVER_ERROR,
                                f"Failed to read file: {e}")
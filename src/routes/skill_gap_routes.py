@@ -1,4 +1,5 @@
 import uuid
+from typing import Optional
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
@@ -9,6 +10,7 @@ from src.middlewares.auth_middleware import get_current_user
 from src.models import User
 from src.schema.application_schema import (
     LearningRoadmapResponse,
+    PipelineProfileName,
     RoadmapProgressUpdateSchema,
     SkillGapAnalysisResponse,
     SkillGapReportDetail,
@@ -28,6 +30,7 @@ skill_gap_router = APIRouter(tags=["Skill Gap"])
 class SkillGapAnalyzeRequest(BaseModel):
     resume_id: uuid.UUID
     jd_text: str
+    profile: Optional[PipelineProfileName] = None
 
 
 # ─── Analyze ──────────────────────────────────────────────────────────────────
@@ -46,6 +49,7 @@ async def analyze_skill_gap(
         resume_id=payload.resume_id,
         jd_text=payload.jd_text,
         current_user=current_user,
+        profile=payload.profile,
     )
 
 
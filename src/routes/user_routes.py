@@ -20,14 +20,20 @@ from src.schema.user_schema import LoginResponse, LoginResponseData, Passwordles
     PasswordlessLoginResponse, PasswordlessLoginVerify, SetUserRoleSchema, SetRoleResponse, SetRoleResponseData, \
     UserProfileResponse, UserProfileResponseData, UserProfileUpdateSchema
 from src.services.auth_services import get_user_by_email
+from src.services.email_outbox_service import queue_verification_email, wake_email_sender
+from src.services.identity_cache_service import (
+    claims_user_id,
+    invalidate_identity,
+    issue_access_token,
+    revoke_tokens,
+)
 from src.services.user_services import get_user_by_id_service
-from src.utils.email_service import send_verification_email
 from src.utils.error_code import ErrorCode
 from src.utils.errors import UserErrors
 from src.utils.exceptions import AppException
-from src.utils.jwt_utils import create_jwt_token
+from src.utils.jwt_utils import decode_jwt_token
 from src.utils.utils import hash_otp, verify_otp, generate_email_verification_code
-from fastapi import Response
+from fastapi import Request, Response
 
 user_router = APIRouter(tags=["User"])
 ACCESS_TOKEN_EXPIRE_DAYS = max(1, ENV_CONFIG.ACCESS_TOKEN_EXPIRE_DAYS)
@@ -66,15 +72,11 @@ async def authenticate(data: PasswordlessLoginRequest, db: AsyncSession = Depend
 
     user.otp_code = hashed_otp
     user.expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
-    await db.commit()
 
-    try:
-        await send_verification_email(str(user.email), otp)
-    except Exception:
-        raise AppException(
-            ErrorCode.EXTERNAL_SERVICE_ERROR,
-            "Unable to send OTP email. Please use a valid email and try again.",
-        )
+    # delivered by the outbox sender, the response does not wait for SMTP
+    queue_verification_email(db, str(user.email), otp)
+    await db.commit()
+    wake_email_sender()
 
     return PasswordlessLoginResponse(
         success=True,
@@ -120,15 +122,8 @@ async def verify_login(data: PasswordlessLoginVerify, response: Response, db: As
 
     await db.commit()
 
-    # create jwt tokens
-    token = create_jwt_token(
-        data={
-            "sub": str(user.id),
-            "email": user.email,
-            "role": user.role.value if user.role else None,
-        },
-        expires_delta=ACCESS_TOKEN_EXPIRE_DELTA
-    )
+    # create jwt tokens (role, profile ids and token version as claims)
+    token = await issue_access_token(db, user, ACCESS_TOKEN_EXPIRE_DELTA)
 
     issue_auth_cookie(response, token)
 
@@ -194,14 +189,7 @@ async def google_oauth_callback(code: str, db: AsyncSession = Depends(get_db)):
         await db.commit()
         await db.refresh(user)
 
-    token = create_jwt_token(
-        data={
-            "sub": str(user.id),
-            "email": user.email,
-            "role": user.role.value if user.role else None,
-        },
-        expires_delta=ACCESS_TOKEN_EXPIRE_DELTA
-    )
+    token = await issue_access_token(db, user, ACCESS_TOKEN_EXPIRE_DELTA)
 
     redirect = RedirectResponse(f"{ENV_CONFIG.FRONTEND_URL}/auth/callback")
     issue_auth_cookie(redirect, token)
@@ -229,11 +217,13 @@ async def get_profile(current_user: User = Depends(get_current_user), db: AsyncS
         candidate = CandidateProfile(user_id=user.id)
         db.add(candidate)
         await db.commit()
+        await invalidate_identity(user.id)
         user = await get_user_by_id_service(db, current_user.id)
     elif user.role == UserRole.RECRUITER and user.recruiter_profile is None:
         recruiter = RecruiterProfile(user_id=user.id)
         db.add(recruiter)
         await db.commit()
+        await invalidate_identity(user.id)
         user = await get_user_by_id_service(db, current_user.id)
 
     return UserProfileResponse(
@@ -290,6 +280,7 @@ async def update_profile(
                 setattr(user.recruiter_profile, field, value)
 
     await db.commit()
+    await invalidate_identity(current_user.id)
 
     updated_user = await get_user_by_id_service(db, current_user.id)
     return UserProfileResponse(
@@ -322,15 +313,9 @@ async def set_user_role(response: Response, data: SetUserRoleSchema, current_use
 
     await db.commit()
 
-    # Re-issue JWT with role included so middleware can read it
-    token = create_jwt_token(
-        data={
-            "sub": str(current_user.id),
-            "email": current_user.email,
-            "role": data.role.value,
-        },
-        expires_delta=ACCESS_TOKEN_EXPIRE_DELTA
-    )
+    # Role changed: revoke the old tokens and re-issue one with the new claims
+    await revoke_tokens(db, current_user.id)
+    token = await issue_access_token(db, current_user, ACCESS_TOKEN_EXPIRE_DELTA)
     issue_auth_cookie(response, token)
 
     return SetRoleResponse(
@@ -344,7 +329,15 @@ async def set_user_role(response: Response, data: SetUserRoleSchema, current_use
 
 
 @user_router.post("/logout")
-async def logout(res: Response):
+async def logout(res: Response, req: Request):
+    # Ends this browser's session only; other devices stay logged in
+    token = req.cookies.get("token")
+    if token:
+        try:
+            await invalidate_identity(claims_user_id(decode_jwt_token(token.strip())))
+        except AppException:
+            pass
+
     res.delete_cookie(
         key="token",
         path="/"
@@ -353,3 +346,22 @@ async def logout(res: Response):
         "success": True,
         "message": "Successfully logged out"
     }
+
+
+@user_router.post("/logout/all")
+async def logout_everywhere(
+        res: Response,
+        current_user: User = Depends(get_current_user),
+        db: AsyncSession = Depends(get_db),
+):
+    # Bumps the token version, which rejects every token issued to the user so far
+    await revoke_tokens(db, current_user.id)
+
+    res.delete_cookie(
+        key="token",
+        path="/"
+    )
+    return {
+        "success": True,
+        "message": "Logged out on all devices"
+    }
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.job_application_model import ApplicationStatus
 from src.models.job_model import EmploymentType, JobStatus
@@ -82,6 +82,63 @@ class ApplicationDetailResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Keyset sort keys of the recruiter applicant listing (unscored sort last)
+ApplicantSortField = Literal["applied_at", "ai_score"]
+
+
+class CandidateSearchRequest(BaseModel):
+    query: Optional[str] = None          # free text, e.g. "backend engineer who knows Kafka and Go"
+    skills: list[str] = []
+    top_k: int = Field(default=20, ge=1, le=200)
+    min_similarity: Optional[float] = Field(default=None, ge=-1.0, le=1.0)
+
+
+class CandidateSearchHit(BaseModel):
+    application_id: uuid.UUID
+    source: Literal["PLATFORM", "EXTERNAL"]
+    candidate_name: Optional[str] = None
+    status: str
+    ai_score: Optional[int] = None
+    similarity: float   # cosine similarity of the profile vector to the query
+
+
+class CandidateSearchResponse(BaseModel):
+    hits: list[CandidateSearchHit]
+    pool_size: int      # applicants with a profile vector for this job
+    took_ms: float
+
+
+class SkillFilterRequest(BaseModel):
+    # Skill names or canonical ids; matched against the canonical ids in each analysis
+    has_all: list[str] = []          # matched every one of these
+    has_any: list[str] = []          # matched at least one
+    missing_any: list[str] = []      # flagged missing for at least one
+    missing_none: list[str] = []     # none of these flagged missing
+    min_score: Optional[int] = Field(default=None, ge=0, le=100)
+    sort: Literal["ai_score", "applied_at", "matched_count"] = "ai_score"
+    order: Literal["asc", "desc"] = "desc"
+    limit: int = Field(default=50, ge=1, le=200)
+    offset: int = Field(default=0, ge=0)
+
+
+class SkillFilterItem(BaseModel):
+    application_id: uuid.UUID
+    source: Literal["PLATFORM", "EXTERNAL"]
+    candidate_name: Optional[str] = None
+    status: str
+    ai_score: Optional[int] = None
+    applied_at: datetime
+    matched_skill_ids: list[str]
+    missing_skill_ids: list[str]
+
+
+class SkillFilterResponse(BaseModel):
+    items: list[SkillFilterItem]
+    total: int
+    limit: int
+    offset: int
+
+
 class ApplicationResumeResponse(BaseModel):
     resume_id: uuid.UUID
     resume_title: Optional[str]
@@ -117,6 +174,10 @@ class ExtraSkillItemSchema(BaseModel):
     category: str
 
 
+# Pipeline profile names (see ai_pipeline_service.PIPELINE_PROFILES)
+PipelineProfileName = Literal["fast", "balanced", "thorough"]
+
+
 class ApplicationAnalysisSchema(BaseModel):
     ats_score: int
     skills_score: int
@@ -127,6 +188,7 @@ class ApplicationAnalysisSchema(BaseModel):
     extra_skills: list[ExtraSkillItemSchema]
     gap_report: str
     reasoning: str
+    profile: Optional[PipelineProfileName] = None     # None = scored before profiles existed (full pipeline)
 
 
 class ApplicationScoreItem(BaseModel):
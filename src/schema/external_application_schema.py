@@ -52,6 +52,8 @@ class ExternalApplicationResponse(BaseModel):
     ai_score: Optional[int] = None
     ai_analysis: Optional[dict] = None
     ai_scored_at: Optional[datetime] = None
+    duplicate_of_id: Optional[uuid.UUID] = None
+    duplicate_similarity: Optional[float] = None
     uploaded_at: datetime
     updated_at: datetime
 
@@ -61,6 +63,15 @@ class ExternalApplicationResponse(BaseModel):
 class BulkUploadResultItem(BaseModel):
     filename: str
     success: bool
+    # "queued" (saved, scoring queued) | "scoring_deferred" (saved, queue full —
+    # scored once the queue drains) | "duplicate" (same file already uploaded)
+    # | "near_duplicate" (saved, reuses the original's analysis) | "failed"
+    status: str = "queued"
+    # Pipeline stages this file completed, in order:
+    # read → deduped → uploaded → extracted → inserted → queued | deferred | linked
+    stages: list[str] = []
+    content_hash: Optional[str] = None
+    duplicate_of: Optional[uuid.UUID] = None
     data: Optional[ExternalApplicationResponse] = None
     error: Optional[str] = None
 
@@ -69,3 +80,5 @@ class BulkUploadResponse(BaseModel):
     results: list[BulkUploadResultItem]
     uploaded_count: int
     failed_count: int
+    duplicate_count: int = 0
+    stage_timings_ms: dict[str, float] = {}
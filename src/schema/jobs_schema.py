@@ -80,8 +80,15 @@ class JobResponse(BaseModel):
     )
 
 
+# Job board row: description may be a preview; rank / highlight only with ``q``
+class JobListItem(JobResponse):
+    rank: Optional[float] = None
+    highlight: Optional[str] = None   # description fragments, matches wrapped in **
+
+
 class JobFilterSchema(BaseModel):
     # ---------------- TEXT SEARCH ----------------
+    q: Optional[str] = Field(None, min_length=2, max_length=255)   # full-text over title / description / location
     title: Optional[str] = Field(None, min_length=3, max_length=255)
     description: Optional[str] = Field(None, min_length=10)
     location: Optional[str] = Field(None, min_length=2, max_length=255)
@@ -109,9 +116,10 @@ class JobFilterSchema(BaseModel):
 
 
     # ---------------- SORTING ----------------
+    # default: relevance when searching with ``q``, otherwise created_at
     sort_by: Optional[str] = Field(
-        default="created_at",
-        pattern="^(created_at|salary_min|salary_max|experience_required|application_deadline)$"
+        default=None,
+        pattern="^(relevance|created_at|salary_min|salary_max|experience_required|application_deadline)$"
     )
     order: Optional[str] = Field(
         default="desc",
@@ -119,5 +127,31 @@ class JobFilterSchema(BaseModel):
     )
 
     # ---------------- PAGINATION ----------------
+    # Pass the X-Next-Cursor header of the previous page as ``cursor``;
+    # ``page`` (OFFSET) is only used when no cursor is given.
+    cursor: Optional[str] = None
     page: Optional[int] = Field(default=1, ge=1)
     limit: Optional[int] = Field(default=10, ge=1, le=100)
+
+    # ---------------- PROJECTION ----------------
+    full_description: Optional[bool] = False  # default: description truncated for list views
+
+
+# ------------------- Job Recommendations -----------------------
+class JobRecommendationItem(BaseModel):
+    job_id: uuid.UUID
+    title: str
+    location: Optional[str]
+    employment_type: EmploymentType
+    score: float              # blended: vector similarity + canonical skill overlap
+    similarity: float         # cosine similarity of resume and job profile vectors
+    skill_overlap: int
+    total_job_skills: int
+    matched_skills: List[str] = []   # canonical skill ids
+
+
+class JobRecommendationsResponse(BaseModel):
+    resume_id: uuid.UUID
+    recommendations: List[JobRecommendationItem]
+    cached: bool
+    took_ms: float
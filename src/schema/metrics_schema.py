@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class QueueStats(BaseModel):
+    workers: int
+    maxsize: int
+    pending: int
+    processed: int
+    failed: int
+
+
+class JobFeatureMetrics(BaseModel):
+    pipeline_version: str
+    ontology_version: str
+    jobs: int
+    fresh: int
+    stale: int        # stored, but built from an older description / version
+    missing: int
+    fresh_ratio: float
+    avg_build_ms: float | None = None
+    p95_build_ms: float | None = None
+    last_built_at: datetime | None = None
+    rebuilds_pending: int
+    rebuilds_completed: int
+    avg_rebuild_latency_ms: float | None = None   # description change → features ready
+    max_rebuild_latency_ms: float | None = None
+    last_rebuild_latency_ms: float | None = None
+    last_build_ms: float | None = None
+    builds: int
+    build_failures: int
+    inline_builds: int
+    hits: int
+    misses: int
+    queue: QueueStats
+
+
+class DashboardCacheStats(BaseModel):
+    hits: int
+    misses: int
+    not_modified: int     # 304s served from a matching If-None-Match
+    invalidations: int
+
+
+class IdentityCacheStats(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float | None
+    claims_hits: int        # authorized from token claims, no user load
+    version_misses: int     # token version read from the database
+    invalidations: int
+    revocations: int
+
+
+class EmailOutboxStats(BaseModel):
+    pending: int
+    failed: int           # gave up, rows kept for inspection
+    sent: int
+    retried: int
+    gave_up: int
+    batches: int
+    last_batch_ms: float | None = None
+
+
+class MetricsResponse(BaseModel):
+    job_features: JobFeatureMetrics
+    resume_feature_queue: QueueStats
+    dashboard_cache: DashboardCacheStats
+    identity_cache: IdentityCacheStats
+    email_outbox: EmailOutboxStats
+
+
+class RecruiterStatsRebuildResponse(BaseModel):
+    rows: int
+    applications: int
+    drift: int        # applications counted after the rebuild minus before it
+    rebuild_ms: float
@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class RegisterModelVersionRequest(BaseModel):
+    version: str = Field(min_length=1, max_length=64, pattern=r"^[A-Za-z0-9._-]+$")
+    path: str                                   # relative to models/
+    metrics: dict[str, Any] = {}
+
+
+class ActivateModelRequest(BaseModel):
+    version: str
+
+
+class ModelCandidateRequest(BaseModel):
+    version: str
+    mode: Literal["canary", "shadow"] = "shadow"
+    percent: float = Field(10.0, gt=0, le=100)
+
+
+class LoadedModelInfo(BaseModel):
+    version: str
+    loaded: bool
+    loaded_at: datetime
+    load_ms: float
+    resident_mb: float = 0.0
+
+
+class ModelVersionInfo(BaseModel):
+    version: str
+    path: str
+    sha256: str
+    metrics: dict[str, Any] = {}
+    registered_at: str | None = None
+
+
+class ModelCallStats(BaseModel):
+    version: str
+    calls: int
+    avg_ms: float | None = None
+
+
+class ShadowStats(BaseModel):
+    comparisons: int
+    avg_drift: float | None = None      # embeddings: 1 - cosine; NER: 1 - Jaccard; ATS: score points
+    max_drift: float | None = None
+    avg_primary_ms: float | None = None
+    avg_candidate_ms: float | None = None
+
+
+class ModelStatus(BaseModel):
+    kind: str
+    active: LoadedModelInfo | None = None       # None until first use
+    configured_version: str
+    candidate: LoadedModelInfo | None = None
+    candidate_mode: str | None = None
+    candidate_percent: float
+    canary_allowed: bool
+    versions: list[ModelVersionInfo]
+    calls: list[ModelCallStats]
+    shadow: ShadowStats
+    resident_mb: float                          # estimated, active + candidate
+    idle_seconds: float | None = None
+    in_use: int
+    loads: int
+    unloads: int
+    events: list[dict[str, Any]]
+
+
+class ModelMemoryStatus(BaseModel):
+    budget_mb: float | None = None              # None = unlimited
+    idle_unload_seconds: float | None = None
+    process_rss_mb: float
+    models_resident_mb: float
+
+
+class ModelRegistryResponse(BaseModel):
+    feature_version: str
+    memory: ModelMemoryStatus
+    models: list[ModelStatus]
+
+
+class RegisterModelVersionResponse(BaseModel):
+    kind: str
+    version: str
+    sha256: str
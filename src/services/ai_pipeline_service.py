@@ -10,53 +10,54 @@ Stage 5 — Scoring + Gap Analysis    (weighted ATS score + roadmap)
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
 import uuid
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from rapidfuzz import fuzz
 from src.services.groq_service import call_groq
-
-# ─── BGE model singleton (lazy load) ──────────────────────────────────────────
-_bge_model = None
+from src.services.model_registry_service import (
+    MODELS_DIR,
+    LEGACY_VERSION,
+    active_version,
+    get_model,
+    register_model,
+    run_model,
+)
+from src.utils.text_budget import budget_sections, iter_lines
+
+# ─── Models (resolved through the model registry, loaded lazily) ─────────────
+
+def _load_bge_model(path: str):
+    from sentence_transformers import SentenceTransformer
+    print(f"[BGE] Looking for fine-tuned model at: {path}")
+    if os.path.isdir(path):
+        print("[BGE] Loading fine-tuned skill_embeddings model")
+        return SentenceTransformer(path)
+    print("[BGE] Fine-tuned model not found, using BAAI/bge-small-en-v1.5")
+    return SentenceTransformer("BAAI/bge-small-en-v1.5")
+
+
+def _load_ner_model(path: str):
+    import spacy
+    print(f"[NER] Looking for model at: {path}")
+    if os.path.isdir(path):
+        return spacy.load(path)
+    # If model not found, the Ollama fallback is used
+    return None
 
 
 def _get_bge_model():
-    global _bge_model
-    if _bge_model is None:
-        from sentence_transformers import SentenceTransformer
-        _MODEL_PATH = os.path.normpath(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../models/skill_embeddings")
-        )
-        print(f"[BGE] Looking for fine-tuned model at: {_MODEL_PATH}")
-        if os.path.isdir(_MODEL_PATH):
-            print("[BGE] Loading fine-tuned skill_embeddings model")
-            _bge_model = SentenceTransformer(_MODEL_PATH)
-        else:
-            print("[BGE] Fine-tuned model not found, using BAAI/bge-small-en-v1.5")
-            _bge_model = SentenceTransformer("BAAI/bge-small-en-v1.5")
-    return _bge_model
-
-
-# ─── spaCy NER model singleton (lazy load) ────────────────────────────────────
-_ner_model = None
+    return get_model("skill_embeddings")
 
 
 def _get_ner_model():
-    global _ner_model
-    if _ner_model is None:
-        import spacy
-        _NER_PATH = os.path.normpath(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../models/skill_ner/model-best")
-        )
-        print(f"[NER] Looking for model at: {_NER_PATH}")
-        if os.path.isdir(_NER_PATH):
-            _ner_model = spacy.load(_NER_PATH)
-        # If model not found, _ner_model stays None → Ollama fallback is used
-    return _ner_model
+    return get_model("skill_ner")
 
 
 # ─── Pipeline result dataclasses ──────────────────────────────────────────────
@@ -123,6 +124,7 @@ class PipelineResult:
     roadmap: RoadmapPhases
     reasoning: str
     debug: dict[str, Any] | None = None
+    profile: str = "thorough"        # PipelineProfile.name that produced this result
 
 
 @dataclass
@@ -144,8 +146,127 @@ class ExtractedSkills:
         }
 
 
+# Bump whenever segmentation, skill extraction / normalization or the skill
+# embedding model changes — stored feature rows with another version are rebuilt.
+PIPELINE_VERSION = "2026.10.3"
+# Models whose output ends up in stored features; a new active version makes them stale
+FEATURE_MODEL_KINDS = ("skill_embeddings", "skill_ner")
+
+
+def current_feature_version() -> str:
+    """
+    PIPELINE_VERSION, plus a short hash of the active embedding / NER model
+    versions once either is promoted past the legacy model. Fits the 32-char
+    ``pipeline_version`` columns.
+    """
+    versions = [f"{kind}={active_version(kind)}" for kind in FEATURE_MODEL_KINDS]
+    if all(v.endswith(f"={LEGACY_VERSION}") for v in versions):
+        return PIPELINE_VERSION
+    return f"{PIPELINE_VERSION}+{hashlib.sha1(','.join(versions).encode()).hexdigest()[:10]}"
+
+
+# Bump whenever the skill alias / category tables (_canonicalize_skill_name,
+# _categorize_skill) change — canonical skill names in stored features shift.
+SKILL_ONTOLOGY_VERSION = "2026.10.1"
+
+
+# ─── Pipeline profiles ────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class PipelineProfile:
+    """Which stages a pipeline run may use; cheaper profiles skip the heavy ones."""
+    name: str
+    rank: int                   # higher = more thorough; a result is upgraded when a higher rank is requested
+    ner: bool                   # spaCy NER for skills not in precomputed features (else dictionary only)
+    semantic_matching: bool     # BGE stage 3 after exact / fuzzy
+    cross_encoder: bool         # stage 4 ATS cross-encoder (else heuristic score)
+    windowed: bool              # score the whole resume in sliding windows (else one window)
+    llm_fallback: bool          # Groq for sparse skill extraction / missing cross-encoder
+
+
+PIPELINE_PROFILES: dict[str, PipelineProfile] = {
+    "fast": PipelineProfile("fast", rank=0, ner=False, semantic_matching=False,
+                            cross_encoder=False, windowed=False, llm_fallback=False),
+    "balanced": PipelineProfile("balanced", rank=1, ner=True, semantic_matching=True,
+                                cross_encoder=True, windowed=False, llm_fallback=False),
+    "thorough": PipelineProfile("thorough", rank=2, ner=True, semantic_matching=True,
+                                cross_encoder=True, windowed=True, llm_fallback=True),
+}
+DEFAULT_PIPELINE_PROFILE = os.getenv("PIPELINE_PROFILE", "thorough").strip().lower()
+
+
+def get_pipeline_profile(profile: "str | PipelineProfile | None" = None) -> PipelineProfile:
+    """Resolve a profile name (None → PIPELINE_PROFILE env, default "thorough")."""
+    if isinstance(profile, PipelineProfile):
+        return profile
+    name = (profile or DEFAULT_PIPELINE_PROFILE).strip().lower()
+    if name not in PIPELINE_PROFILES:
+        raise ValueError(f"Unknown pipeline profile '{name}' (expected one of {', '.join(PIPELINE_PROFILES)})")
+    return PIPELINE_PROFILES[name]
+
+
+get_pipeline_profile()      # fail at startup on a bad PIPELINE_PROFILE
+
+# Stored features are reused by runs of every profile, so they are always
+# built with the full one (never with the PIPELINE_PROFILE default)
+FEATURE_STORE_PROFILE = PIPELINE_PROFILES["thorough"]
+
+
+def needs_upgrade(analysis: dict | None, profile: "str | PipelineProfile") -> bool:
+    """True when a stored analysis is missing or was produced by a cheaper profile than ``profile``."""
+    if not analysis:
+        return True
+    # Analyses stored before profiles existed came from the full pipeline
+    produced = PIPELINE_PROFILES.get(analysis.get("profile") or "thorough")
+    return produced is None or produced.rank < get_pipeline_profile(profile).rank
+
+
+@dataclass
+class ResumeFeatureSet:
+    """Resume-only pipeline inputs, computed once per resume revision."""
+    segments: dict[str, str]
+    skill_text: str                          # contact-stripped text used for NER
+    skill_tuples: list[tuple[str, str]]      # normalized (name, category)
+    soft_skills: list[str]
+    years_experience: int
+    skill_embeddings: Any = None             # float32 (len(skill_tuples), dim) or None
+    profile_embedding: Any = None            # float32 (dim,) over build_profile_text(), or None
+    pipeline_version: str = field(default_factory=lambda: current_feature_version())
+
+    def embedding_cache(self) -> dict[str, Any]:
+        """Skill name → BGE vector, for match_skills_semantic."""
+        if self.skill_embeddings is None or len(self.skill_embeddings) != len(self.skill_tuples):
+            return {}
+        return {name: vec for (name, _), vec in zip(self.skill_tuples, self.skill_embeddings)}
+
+
+@dataclass
+class JobFeatureSet:
+    """JD-only pipeline inputs, computed once per job description revision."""
+    segments: dict[str, str]
+    full_text: str
+    skill_tuples: list[tuple[str, str]]      # normalized (name, category)
+    alternatives: list[list[str]]            # interchangeable skill groups
+    soft_skills: list[str]
+    skill_embeddings: Any = None             # float32 (len(skill_tuples), dim) or None
+    profile_embedding: Any = None            # float32 (dim,) over build_job_profile_text(), or None
+    pipeline_version: str = field(default_factory=lambda: current_feature_version())
+    ontology_version: str = SKILL_ONTOLOGY_VERSION
+
+    def is_current(self) -> bool:
+        return (self.pipeline_version == current_feature_version()
+                and self.ontology_version == SKILL_ONTOLOGY_VERSION)
+
+    def embedding_cache(self) -> dict[str, Any]:
+        """Skill name → BGE vector, for match_skills_semantic."""
+        if self.skill_embeddings is None or len(self.skill_embeddings) != len(self.skill_tuples):
+            return {}
+        return {name: vec for (name, _), vec in zip(self.skill_tuples, self.skill_embeddings)}
+
+
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=65536)
 def _to_canonical_id(name: str) -> str:
     """Convert a skill name to a stable canonical ID."""
     return re.sub(r"[^a-z0-9]+", "_", name.lower().strip()).strip("_")
@@ -190,6 +311,11 @@ def _canonicalize_skill_name(name: str) -> str:
     return alias_map.get(norm, s)
 
 
+def canonical_skill_id(name: str) -> str:
+    """Canonical id for a user-supplied skill name (aliases resolved), as stored in analyses."""
+    return _to_canonical_id(_canonicalize_skill_name(name))
+
+
 def _categorize_skill(name: str) -> str:
     """Heuristic skill categorization based on keywords."""
     lower = name.lower()
@@ -520,10 +646,12 @@ def _extract_json_from_text(text: str) -> Any:
 
 def extract_skills_ner(text: str) -> ExtractedSkills:
     """Extract skills using the local spaCy NER model (fast, no network call)."""
-    nlp = _get_ner_model()
-    if nlp is None:
+    if _get_ner_model() is None:
         return ExtractedSkills()
+    return run_model("skill_ner", lambda nlp: _ner_extract(nlp, text), drift=_skills_drift)
 
+
+def _ner_extract(nlp, text: str) -> ExtractedSkills:
     _LABEL_MAP = {"TECHNICAL": "technical", "FRAMEWORK": "frameworks", "TOOL": "tools", "SOFT": "soft"}
     result = ExtractedSkills()
 
@@ -542,20 +670,78 @@ def extract_skills_ner(text: str) -> ExtractedSkills:
     return result
 
 
-async def extract_skills_from_text(text: str, context: str = "resume") -> ExtractedSkills:
+# Known skills for dictionary extraction (the "fast" profile, and NER misses without an LLM)
+_DICTIONARY_SKILLS: dict[str, str] = {
+    **dict.fromkeys([
+        "Python", "Java", "JavaScript", "TypeScript", "Golang", "Rust", "C++", "C#", "Kotlin", "Ruby",
+        "PHP", "Scala", "SQL", "HTML", "CSS", "Bash", "Dart", "Elixir",
+    ], "technical"),
+    **dict.fromkeys([
+        "React", "Angular", "Vue.js", "Next.js", "Nuxt", "Svelte", "Django", "Flask", "FastAPI",
+        "Spring Boot", "Express.js", "Node.js", "Ruby on Rails", "Laravel", ".NET", "Flutter",
+        "React Native", "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy", "Tailwind CSS",
+        "GraphQL", "REST API", "gRPC", "Spark", "Airflow",
+    ], "frameworks"),
+    **dict.fromkeys([
+        "Git", "GitHub Actions", "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins", "CI/CD",
+        "Linux", "Nginx", "Redis", "Kafka", "RabbitMQ", "PostgreSQL", "MySQL", "MongoDB", "SQLite",
+        "Elasticsearch", "Cassandra", "DynamoDB", "AWS", "GCP", "Azure", "Firebase", "Jira",
+        "Figma", "Power BI", "Tableau", "Snowflake", "dbt", "microservices",
+    ], "tools"),
+    **dict.fromkeys([
+        "communication", "leadership", "teamwork", "problem solving", "collaboration",
+        "attention to detail", "time management", "mentoring",
+    ], "soft"),
+}
+_DICTIONARY_BY_LOWER = {name.lower(): name for name in _DICTIONARY_SKILLS}
+_RE_DICTIONARY_SKILL = re.compile(
+    r"(?<![\w+#.])(" + "|".join(re.escape(n) for n in sorted(_DICTIONARY_SKILLS, key=len, reverse=True)) + r")(?![\w+#])",
+    re.IGNORECASE,
+)
+
+
+def extract_skills_dictionary(text: str) -> ExtractedSkills:
+    """Extract skills by a single regex pass over a fixed dictionary (no model, sub-millisecond)."""
+    result = ExtractedSkills()
+    seen: set[str] = set()
+    for m in _RE_DICTIONARY_SKILL.finditer(text or ""):
+        name = _DICTIONARY_BY_LOWER[m.group(1).lower()]
+        if name not in seen:
+            seen.add(name)
+            getattr(result, _DICTIONARY_SKILLS[name]).append(name)
+    return result
+
+
+# Token budget for the text embedded in the skill extraction prompt (~2,500 characters)
+_SKILL_PROMPT_MAX_TOKENS = int(os.getenv("SKILL_PROMPT_MAX_TOKENS", "625"))
+
+
+async def extract_skills_from_text(
+    text: str,
+    context: str = "resume",
+    profile: str | PipelineProfile | None = None,
+) -> ExtractedSkills:
     """Extract categorized skills from text.
 
     Uses the local spaCy NER model first (fast). Falls back to Ollama LLM
     if the NER model is unavailable or returns too few skills (< 3 total).
+    Profiles without NER use dictionary extraction only; profiles without
+    the LLM fallback use the dictionary when NER finds nothing.
     """
     if not text.strip():
         return ExtractedSkills()
 
+    profile = get_pipeline_profile(profile)
+    if not profile.ner:
+        return extract_skills_dictionary(text)
+
     # ── Try spaCy NER first ────────────────────────────────────────────────────
     ner_result = extract_skills_ner(text)
     total_ner = sum(len(v) for v in ner_result.as_dict().values())
     if total_ner >= 3:
         return ner_result
+    if not profile.llm_fallback:
+        return ner_result if total_ner else extract_skills_dictionary(text)
 
     # ── Fall back to Ollama if NER found too little ────────────────────────────
     want_alternatives = context.lower() in {"job", "jd", "job description", "job_description", "jobdescription"}
@@ -569,6 +755,7 @@ async def extract_skills_from_text(text: str, context: str = "resume") -> Extrac
         if want_alternatives
         else '{"technical": ["JavaScript"], "frameworks": ["React"], "tools": ["Git"], "soft": ["communication"]}'
     )
+    prompt_text = "\n".join(budget_sections([("text", iter_lines(text), 1.0)], _SKILL_PROMPT_MAX_TOKENS)["text"])
     prompt = f"""You are extracting SKILL NAMES ONLY from {context} text.
 
 Rules:
@@ -584,7 +771,7 @@ Return ONLY a JSON object with these keys:
  - "soft": soft skills (e.g. communication, leadership){alt_key_line}
 
 Text:
-{text[:2500]}
+{prompt_text}
 
 Return ONLY valid JSON, no explanation. Example:
 {example_json}"""
@@ -628,6 +815,8 @@ _RE_MULTI_WS = re.compile(r"\s+")
 
 # Keep Ollama prompts bounded even if raw JD/resume is extremely long.
 _ATS_OLLAMA_MAX_CHARS = int(os.getenv("ATS_OLLAMA_MAX_CHARS", "12000"))
+# Per-section token budget for the LLM fallback prompt (defaults to the old character cap)
+_ATS_LLM_SECTION_TOKENS = int(os.getenv("ATS_LLM_SECTION_TOKENS", str(_ATS_OLLAMA_MAX_CHARS // 4)))
 _PIPELINE_DEBUG = os.getenv("PIPELINE_DEBUG", "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
@@ -641,68 +830,72 @@ def _debug_emit(enabled: bool, stage: str, payload: dict[str, Any]) -> None:
         print(f"[PIPELINE_DEBUG] {stage}: <failed to serialize debug payload>")
 
 
+def _iter_clean_lines(text: str):
+    """Lazily yield cleaned, non-empty lines (contact info / pipes stripped, whitespace compacted)."""
+    for line in iter_lines(str(text).replace("\u00a0", " ")):
+        line = _RE_EMAIL.sub(" ", line)
+        line = _RE_URL.sub(" ", line)
+        line = _RE_PHONE.sub(" ", line)
+        line = _RE_PIPE.sub(" ", line)
+        line = re.sub(r"[ \t]+", " ", line).strip()
+        if line:
+            yield line
+
+
 def _clean_text_for_scoring(text: str) -> str:
     """Compact text to fit more signal into limited model context."""
     if not text:
         return ""
-    t = str(text)
-    t = _RE_EMAIL.sub(" ", t)
-    t = _RE_URL.sub(" ", t)
-    t = _RE_PHONE.sub(" ", t)
-    t = _RE_PIPE.sub(" ", t)
-    t = t.replace("\u00a0", " ")
-    t = re.sub(r"\r\n?", "\n", t)
-    t = re.sub(r"\n{3,}", "\n\n", t)
-
     # Preserve line breaks (helps both the cross-encoder and LLM fallback),
     # while still compressing whitespace within each line.
-    lines: list[str] = []
-    for line in t.split("\n"):
-        line = re.sub(r"[ \t]+", " ", line).strip()
-        if line:
-            lines.append(line)
-    return "\n".join(lines).strip()
-
-
-def _build_jd_text_for_scoring(jd_segments: dict[str, str]) -> str:
-    parts: list[str] = []
-    req = jd_segments.get("requirements", "").strip()
-    resp = jd_segments.get("responsibilities", "").strip()
-    nice = jd_segments.get("nice_to_have", "").strip()
-    full = jd_segments.get("full", "").strip()
-
-    if req:
-        parts.append(req)
-    if nice:
-        parts.append(nice)
-    if resp:
-        parts.append(resp)
-    if not parts and full:
-        parts.append(full)
+    return "\n".join(_iter_clean_lines(text))
+
+
+def _has_text(segment: str | None) -> bool:
+    return bool(segment) and not segment.isspace()
+
 
+def _budgeted_text(
+    segments: dict[str, str],
+    priority: list[tuple[str, float]],
+    order: list[str],
+    max_tokens: int,
+) -> str:
+    """Clean and keep ``segments`` within ``max_tokens``, quotas by ``priority``, output in ``order``."""
+    kept = budget_sections(
+        [(key, _iter_clean_lines(segments[key]), share) for key, share in priority if _has_text(segments.get(key))],
+        max_tokens,
+    )
+    return "\n".join(line for key in order for line in kept.get(key, []))
+
+
+# Section quotas when a token budget applies (highest priority first)
+_JD_SECTION_QUOTAS = [("requirements", 0.5), ("responsibilities", 0.3), ("nice_to_have", 0.2)]
+_RESUME_SECTION_QUOTAS = [("skills", 0.15), ("experience", 0.5), ("projects", 0.2), ("education", 0.15)]
+
+
+def _build_jd_text_for_scoring(jd_segments: dict[str, str], max_tokens: int | None = None) -> str:
+    order = ["requirements", "nice_to_have", "responsibilities"]
+    if not any(_has_text(jd_segments.get(k)) for k in order):
+        order = ["full"]
+    if max_tokens is not None:
+        quotas = _JD_SECTION_QUOTAS if order != ["full"] else [("full", 1.0)]
+        return _budgeted_text(jd_segments, quotas, order, max_tokens)
+
+    parts = [jd_segments[k].strip() for k in order if _has_text(jd_segments.get(k))]
     return _clean_text_for_scoring("\n".join(parts))
 
 
-def _build_resume_text_for_scoring(resume_segments: dict[str, str]) -> str:
+def _build_resume_text_for_scoring(resume_segments: dict[str, str], max_tokens: int | None = None) -> str:
     # Put skills early so the scorer sees explicit tech stacks even if experience text is short.
-    parts: list[str] = []
-    skills = resume_segments.get("skills", "").strip()
-    exp = resume_segments.get("experience", "").strip()
-    projects = resume_segments.get("projects", "").strip()
-    edu = resume_segments.get("education", "").strip()
-    summary = resume_segments.get("summary", "").strip()
-
-    if skills:
-        parts.append(skills)
-    if exp:
-        parts.append(exp)
-    if projects:
-        parts.append(projects)
-    if edu:
-        parts.append(edu)
-    if not parts and summary:
-        parts.append(summary)
-
+    order = ["skills", "experience", "projects", "education"]
+    if not any(_has_text(resume_segments.get(k)) for k in order):
+        order = ["summary"]
+    if max_tokens is not None:
+        quotas = _RESUME_SECTION_QUOTAS if order != ["summary"] else [("summary", 1.0)]
+        return _budgeted_text(resume_segments, quotas, order, max_tokens)
+
+    parts = [resume_segments[k].strip() for k in order if _has_text(resume_segments.get(k))]
     return _clean_text_for_scoring("\n".join(parts))
 
 
@@ -1141,6 +1334,51 @@ def _flatten_skills(skills_dict: dict[str, list[str]]) -> list[tuple[str, str]]:
     return result
 
 
+def _normalize_skill_tuples(tuples: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Post-process categories for consistency (NER categories can be noisy)."""
+    out: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for name, _cat in tuples:
+        clean = _sanitize_skill(name)
+        if not clean:
+            continue
+        clean = _canonicalize_skill_name(clean)
+        clean = _sanitize_skill(clean)
+        if not clean:
+            continue
+        cat = _categorize_skill(clean)
+        key = clean.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append((clean, cat))
+    return out
+
+
+def _detect_soft_skills(text: str) -> list[str]:
+    """Soft skills are tracked separately (so they don't inflate "JD skills" counts)."""
+    found: list[str] = []
+    for skill, pattern in [
+        ("Communication", r"\bcommunication\b"),
+        ("Problem Solving", r"\bproblem[\s-]?solving\b"),
+        ("Teamwork", r"\bteamwork\b|\bcollaboration\b"),
+        ("Leadership", r"\bleadership\b"),
+        ("Presentation", r"\bpresentation\b"),
+        ("Attention to Detail", r"\battention\s+to\s+detail\b"),
+    ]:
+        if re.search(pattern, text or "", flags=re.IGNORECASE):
+            found.append(skill)
+    # Deduplicate while preserving order
+    seen: set[str] = set()
+    out: list[str] = []
+    for s in found:
+        k = s.lower()
+        if k not in seen:
+            seen.add(k)
+            out.append(s)
+    return out
+
+
 # ─── Stage 3: Semantic Matching (BGE + FAISS + rapidfuzz) ────────────────────
 
 def _fuzzy_match(skill: str, candidates: list[str], threshold: int = 80) -> tuple[str, float] | None:
@@ -1157,17 +1395,92 @@ def _fuzzy_match(skill: str, candidates: list[str], threshold: int = 80) -> tupl
     return None
 
 
+def encode_skill_names(names: list[str]):
+    """BGE-encode skill names into an (n, dim) float32 matrix of unit vectors."""
+    import numpy as np
+
+    if not names:
+        return np.zeros((0, 0), dtype="float32")
+    return run_model(
+        "skill_embeddings",
+        lambda model: np.asarray(model.encode(names, normalize_embeddings=True), dtype="float32"),
+        drift=_embedding_drift,
+    )
+
+
+# BGE retrieval instruction: queries get it, stored passages (profiles / JDs) don't
+_BGE_QUERY_INSTRUCTION = "Represent this sentence for searching relevant passages: "
+_PROFILE_TEXT_MAX_CHARS = int(os.getenv("PROFILE_TEXT_MAX_CHARS", "2000"))
+
+
+def build_profile_text(segments: dict[str, str], skill_tuples: list[tuple[str, str]]) -> str:
+    """Compact passage (skills first, then summary / experience / projects) for one profile vector."""
+    parts = []
+    if skill_tuples:
+        parts.append("Skills: " + ", ".join(name for name, _ in skill_tuples))
+    for key in ("summary", "experience", "projects"):
+        if segments.get(key):
+            parts.append(segments[key])
+    return _RE_MULTI_WS.sub(" ", " ".join(parts)).strip()[:_PROFILE_TEXT_MAX_CHARS]
+
+
+def build_job_profile_text(full_text: str, skill_tuples: list[tuple[str, str]]) -> str:
+    """Job-side counterpart of build_profile_text (skills first, then the JD body)."""
+    parts = []
+    if skill_tuples:
+        parts.append("Skills: " + ", ".join(name for name, _ in skill_tuples))
+    parts.append(full_text or "")
+    return _RE_MULTI_WS.sub(" ", " ".join(parts)).strip()[:_PROFILE_TEXT_MAX_CHARS]
+
+
+def encode_passage(text: str):
+    """BGE unit vector (float32) for a stored passage, or None for empty text."""
+    import numpy as np
+
+    if not (text or "").strip():
+        return None
+    return run_model(
+        "skill_embeddings",
+        lambda model: np.asarray(model.encode(text, normalize_embeddings=True), dtype="float32"),
+        drift=_embedding_drift,
+    )
+
+
+def encode_query(text: str):
+    """BGE unit vector (float32) for a free-text search query."""
+    return encode_passage(_BGE_QUERY_INSTRUCTION + (text or "").strip()) if (text or "").strip() else None
+
+
+def _encode_with_cache(names: list[str], embedding_cache: dict[str, Any] | None):
+    """Encode ``names``, reusing precomputed vectors from ``embedding_cache`` when present."""
+    import numpy as np
+
+    if not embedding_cache:
+        return encode_skill_names(names)
+    todo = [n for n in names if n not in embedding_cache]
+    fresh = dict(zip(todo, encode_skill_names(todo))) if todo else {}
+    return np.stack([
+        np.asarray(embedding_cache[n] if n in embedding_cache else fresh[n], dtype="float32")
+        for n in names
+    ])
+
+
 def match_skills_semantic(
     resume_skills: list[tuple[str, str]],
     jd_skills: list[tuple[str, str]],
     semantic_threshold: float = 0.72,
     fuzzy_threshold: int = 80,
+    embedding_cache: dict[str, Any] | None = None,
+    semantic: bool = True,
 ) -> tuple[list[MatchedSkillItem], list[MissingSkillItem], list[ExtraSkillItem]]:
     """
     Match resume skills against JD skills using:
     1. Exact string match
     2. Fuzzy match (rapidfuzz)
-    3. Semantic match (BGE + FAISS)
+    3. Semantic match (BGE + FAISS), skipped when ``semantic`` is False
+
+    ``embedding_cache`` maps skill name → precomputed BGE vector (from the
+    resume / job feature stores); only names missing from it are encoded.
     """
     import numpy as np
 
@@ -1228,18 +1541,16 @@ def match_skills_semantic(
                          for s, c in resume_skills if s not in matched_resume]
     remaining_jd2 = [s for s in jd_names if s not in matched_jd]
 
-    if remaining_resume2 and remaining_jd2:
+    if semantic and remaining_resume2 and remaining_jd2:
         try:
             import faiss
-            model = _get_bge_model()
 
-            jd_embeddings = model.encode(
-                remaining_jd2, normalize_embeddings=True)
-            resume_embeddings = model.encode(
-                [s for s, _ in remaining_resume2], normalize_embeddings=True)
+            jd_embeddings = _encode_with_cache(remaining_jd2, embedding_cache)
+            resume_embeddings = _encode_with_cache(
+                [s for s, _ in remaining_resume2], embedding_cache)
 
-            jd_embeddings = np.array(jd_embeddings, dtype="float32")
-            resume_embeddings = np.array(resume_embeddings, dtype="float32")
+            jd_embeddings = np.ascontiguousarray(jd_embeddings, dtype="float32")
+            resume_embeddings = np.ascontiguousarray(resume_embeddings, dtype="float32")
 
             dim = jd_embeddings.shape[1]
             # Inner product = cosine similarity (normalized)
@@ -1266,10 +1577,22 @@ def match_skills_semantic(
         except Exception:
             pass  # Graceful fallback if FAISS/BGE fails
 
+    missing, extra = _collect_missing_and_extra(resume_skills, jd_skills, matched_jd, matched_resume)
+    return matched, missing, extra
+
+
+def _collect_missing_and_extra(
+    resume_skills: list[tuple[str, str]],
+    jd_skills: list[tuple[str, str]],
+    matched_jd: set[str],
+    matched_resume: set[str],
+) -> tuple[list[MissingSkillItem], list[ExtraSkillItem]]:
+    missing: list[MissingSkillItem] = []
+    extra: list[ExtraSkillItem] = []
+
     # Build missing skills from unmatched JD skills
-    all_matched_jd = matched_jd
     for i, (j_name, j_cat) in enumerate(jd_skills):
-        if j_name not in all_matched_jd:
+        if j_name not in matched_jd:
             # Heuristic: first 40% of JD skills = required, next 30% = preferred, rest = general
             total = len(jd_skills)
             pos_ratio = i / max(total - 1, 1)
@@ -1307,15 +1630,162 @@ def match_skills_semantic(
     # Sort missing by priority descending
     missing.sort(key=lambda x: x.priority_score, reverse=True)
 
-    return matched, missing, extra
+    return missing, extra
+
+
+SkillMatches = tuple[list[MatchedSkillItem], list[MissingSkillItem], list[ExtraSkillItem]]
+
+
+def match_skills_batch(
+    resume_skill_lists: list[list[tuple[str, str]]],
+    jd_skills: list[tuple[str, str]],
+    semantic_threshold: float = 0.72,
+    fuzzy_threshold: int = 80,
+    embedding_caches: list[dict[str, Any] | None] | None = None,
+    jd_embedding_cache: dict[str, Any] | None = None,
+    semantic: bool = True,
+) -> list[SkillMatches]:
+    """
+    Matrix form of match_skills_semantic for scoring one JD against many
+    resumes; returns the same (matched, missing, extra) per resume.
+
+    Fuzzy scores for every distinct resume skill x JD skill come from one
+    rapidfuzz ``cdist`` call, and semantic similarities from one float32
+    matmul of all distinct resume skill embeddings against the JD matrix.
+    Per resume, only the greedy assignment runs: a masked argmax over the JD
+    columns that are still unmatched.
+    """
+    import numpy as np
+    from rapidfuzz import process
+
+    if not jd_skills:
+        return [match_skills_semantic(r, jd_skills) for r in resume_skill_lists]
+
+    embedding_caches = embedding_caches or [None] * len(resume_skill_lists)
+    jd_names = [s for s, _ in jd_skills]
+    jd_cats = {s: c for s, c in jd_skills}
+    jd_count = len(jd_names)
+    jd_first_by_lower: dict[str, int] = {}
+    for j, name in enumerate(jd_names):
+        jd_first_by_lower.setdefault(name.lower(), j)
+
+    # ── Step 1: exact matches (hash lookup) ──────────────────────────────────
+    states = []
+    for resume_skills in resume_skill_lists:
+        matched: list[MatchedSkillItem] = []
+        available = np.ones(jd_count, dtype=bool)
+        matched_resume: set[str] = set()
+        for r_name, r_cat in resume_skills:
+            j = jd_first_by_lower.get(r_name.lower())
+            if j is not None:
+                j_name = jd_names[j]
+                matched.append(MatchedSkillItem(
+                    name=j_name,
+                    canonical_id=_to_canonical_id(j_name),
+                    match_type="exact",
+                    confidence=1.0,
+                    category=jd_cats.get(j_name, r_cat),
+                ))
+                available[j] = False
+                matched_resume.add(r_name)
+        states.append((matched, available, matched_resume))
+
+    # ── Step 2: fuzzy matches from one cdist over distinct names ─────────────
+    fuzzy_names = list(dict.fromkeys(
+        r_name
+        for resume_skills, (_, _, matched_resume) in zip(resume_skill_lists, states)
+        for r_name, _ in resume_skills if r_name not in matched_resume
+    ))
+    if fuzzy_names:
+        fuzzy_rows = {name: i for i, name in enumerate(fuzzy_names)}
+        fuzzy_scores = process.cdist(
+            fuzzy_names, jd_names,
+            scorer=fuzz.token_sort_ratio, processor=str.lower,
+            dtype=np.float64, workers=-1,
+        )
+        for resume_skills, (matched, available, matched_resume) in zip(resume_skill_lists, states):
+            pending = [(r, c) for r, c in resume_skills if r not in matched_resume]
+            if not pending or not available.any():
+                continue
+            block = fuzzy_scores[[fuzzy_rows[r] for r, _ in pending]]
+            masked = np.where(available, block, -1.0)
+            best = masked.argmax(axis=1)
+            best_score = masked[np.arange(len(pending)), best]
+            for k, (r_name, r_cat) in enumerate(pending):
+                j, score = int(best[k]), float(best_score[k])
+                if not available[j]:
+                    # Taken by an earlier skill of this resume — re-pick among what is left
+                    row = np.where(available, block[k], -1.0)
+                    j = int(row.argmax())
+                    score = float(row[j])
+                if score >= fuzzy_threshold and score > 0:
+                    j_name = jd_names[j]
+                    matched.append(MatchedSkillItem(
+                        name=j_name,
+                        canonical_id=_to_canonical_id(j_name),
+                        match_type="fuzzy",
+                        confidence=score / 100.0,
+                        category=jd_cats.get(j_name, r_cat),
+                    ))
+                    available[j] = False
+                    matched_resume.add(r_name)
+
+    # ── Step 3: semantic matches from one matmul over distinct names ─────────
+    semantic_names: dict[str, Any] = {}
+    for resume_skills, cache, (_, available, matched_resume) in zip(resume_skill_lists, embedding_caches, states):
+        if not available.any():
+            continue
+        for r_name, _ in resume_skills:
+            if r_name not in matched_resume and r_name not in semantic_names:
+                semantic_names[r_name] = (cache or {}).get(r_name)
+    if semantic and semantic_names:
+        try:
+            names = list(semantic_names)
+            todo = [n for n in names if semantic_names[n] is None]
+            if todo:
+                semantic_names.update(zip(todo, encode_skill_names(todo)))
+            resume_matrix = np.ascontiguousarray(
+                np.stack([np.asarray(semantic_names[n], dtype="float32") for n in names]))
+            jd_matrix = np.ascontiguousarray(_encode_with_cache(jd_names, jd_embedding_cache), dtype="float32")
+            similarity = resume_matrix @ jd_matrix.T          # (distinct resume skills, jd skills)
+            semantic_rows = {name: i for i, name in enumerate(names)}
+
+            for resume_skills, (matched, available, matched_resume) in zip(resume_skill_lists, states):
+                pending = [(r, c) for r, c in resume_skills if r not in matched_resume]
+                if not pending or not available.any():
+                    continue
+                block = similarity[[semantic_rows[r] for r, _ in pending]]
+                block = np.where(available, block, -np.inf)
+                best = block.argmax(axis=1)
+                best_sim = block[np.arange(len(pending)), best]
+                # Candidates above threshold claim their JD skill in resume order
+                for (r_name, r_cat), j, sim in zip(pending, best, best_sim):
+                    j = int(j)
+                    if sim >= semantic_threshold and available[j]:
+                        j_name = jd_names[j]
+                        matched.append(MatchedSkillItem(
+                            name=j_name,
+                            canonical_id=_to_canonical_id(j_name),
+                            match_type="semantic",
+                            confidence=float(sim),
+                            category=jd_cats.get(j_name, r_cat),
+                        ))
+                        available[j] = False
+                        matched_resume.add(r_name)
+        except Exception as e:
+            print(f"[PIPELINE] Batch semantic matching skipped: {e}")
+
+    results: list[SkillMatches] = []
+    for resume_skills, (matched, available, matched_resume) in zip(resume_skill_lists, states):
+        matched_jd = {jd_names[j] for j in np.flatnonzero(~available)}
+        missing, extra = _collect_missing_and_extra(resume_skills, jd_skills, matched_jd, matched_resume)
+        results.append((matched, missing, extra))
+    return results
 
 
 # ─── Stage 4: ATS Cross-Encoder Scorer ───────────────────────────────────────
 
 _ATS_BASE_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
-_ats_scorer_model = None
-_ats_scorer_tokenizer = None
-_ats_scorer_disabled = False
 
 
 class _ATSScorer:
@@ -1350,75 +1820,121 @@ class _ATSScorer:
             return self._net(input_ids, attention_mask)
 
 
-def _get_ats_scorer():
-    """Load ATS scorer once, reuse forever. Returns (model, tokenizer) or (None, None)."""
-    global _ats_scorer_model, _ats_scorer_tokenizer, _ats_scorer_disabled
-    if _ats_scorer_disabled:
-        return None, None
-    if _ats_scorer_model is None:
-        _MODEL_DIR = os.path.normpath(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../models/ats_scorer")
-        )
-        print(f"[ATS] Looking for scorer at: {_MODEL_DIR}")
-        model_pt = os.path.join(_MODEL_DIR, "model.pt")
-        if not os.path.isdir(_MODEL_DIR) or not os.path.exists(model_pt):
-            return None, None
-        try:
-            import torch
+def _load_ats_scorer(model_dir: str):
+    """Load the ATS scorer from ``model_dir``. Returns (model, tokenizer) or None."""
+    print(f"[ATS] Looking for scorer at: {model_dir}")
+    model_pt = os.path.join(model_dir, "model.pt")
+    if not os.path.isdir(model_dir) or not os.path.exists(model_pt):
+        return None
+    try:
+        import torch
 
-            def _state_dict_looks_compatible(state: Any) -> bool:
-                if not isinstance(state, dict):
-                    return False
-                # Our scorer must have the custom 4-output regressor head.
-                if "regressor.weight" not in state or "regressor.bias" not in state:
-                    return False
-                # Reject common incompatible heads from the base cross-encoder.
-                if "classifier.weight" in state or "classifier.bias" in state:
-                    return False
-                # Ensure we have encoder weights too (otherwise regressor alone would be nonsense).
-                if not any(isinstance(k, str) and k.startswith("encoder.") for k in state.keys()):
-                    return False
-                try:
-                    w = state.get("regressor.weight")
-                    if hasattr(w, "shape") and len(w.shape) >= 1 and int(w.shape[0]) != 4:
-                        return False
-                except Exception:
-                    return False
-                return True
-
-            # Check that the saved weights actually match our 4-output _ATSScorer architecture.
-            # If the file contains the original cross-encoder's classifier head (classifier.weight /
-            # classifier.bias) but NOT our custom regressor.weight, the regressor would be left
-            # randomly initialised → garbage 4-score output.  Skip to Ollama in that case.
-            state = torch.load(model_pt, map_location="cpu", weights_only=True)
-            if not _state_dict_looks_compatible(state):
-                print(
-                    "[ATS] model.pt has incompatible architecture "
-                    "(incompatible state_dict; expected encoder.* + regressor.* for 4 ATS outputs). "
-                    "Skipping cross-encoder and using Ollama fallback."
-                )
-                _ats_scorer_disabled = True
-                return None, None
-            from transformers import AutoTokenizer
+        def _state_dict_looks_compatible(state: Any) -> bool:
+            if not isinstance(state, dict):
+                return False
+            # Our scorer must have the custom 4-output regressor head.
+            if "regressor.weight" not in state or "regressor.bias" not in state:
+                return False
+            # Reject common incompatible heads from the base cross-encoder.
+            if "classifier.weight" in state or "classifier.bias" in state:
+                return False
+            # Ensure we have encoder weights too (otherwise regressor alone would be nonsense).
+            if not any(isinstance(k, str) and k.startswith("encoder.") for k in state.keys()):
+                return False
             try:
-                _ats_scorer_tokenizer = AutoTokenizer.from_pretrained(_MODEL_DIR)
-                _ats_scorer_model = _ATSScorer()
-                _ats_scorer_model.load(model_pt)
+                w = state.get("regressor.weight")
+                if hasattr(w, "shape") and len(w.shape) >= 1 and int(w.shape[0]) != 4:
+                    return False
             except Exception:
-                _ats_scorer_model = None
-                _ats_scorer_tokenizer = None
-                _ats_scorer_disabled = True
-                raise
-        except Exception as e:
-            print(f"[WARNING] Failed to load ATS scorer: {e}. Using Ollama fallback.")
-            _ats_scorer_model = None
-            _ats_scorer_tokenizer = None
-            _ats_scorer_disabled = True
-            return None, None
-    return _ats_scorer_model, _ats_scorer_tokenizer
+                return False
+            return True
+
+        # Check that the saved weights actually match our 4-output _ATSScorer architecture.
+        # If the file contains the original cross-encoder's classifier head (classifier.weight /
+        # classifier.bias) but NOT our custom regressor.weight, the regressor would be left
+        # randomly initialised → garbage 4-score output.  Skip to Ollama in that case.
+        state = torch.load(model_pt, map_location="cpu", weights_only=True)
+        if not _state_dict_looks_compatible(state):
+            print(
+                "[ATS] model.pt has incompatible architecture "
+                "(incompatible state_dict; expected encoder.* + regressor.* for 4 ATS outputs). "
+                "Skipping cross-encoder and using Ollama fallback."
+            )
+            return None
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        model = _ATSScorer()
+        model.load(model_pt)
+        return model, tokenizer
+    except Exception as e:
+        print(f"[WARNING] Failed to load ATS scorer: {e}. Using Ollama fallback.")
+        return None
+
+
+def _get_ats_scorer():
+    """Active ATS scorer as (model, tokenizer), or (None, None). A failed load is not retried."""
+    return get_model("ats_scorer") or (None, None)
+
+
+register_model(
+    "skill_embeddings", _load_bge_model, os.path.join(MODELS_DIR, "skill_embeddings"),
+    # Stored feature vectors must all come from one model — shadow only
+    canary_allowed=False,
+)
+register_model(
+    "skill_ner", _load_ner_model, os.path.join(MODELS_DIR, "skill_ner", "model-best"),
+    # Extracted skills are stored in feature rows stamped with the active version
+    canary_allowed=False,
+)
+register_model("ats_scorer", _load_ats_scorer, os.path.join(MODELS_DIR, "ats_scorer"))
+
+
+def _skills_drift(a: "ExtractedSkills", b: "ExtractedSkills") -> float:
+    """1 - Jaccard similarity of two extractions' skill names."""
+    names_a = {n.lower() for items in a.as_dict().values() for n in items}
+    names_b = {n.lower() for items in b.as_dict().values() for n in items}
+    union = names_a | names_b
+    return 1.0 - len(names_a & names_b) / len(union) if union else 0.0
+
+
+def _embedding_drift(a, b) -> float:
+    """1 - mean cosine similarity between matching rows of two unit-vector batches."""
+    import numpy as np
+
+    a = np.atleast_2d(np.asarray(a, dtype="float32"))
+    b = np.atleast_2d(np.asarray(b, dtype="float32"))
+    if a.shape != b.shape:
+        return 1.0
+    return float(1.0 - np.mean(np.sum(a * b, axis=1)))
+
+
+def _ats_drift(a, b) -> float:
+    """Mean absolute difference of the four pooled scores, in score points (0–100)."""
+    pooled_a = _pool_window_scores(a[1].numpy())
+    pooled_b = _pool_window_scores(b[1].numpy())
+    return sum(abs(x - y) for x, y in zip(pooled_a, pooled_b)) / 4 * 100
+
+
+def _extract_years_experience(resume_segments: dict[str, str]) -> int:
+    """Largest "N years" mention in the summary / experience sections, capped at 15."""
+    exp_text = str((resume_segments or {}).get("experience", "") or "")
+    summary_text = str((resume_segments or {}).get("summary", "") or "")
+    full_text = f"{summary_text}\n{exp_text}"
+
+    years = 0
+    for m in re.finditer(r"\b(\d{1,2})\s*(?:\+?\s*)years?\b", full_text, flags=re.IGNORECASE):
+        try:
+            years = max(years, int(m.group(1)))
+        except Exception:
+            continue
+    return max(0, min(15, years))
 
 
-def _heuristic_experience_score(jd_segments: dict[str, str], resume_segments: dict[str, str]) -> int:
+def _heuristic_experience_score(
+    jd_segments: dict[str, str],
+    resume_segments: dict[str, str],
+    years: int | None = None,
+) -> int:
     """
     Cheap deterministic experience scoring to supplement the LLM/cross-encoder:
     - Years mentioned (e.g. "5 years")
@@ -1430,13 +1946,8 @@ def _heuristic_experience_score(jd_segments: dict[str, str], resume_segments: di
     summary_text = str((resume_segments or {}).get("summary", "") or "")
     full_text = f"{summary_text}\n{exp_text}"
 
-    years = 0
-    for m in re.finditer(r"\b(\d{1,2})\s*(?:\+?\s*)years?\b", full_text, flags=re.IGNORECASE):
-        try:
-            years = max(years, int(m.group(1)))
-        except Exception:
-            continue
-    years = max(0, min(15, years))
+    if years is None:
+        years = _extract_years_experience(resume_segments)
     years_score = round(min(1.0, years / 8.0) * 100)
 
     role_relevance = 50
@@ -1462,6 +1973,82 @@ def _heuristic_experience_score(jd_segments: dict[str, str], resume_segments: di
     return max(0, min(100, int(score)))
 
 
+# ─── Stage 4: sliding-window cross-encoder inputs ────────────────────────────
+# The resume is split into overlapping token windows, each paired with the same
+# JD prefix; all windows run as one padded batch and the per-window outputs are
+# pooled. Total cost is bounded by _ATS_MAX_WINDOWS forward passes of
+# _ATS_MAX_LENGTH tokens.
+_ATS_MAX_LENGTH = int(os.getenv("ATS_MAX_LENGTH", "512"))
+_ATS_JD_PREFIX_TOKENS = int(os.getenv("ATS_JD_PREFIX_TOKENS", "192"))
+_ATS_WINDOW_STRIDE = int(os.getenv("ATS_WINDOW_STRIDE", "64"))         # overlap between windows
+_ATS_MAX_WINDOWS = int(os.getenv("ATS_MAX_WINDOWS", "8"))
+_ATS_WINDOW_POOLING = os.getenv("ATS_WINDOW_POOLING", "attention").strip().lower()   # "attention" | "max"
+_ATS_POOLING_TEMPERATURE = float(os.getenv("ATS_POOLING_TEMPERATURE", "0.1"))
+
+
+def _resume_token_budget(max_windows: int) -> int:
+    """Resume tokens ``max_windows`` windows can cover; longer text is not cleaned or tokenized."""
+    return max_windows * (_ATS_MAX_LENGTH - _ATS_JD_PREFIX_TOKENS - _ATS_WINDOW_STRIDE) + _ATS_WINDOW_STRIDE
+
+
+def _build_scoring_windows(
+    tokenizer,
+    jd_text: str,
+    resume_text: str,
+    max_windows: int = _ATS_MAX_WINDOWS,
+) -> dict[str, Any]:
+    """
+    Token windows for the cross-encoder: ``[CLS] jd_prefix [SEP] resume[i:i+w] [SEP]``.
+    The JD keeps whatever room a short resume leaves (so a pair that fits in
+    one window is scored exactly as before) but at least _ATS_JD_PREFIX_TOKENS.
+    """
+    jd_ids = tokenizer.encode(jd_text, add_special_tokens=False)
+    resume_ids = tokenizer.encode(resume_text, add_special_tokens=False)
+    budget = _ATS_MAX_LENGTH - tokenizer.num_special_tokens_to_add(pair=True)
+
+    jd_len = min(len(jd_ids), max(_ATS_JD_PREFIX_TOKENS, budget - len(resume_ids)))
+    jd_ids = jd_ids[:jd_len]
+    window = max(budget - jd_len, 1)
+    step = max(window - _ATS_WINDOW_STRIDE, 1)
+
+    starts = list(range(0, max(len(resume_ids) - _ATS_WINDOW_STRIDE, 1), step))[:max_windows]
+
+    sequences = [
+        tokenizer.build_inputs_with_special_tokens(jd_ids, resume_ids[start:start + window])
+        for start in starts
+    ]
+    batch = tokenizer.pad({"input_ids": sequences}, padding="longest", return_tensors="pt")
+    return {
+        "input_ids": batch["input_ids"],
+        "attention_mask": batch["attention_mask"],
+        "windows": len(sequences),
+        "jd_tokens": jd_len,
+        "resume_tokens": len(resume_ids),
+        "resume_tokens_covered": min(len(resume_ids), starts[-1] + window),
+    }
+
+
+def _pool_window_scores(window_scores, mode: str = _ATS_WINDOW_POOLING) -> list[float]:
+    """
+    Pool a (windows, 4) score matrix into 4 scores.
+
+    ``max`` takes the best window per output. ``attention`` weights every
+    window by softmax(overall / T) — windows the model finds most relevant
+    dominate, but evidence spread over several windows still counts.
+    """
+    import numpy as np
+
+    scores = np.asarray(window_scores, dtype="float64").reshape(-1, 4)
+    if len(scores) == 1:
+        return scores[0].tolist()
+    if mode == "max":
+        return scores.max(axis=0).tolist()
+    logits = scores[:, 0] / max(_ATS_POOLING_TEMPERATURE, 1e-6)
+    weights = np.exp(logits - logits.max())
+    weights /= weights.sum()
+    return (weights @ scores).tolist()
+
+
 async def llm_rerank(
     jd_segments: dict[str, str],
     resume_segments: dict[str, str],
@@ -1470,8 +2057,14 @@ async def llm_rerank(
     total_jd_skills: int,
     hard_total: int | None = None,
     debug: bool = False,
+    years_experience: int | None = None,
+    profile: str | PipelineProfile | None = None,
 ) -> dict[str, Any]:
-    """Score candidate using local cross-encoder. Falls back to Ollama if model missing."""
+    """
+    Score candidate using local cross-encoder. Falls back to Ollama if model
+    missing, or to a heuristic score for profiles without the LLM fallback.
+    """
+    profile = get_pipeline_profile(profile)
     if hard_total is not None and hard_total > 0:
         hard_matched = [m for m in matched_skills if m.category != "soft"]
         match_pct = round(len(hard_matched) / hard_total * 100)
@@ -1481,10 +2074,17 @@ async def llm_rerank(
     missing_names = [s.name for s in missing_skills[:15]]
 
     # ── Try local cross-encoder first ─────────────────────────────────────────
-    scorer, tokenizer = _get_ats_scorer()
+    scorer, tokenizer = _get_ats_scorer() if profile.cross_encoder else (None, None)
     if scorer is not None and tokenizer is not None:
-        jd_text = _build_jd_text_for_scoring(jd_segments)
-        resume_text = _build_resume_text_for_scoring(resume_segments)
+
+        def _score_windows(model):
+            model_scorer, model_tokenizer = model
+            windows = _build_scoring_windows(model_tokenizer, jd_text, resume_text, max_windows=max_windows)
+            return windows, model_scorer.predict(windows["input_ids"], windows["attention_mask"])
+
+        max_windows = _ATS_MAX_WINDOWS if profile.windowed else 1
+        jd_text = _build_jd_text_for_scoring(jd_segments, max_tokens=_ATS_MAX_LENGTH)
+        resume_text = _build_resume_text_for_scoring(resume_segments, max_tokens=_resume_token_budget(max_windows))
         _debug_emit(debug, "stage4_input_cross_encoder", {
             "jd_chars": len(jd_text),
             "resume_chars": len(resume_text),
@@ -1492,14 +2092,18 @@ async def llm_rerank(
             "resume_preview": resume_text[:400],
         })
         try:
-            enc = tokenizer(
-                jd_text, resume_text,
-                max_length=512, padding="max_length",
-                truncation=True, return_tensors="pt",
-            )
-            raw_scores = scorer.predict(enc["input_ids"], enc["attention_mask"])
-            scores = (raw_scores.squeeze() * 100).int().tolist()
-            heuristic_exp = _heuristic_experience_score(jd_segments, resume_segments)
+            enc, raw_scores = run_model("ats_scorer", _score_windows, drift=_ats_drift)
+            pooled = _pool_window_scores(raw_scores.numpy())
+            scores = [int(v * 100) for v in pooled]
+            _debug_emit(debug, "stage4_windows", {
+                "windows": enc["windows"],
+                "jd_tokens": enc["jd_tokens"],
+                "resume_tokens": enc["resume_tokens"],
+                "resume_tokens_covered": enc["resume_tokens_covered"],
+                "pooling": _ATS_WINDOW_POOLING,
+                "window_scores": [[round(float(v), 3) for v in row] for row in raw_scores.tolist()],
+            })
+            heuristic_exp = _heuristic_experience_score(jd_segments, resume_segments, years_experience)
             scores[2] = round(0.60 * int(scores[2]) + 0.40 * heuristic_exp)
             overall_score, skills_score, experience_score, education_score = _calibrate_scores(
                 scores[0], scores[1], scores[2], scores[3], match_pct
@@ -1519,11 +2123,30 @@ async def llm_rerank(
         except Exception as e:
             print(f"[WARNING] ATS scorer inference failed: {e}. Using Ollama fallback.")
 
+    # ── Heuristic score (no LLM round trip) ───────────────────────────────────
+    if not profile.llm_fallback:
+        heuristic_exp = _heuristic_experience_score(jd_segments, resume_segments, years_experience)
+        overall_score, skills_score, experience_score, education_score = _calibrate_scores(
+            match_pct, match_pct, heuristic_exp, 50, match_pct
+        )
+        return {
+            "scorer": "heuristic",
+            "overall_score":    overall_score,
+            "skills_score":     skills_score,
+            "experience_score": experience_score,
+            "education_score":  education_score,
+            "match_pct":        match_pct,
+            "reasoning": (
+                f"Skill match: {match_pct}% ({len(matched_skills)}/{total_jd_skills} skills). "
+                f"Missing: {', '.join(missing_names[:3]) if missing_names else 'none'}."
+            ),
+        }
+
     # ── Ollama fallback ────────────────────────────────────────────────────────
-    jd_prompt_text = _build_jd_text_for_scoring(jd_segments)[:_ATS_OLLAMA_MAX_CHARS]
-    resume_exp_text = _clean_text_for_scoring(resume_segments.get("experience", ""))[:_ATS_OLLAMA_MAX_CHARS]
-    resume_edu_text = _clean_text_for_scoring(resume_segments.get("education", ""))[:_ATS_OLLAMA_MAX_CHARS]
-    resume_skills_text = _clean_text_for_scoring(resume_segments.get("skills", ""))[:_ATS_OLLAMA_MAX_CHARS]
+    jd_prompt_text = _build_jd_text_for_scoring(jd_segments, max_tokens=_ATS_LLM_SECTION_TOKENS)
+    resume_exp_text = _budgeted_text(resume_segments, [("experience", 1.0)], ["experience"], _ATS_LLM_SECTION_TOKENS)
+    resume_edu_text = _budgeted_text(resume_segments, [("education", 1.0)], ["education"], _ATS_LLM_SECTION_TOKENS)
+    resume_skills_text = _budgeted_text(resume_segments, [("skills", 1.0)], ["skills"], _ATS_LLM_SECTION_TOKENS)
 
     _debug_emit(debug, "stage4_input_ollama", {
         "jd_chars": len(jd_prompt_text),
@@ -1566,7 +2189,7 @@ Example: {{"overall_score": 72, "skills_score": 85, "experience_score": 65, "edu
     parsed = _extract_json_from_text(raw)
 
     if isinstance(parsed, dict):
-        heuristic_exp = _heuristic_experience_score(jd_segments, resume_segments)
+        heuristic_exp = _heuristic_experience_score(jd_segments, resume_segments, years_experience)
         exp = round(0.60 * int(parsed.get("experience_score", 50)) + 0.40 * heuristic_exp)
         overall_score, skills_score, experience_score, education_score = _calibrate_scores(
             int(parsed.get("overall_score", match_pct)),
@@ -1668,28 +2291,19 @@ def _build_roadmap(missing_skills: list[MissingSkillItem]) -> RoadmapPhases:
     return RoadmapPhases(phase_1_core=phase1, phase_2_primary=phase2, phase_3_advanced=phase3)
 
 
-# ─── Main Pipeline Orchestrator ───────────────────────────────────────────────
+# ─── Resume feature set (precomputed at save time) ───────────────────────────
 
-async def run_pipeline(
-    jd_text: str,
+async def build_resume_features(
     resume_data: dict | None = None,
     resume_text: str | None = None,
-    debug: bool = False,
-) -> PipelineResult:
+    with_embeddings: bool = False,
+    profile: str | PipelineProfile | None = None,
+) -> ResumeFeatureSet:
     """
-    Run the full 5-stage pipeline and return PipelineResult.
-    Provide either resume_data (JSON) or resume_text (plain text).
+    Run every resume-only pipeline step: segmentation, contact-info stripping,
+    skill extraction, sanitizing/canonicalization, soft skills, years of
+    experience and (optionally) BGE skill embeddings.
     """
-    import time
-    _t0 = time.perf_counter()
-    def _log(stage: str):
-        print(f"[PIPELINE] {stage}: {(time.perf_counter() - _t0)*1000:.0f}ms")
-
-    debug_enabled = debug or _PIPELINE_DEBUG
-
-    # ── Stage 1: Segment ────────────────────────────────────────────────────
-    jd_segments = segment_jd(jd_text)
-
     if resume_data is not None:
         resume_segments = segment_resume(resume_data)
     elif resume_text:
@@ -1712,32 +2326,61 @@ async def run_pipeline(
     _clean = _RE_PIPE.sub(" ", _clean)
     resume_full_text = _clean
 
-    jd_full_text = jd_segments.get("full", jd_text)
-    _log("Stage 1 segmentation done")
-    _debug_emit(debug_enabled, "stage1_segments", {
-        "jd_keys": list(jd_segments.keys()),
-        "resume_keys": list(resume_segments.keys()),
-        "jd_lengths": {k: len(v or "") for k, v in jd_segments.items()},
-        "resume_lengths": {k: len(v or "") for k, v in resume_segments.items()},
-    })
+    resume_skills_extracted = await extract_skills_from_text(resume_full_text, context="resume", profile=profile)
+    resume_skill_tuples = _flatten_skills(resume_skills_extracted.as_dict())
+
+    # If resume_data contains an explicit skills list, merge it in (higher recall than NER).
+    try:
+        for skill in (resume_data or {}).get("skills", []) or []:
+            items = skill.get("items") if isinstance(skill, dict) else None
+            if not items:
+                continue
+            for raw in items:
+                for clean in _split_and_sanitize_skill_candidates(raw):
+                    resume_skill_tuples.append((clean, _categorize_skill(clean)))
+    except Exception:
+        pass
 
-    # ── Stage 2: Skill Extraction ────────────────────────────────────────────
-    resume_skills_extracted = await extract_skills_from_text(resume_full_text, context="resume")
-    _log("Stage 2a resume NER done")
-    jd_skills_extracted = await extract_skills_from_text(jd_full_text, context="job description")
-    _log("Stage 2b JD NER done")
+    resume_skill_tuples = _normalize_skill_tuples(resume_skill_tuples)
 
-    resume_skill_tuples = _flatten_skills(resume_skills_extracted.as_dict())
+    skill_embeddings = None
+    profile_embedding = None
+    if with_embeddings:
+        try:
+            if resume_skill_tuples:
+                skill_embeddings = encode_skill_names([name for name, _ in resume_skill_tuples])
+            profile_embedding = encode_passage(build_profile_text(resume_segments, resume_skill_tuples))
+        except Exception as e:
+            print(f"[FEATURES] Skill embedding failed: {e}")
+
+    return ResumeFeatureSet(
+        segments=resume_segments,
+        skill_text=resume_full_text,
+        skill_tuples=resume_skill_tuples,
+        soft_skills=_detect_soft_skills(resume_full_text),
+        years_experience=_extract_years_experience(resume_segments),
+        skill_embeddings=skill_embeddings,
+        profile_embedding=profile_embedding,
+    )
+
+
+# ─── Job feature set (precomputed when a job is saved) ───────────────────────
+
+async def build_job_features(
+    jd_text: str,
+    with_embeddings: bool = False,
+    profile: str | PipelineProfile | None = None,
+) -> JobFeatureSet:
+    """
+    Run every JD-only pipeline step: segmentation, skill extraction with the
+    keyword fallback, normalization, alternative groups, soft skills and
+    (optionally) BGE skill embeddings.
+    """
+    jd_segments = segment_jd(jd_text)
+    jd_full_text = jd_segments.get("full", jd_text)
+
+    jd_skills_extracted = await extract_skills_from_text(jd_full_text, context="job description", profile=profile)
     jd_skill_tuples = _flatten_skills(jd_skills_extracted.as_dict())
-    _debug_emit(debug_enabled, "stage2_extracted_skills", {
-        "resume": resume_skills_extracted.as_dict(),
-        "jd": jd_skills_extracted.as_dict(),
-        "jd_alternatives": jd_skills_extracted.alternatives,
-        "resume_flat_count": len(resume_skill_tuples),
-        "jd_flat_count": len(jd_skill_tuples),
-        "resume_flat_preview": resume_skill_tuples[:40],
-        "jd_flat_preview": jd_skill_tuples[:60],
-    })
 
     # Fallback: if NER/Ollama returned nothing, use simple keyword extraction
     if not jd_skill_tuples:
@@ -1753,76 +2396,114 @@ async def run_pipeline(
                     seen.add(w.lower())
                     jd_skill_tuples.append((clean, _categorize_skill(clean)))
 
-    # Soft skills are tracked separately (so they don't inflate "JD skills" counts).
-    def _detect_soft_skills(text: str) -> list[str]:
-        found: list[str] = []
-        for skill, pattern in [
-            ("Communication", r"\bcommunication\b"),
-            ("Problem Solving", r"\bproblem[\s-]?solving\b"),
-            ("Teamwork", r"\bteamwork\b|\bcollaboration\b"),
-            ("Leadership", r"\bleadership\b"),
-            ("Presentation", r"\bpresentation\b"),
-            ("Attention to Detail", r"\battention\s+to\s+detail\b"),
-        ]:
-            if re.search(pattern, text or "", flags=re.IGNORECASE):
-                found.append(skill)
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        out: list[str] = []
-        for s in found:
-            k = s.lower()
-            if k not in seen:
-                seen.add(k)
-                out.append(s)
-        return out
+    jd_skill_tuples = _normalize_skill_tuples(jd_skill_tuples)
+    jd_names = [s for s, _ in jd_skill_tuples]
+    alternative_groups = jd_skills_extracted.alternatives or _extract_alternative_skill_groups(jd_full_text, jd_names)
 
-    jd_soft_detected = _detect_soft_skills(jd_full_text)
-    resume_soft_detected = _detect_soft_skills(resume_full_text)
+    skill_embeddings = None
+    profile_embedding = None
+    if with_embeddings:
+        try:
+            if jd_skill_tuples:
+                skill_embeddings = encode_skill_names(jd_names)
+            profile_embedding = encode_passage(build_job_profile_text(jd_full_text, jd_skill_tuples))
+        except Exception as e:
+            print(f"[FEATURES] Skill embedding failed: {e}")
+
+    return JobFeatureSet(
+        segments=jd_segments,
+        full_text=jd_full_text,
+        skill_tuples=jd_skill_tuples,
+        alternatives=alternative_groups,
+        soft_skills=_detect_soft_skills(jd_full_text),
+        skill_embeddings=skill_embeddings,
+        profile_embedding=profile_embedding,
+    )
 
-    # If resume_data contains an explicit skills list, merge it in (higher recall than NER).
-    try:
-        for skill in (resume_data or {}).get("skills", []) or []:
-            items = skill.get("items") if isinstance(skill, dict) else None
-            if not items:
-                continue
-            for raw in items:
-                for clean in _split_and_sanitize_skill_candidates(raw):
-                    resume_skill_tuples.append((clean, _categorize_skill(clean)))
-    except Exception:
-        pass
 
-    # Post-process categories for consistency (NER categories can be noisy).
-    def _normalize_skill_tuples(tuples: list[tuple[str, str]]) -> list[tuple[str, str]]:
-        out: list[tuple[str, str]] = []
-        seen: set[str] = set()
-        for name, _cat in tuples:
-            clean = _sanitize_skill(name)
-            if not clean:
-                continue
-            clean = _canonicalize_skill_name(clean)
-            clean = _sanitize_skill(clean)
-            if not clean:
-                continue
-            cat = _categorize_skill(clean)
-            key = clean.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append((clean, cat))
-        return out
+# ─── Main Pipeline Orchestrator ───────────────────────────────────────────────
+
+async def run_pipeline(
+    jd_text: str,
+    resume_data: dict | None = None,
+    resume_text: str | None = None,
+    debug: bool = False,
+    resume_features: ResumeFeatureSet | None = None,
+    job_features: JobFeatureSet | None = None,
+    skill_matches: SkillMatches | None = None,
+    profile: str | PipelineProfile | None = None,
+) -> PipelineResult:
+    """
+    Run the 5-stage pipeline and return PipelineResult.
+    Provide either resume_data (JSON) or resume_text (plain text), or the
+    precomputed resume_features for that resume (skips all resume-only work).
+    Likewise job_features (built from jd_text) skips all JD-only work, and
+    skill_matches (from match_skills_batch over those features) skips Stage 3.
+
+    ``profile`` ("fast" | "balanced" | "thorough", default PIPELINE_PROFILE)
+    selects which stages may run; the result records it so a cheap score
+    can be recomputed later with a more thorough one (see needs_upgrade).
+    """
+    profile = get_pipeline_profile(profile)
+    import time
+    _t0 = time.perf_counter()
+    def _log(stage: str):
+        print(f"[PIPELINE] {stage}: {(time.perf_counter() - _t0)*1000:.0f}ms")
+
+    debug_enabled = debug or _PIPELINE_DEBUG
+
+    # ── Stage 1-2: Segment + skill extraction ────────────────────────────────
+    # Resume-only and JD-only work (segmentation, NER, normalization) comes
+    # from the feature stores when the caller has them; otherwise build here.
+    if job_features is None or not job_features.is_current():
+        job_features = await build_job_features(jd_text, profile=profile)
+        _log("Stage 1-2 JD features built")
+    else:
+        _log("Stage 1-2 JD features loaded")
+    if resume_features is None or resume_features.pipeline_version != current_feature_version():
+        resume_features = await build_resume_features(resume_data=resume_data, resume_text=resume_text, profile=profile)
+        _log("Stage 1-2 resume features built")
+    else:
+        _log("Stage 1-2 resume features loaded")
+
+    jd_segments = job_features.segments
+    resume_segments = resume_features.segments
+    _debug_emit(debug_enabled, "stage1_segments", {
+        "jd_keys": list(jd_segments.keys()),
+        "resume_keys": list(resume_segments.keys()),
+        "jd_lengths": {k: len(v or "") for k, v in jd_segments.items()},
+        "resume_lengths": {k: len(v or "") for k, v in resume_segments.items()},
+    })
+
+    resume_skill_tuples = list(resume_features.skill_tuples)
+    jd_skill_tuples = list(job_features.skill_tuples)
+    _debug_emit(debug_enabled, "stage2_extracted_skills", {
+        "jd_alternatives": job_features.alternatives,
+        "resume_flat_count": len(resume_skill_tuples),
+        "jd_flat_count": len(jd_skill_tuples),
+        "resume_flat_preview": resume_skill_tuples[:40],
+        "jd_flat_preview": jd_skill_tuples[:60],
+    })
+
+    jd_soft_detected = job_features.soft_skills
+    resume_soft_detected = resume_features.soft_skills
 
-    resume_skill_tuples = _normalize_skill_tuples(resume_skill_tuples)
-    jd_skill_tuples = _normalize_skill_tuples(jd_skill_tuples)
     raw_resume_skill_count = len(resume_skill_tuples)
     raw_jd_skill_count = len(jd_skill_tuples)
 
     # ── Stage 3: Semantic Matching ───────────────────────────────────────────
-    matched, missing, extra = match_skills_semantic(
-        resume_skill_tuples, jd_skill_tuples)
-    _log("Stage 3 semantic matching done")
+    if skill_matches is not None:
+        matched, missing, extra = (list(items) for items in skill_matches)
+        _log("Stage 3 batch matches supplied")
+    else:
+        matched, missing, extra = match_skills_semantic(
+            resume_skill_tuples, jd_skill_tuples,
+            embedding_cache={**job_features.embedding_cache(), **resume_features.embedding_cache()},
+            semantic=profile.semantic_matching,
+        )
+        _log("Stage 3 matching done")
 
-    jd_names = [s for s, _ in jd_skill_tuples]
-    alternative_groups = jd_skills_extracted.alternatives or _extract_alternative_skill_groups(jd_full_text, jd_names)
+    alternative_groups = job_features.alternatives
     matched, missing, total_jd_skills, hard_total, soft_total = _apply_alternative_groups(
         matched, missing, jd_skill_tuples, alternative_groups
     )
@@ -1894,6 +2575,8 @@ async def run_pipeline(
         total_jd_skills,
         hard_total=hard_total,
         debug=debug_enabled,
+        years_experience=resume_features.years_experience,
+        profile=profile,
     )
     _log("Stage 4 scoring done")
     _debug_emit(debug_enabled, "stage4_scores", scores)
@@ -1941,4 +2624,5 @@ async def run_pipeline(
         roadmap=roadmap,
         reasoning=scores["reasoning"],
         debug=(scores if debug_enabled else None),
+        profile=profile.name,
     )
@@ -1,14 +1,14 @@
 import asyncio
-import io
+import os
 import re
 import uuid
 from datetime import datetime, timezone
 
 import httpx
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
 from src.models.candidate_profile_model import CandidateProfile
 from src.models.external_application_model import ExternalApplication
@@ -20,6 +20,7 @@ from src.schema.application_schema import (
     ApplicationCreateSchema,
     ApplicationResponse,
     ApplicationDetailResponse,
+    ApplicantSortField,
     ApplicationResumeResponse,
     ApplicationScoreItem,
     ExternalApplicationScoreItem,
@@ -29,15 +30,38 @@ from src.schema.application_schema import (
     MissingSkillItemSchema,
     ExtraSkillItemSchema,
     JobWithApplicantsSchema,
+    PipelineProfileName,
 )
-from src.services.ai_pipeline_service import run_pipeline, PipelineResult
+from src.services.ai_pipeline_service import (
+    PipelineResult,
+    ResumeFeatureSet,
+    build_resume_features,
+    get_pipeline_profile,
+    match_skills_batch,
+    needs_upgrade,
+    run_pipeline,
+)
+from src.services.candidate_search_service import PLATFORM, index_applicant
+from src.services.dashboard_cache_service import CANDIDATE, RECRUITER, invalidate_dashboard
+from src.services.duplicate_detection_service import copy_analysis
+from src.services.job_feature_service import get_job_features
+from src.services.recruiter_stats_service import record_applications, record_status_changes
+from src.services.skill_index_service import set_analysis
+from src.services.resume_feature_service import get_resume_features, get_resume_features_map
+from src.services.text_extraction_service import extract_text, TextExtractionError
 from src.utils.email_service import (
     send_new_application_notification,
     send_application_status_update,
     send_shortlist_notification,
 )
+from src.utils import pagination
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
+from src.utils.task_queue import spawn
+
+# Scoring right after a candidate applies is a preview; recruiters upgrade it from the ai-scores endpoint
+_APPLY_SCORE_PROFILE = os.getenv("APPLY_SCORE_PROFILE", "fast")
+get_pipeline_profile(_APPLY_SCORE_PROFILE)    # a typo fails at startup, not in every background score
 
 
 def _get_candidate_profile(current_user: User):
@@ -114,30 +138,36 @@ async def apply_to_job_service(
 
     db.add(application)
     try:
+        await record_applications(db, job.recruiter_id, [application])
         await db.commit()
     except IntegrityError:
         await db.rollback()
         raise AppException(ErrorCode.DUPLICATE_RESOURCE, "You have already applied to this job")
 
     await db.refresh(application)
+    await invalidate_dashboard(CANDIDATE, candidate_profile.id)
+    await invalidate_dashboard(RECRUITER, job.recruiter_id)
 
     # ── Background: run AI scoring ─────────────────────────────────────────────
-    asyncio.create_task(
+    spawn(
         _score_single_application_bg(
             application_id=application.id,
-            job_description=job.description,
-            resume_data=resume.resume_data,
-        )
+            job_id=job.id,
+            resume_id=resume.id,
+            profile=_APPLY_SCORE_PROFILE,
+        ),
+        name=f"score-application-{application.id}",
     )
 
     # ── Notify recruiter via email (fire-and-forget) ───────────────────────────
-    asyncio.create_task(
+    spawn(
         _notify_recruiter_new_application(
             job_id=job.id,
             candidate_name=candidate_profile.full_name or current_user.email,
             job_title=job.title,
             applied_at=application.applied_at.strftime("%Y-%m-%d %H:%M UTC"),
-        )
+        ),
+        name=f"notify-recruiter-{application.id}",
     )
     
     # --- Notify candidates via in app notification ---------------------
@@ -152,24 +182,42 @@ async def apply_to_job_service(
 
 async def _score_single_application_bg(
     application_id: uuid.UUID,
-    job_description: str,
-    resume_data: dict,
+    job_id: uuid.UUID,
+    resume_id: uuid.UUID,
+    profile: str | None = None,
 ) -> None:
     """Run AI pipeline for a single application and persist the result."""
     from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
     try:
-        pipeline_result = await run_pipeline(jd_text=job_description, resume_data=resume_data)
+        # Read the inputs in a short session; no connection is held during inference
+        async with AsyncSessionLocal() as session:
+            job = await session.get(Job, job_id)
+            resume = await session.get(Resume, resume_id)
+            if job is None or resume is None:
+                return
+            resume_features = await get_resume_features(session, resume, profile)
+            job_features = await get_job_features(session, job, profile)
+            await session.commit()      # features built on a miss
+
+        pipeline_result = await run_pipeline(
+            jd_text=job.description,
+            resume_data=resume.resume_data,
+            resume_features=resume_features,
+            job_features=job_features,
+            profile=profile,
+        )
         analysis = _pipeline_result_to_analysis_schema(pipeline_result)
+
         async with AsyncSessionLocal() as session:
             result = await session.execute(
                 select(JobApplication).where(JobApplication.id == application_id)
             )
             app = result.scalar_one_or_none()
             if app:
-                app.ai_score = pipeline_result.ats_score
-                app.ai_analysis = analysis.model_dump()
-                app.ai_scored_at = datetime.now(timezone.utc)
+                set_analysis(app, pipeline_result.ats_score, analysis.model_dump(), datetime.now(timezone.utc))
                 await session.commit()
+                await invalidate_dashboard(CANDIDATE, app.candidate_id)
+                index_applicant(job_id, PLATFORM, application_id, resume_features.profile_embedding)
     except Exception as e:
         print(f"[AUTO-SCORE] Failed for application {application_id}: {e}")
 
@@ -257,74 +305,86 @@ async def get_applications_for_job_service(
     db: AsyncSession,
     job_id: uuid.UUID,
     current_user: User,
-) -> list[ApplicationDetailResponse]:
+    *,
+    status: ApplicationStatus | None = None,
+    min_score: int | None = None,
+    max_score: int | None = None,
+    sort_by: ApplicantSortField = "applied_at",
+    order: str = "desc",
+    cursor: str | None = None,
+    limit: int = 50,
+    include_analysis: bool = True,
+) -> tuple[list[ApplicationDetailResponse], str | None]:
+    """One page of applicants (candidate, email and resume title joined in) plus the next cursor."""
     if current_user.role != UserRole.RECRUITER:
         raise AppException(ErrorCode.FORBIDDEN, "Only recruiters can view job applications")
 
     recruiter_profile = _get_recruiter_profile(current_user)
 
     # Verify the job belongs to this recruiter
-    job_result = await db.execute(select(Job).where(Job.id == job_id))
-    job = job_result.scalar_one_or_none()
-    if job is None:
+    job_owner = (await db.execute(select(Job.recruiter_id).where(Job.id == job_id))).scalar_one_or_none()
+    if job_owner is None:
         raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Job not found")
-    if job.recruiter_id != recruiter_profile.id:
+    if job_owner != recruiter_profile.id:
         raise AppException(ErrorCode.UNAUTHORIZED_ACCESS, "You are not authorized to view these applications")
 
-    result = await db.execute(
-        select(JobApplication)
+    if sort_by == "ai_score":
+        sort_key, key_type = func.coalesce(JobApplication.ai_score, -1), int
+    else:
+        sort_key, key_type = JobApplication.applied_at, datetime.fromisoformat
+    columns = (sort_key, JobApplication.id)
+    descending = order == "desc"
+
+    stmt = (
+        select(JobApplication, CandidateProfile.full_name, User.email, Resume.title)
+        .outerjoin(CandidateProfile, CandidateProfile.id == JobApplication.candidate_id)
+        .outerjoin(User, User.id == CandidateProfile.user_id)
+        .outerjoin(Resume, Resume.id == JobApplication.resume_id)
         .where(JobApplication.job_id == job_id)
-        .order_by(JobApplication.applied_at.desc())
+        .order_by(*pagination.order_by(columns, descending))
+        .limit(limit + 1)
     )
-    applications = list(result.scalars().all())
-
-    # Enrich with candidate name, email, and resume title
-    enriched: list[ApplicationDetailResponse] = []
-    for app in applications:
-        candidate_result = await db.execute(
-            select(CandidateProfile).where(CandidateProfile.id == app.candidate_id)
+    if not include_analysis:
+        stmt = stmt.options(defer(JobApplication.ai_analysis))
+    if status is not None:
+        stmt = stmt.where(JobApplication.status == status)
+    if min_score is not None:
+        stmt = stmt.where(JobApplication.ai_score >= min_score)
+    if max_score is not None:
+        stmt = stmt.where(JobApplication.ai_score <= max_score)
+    if cursor:
+        after = pagination.decode_cursor(cursor, key_type, uuid.UUID)
+        stmt = stmt.where(pagination.keyset_after(columns, after, descending))
+
+    rows = (await db.execute(stmt)).all()
+
+    def page_key(row):
+        app = row[0]
+        score = app.ai_score if app.ai_score is not None else -1
+        return (score if sort_by == "ai_score" else app.applied_at, app.id)
+
+    page, next_cursor = pagination.split_page(rows, limit, page_key)
+    items = [
+        ApplicationDetailResponse(
+            id=app.id,
+            job_id=app.job_id,
+            candidate_id=app.candidate_id,
+            resume_id=app.resume_id,
+            status=app.status,
+            cover_letter=app.cover_letter,
+            applied_at=app.applied_at,
+            updated_at=app.updated_at,
+            ai_score=app.ai_score,
+            ai_analysis=app.ai_analysis if include_analysis else None,
+            ai_scored_at=app.ai_scored_at,
+            recruiter_notes=app.recruiter_notes,
+            candidate_name=full_name,
+            candidate_email=email,
+            resume_title=resume_title,
         )
-        candidate = candidate_result.scalar_one_or_none()
-
-        print("---------candidate----------")
-        print(candidate.__dict__)
-        print("---------candidate----------")
-
-
-        candidate_email: str | None = None
-        if candidate:
-            user_result = await db.execute(
-                select(User).where(User.id == candidate.user_id)
-            )
-            user = user_result.scalar_one_or_none()
-            candidate_email = user.email if user else None
-
-        resume_result = await db.execute(
-            select(Resume).where(Resume.id == app.resume_id)
-        )
-        resume = resume_result.scalar_one_or_none()
-
-        enriched.append(
-            ApplicationDetailResponse(
-                id=app.id,
-                job_id=app.job_id,
-                candidate_id=app.candidate_id,
-                resume_id=app.resume_id,
-                status=app.status,
-                cover_letter=app.cover_letter,
-                applied_at=app.applied_at,
-                updated_at=app.updated_at,
-                ai_score=app.ai_score,
-                ai_analysis=app.ai_analysis,
-                ai_scored_at=app.ai_scored_at,
-                recruiter_notes=app.recruiter_notes,
-                candidate_name=candidate.full_name,
-                candidate_email=candidate_email,
-                resume_title=resume.title if resume else None,
-            )
-        )
-
-    return enriched
+        for app, full_name, email, resume_title in page
+    ]
+    return items, next_cursor
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -356,17 +416,22 @@ async def update_application_status_service(
 
     old_status = application.status
     application.status = new_status
+    await record_status_changes(db, job.recruiter_id, [(application, old_status)])
     await db.commit()
     await db.refresh(application)
+    if old_status != new_status:
+        await invalidate_dashboard(RECRUITER, job.recruiter_id)
+        await invalidate_dashboard(CANDIDATE, application.candidate_id)
 
     # ── Notify candidate by email when status changes ─────────────────────────
     if old_status != new_status:
-        asyncio.create_task(
+        spawn(
             _notify_candidate_status_change(
                 application_id=application.id,
                 job_title=job.title,
                 new_status=new_status.value,
-            )
+            ),
+            name=f"notify-status-{application.id}",
         )
 
     return application
@@ -517,19 +582,11 @@ async def _extract_text_from_url(url: str, filename: str) -> str:
     except Exception:
         return ""
 
-    fname = filename.lower()
     try:
-        if fname.endswith(".pdf"):
-            import PyPDF2
-            reader = PyPDF2.PdfReader(io.BytesIO(content), strict=False)
-            return " ".join(page.extract_text() or "" for page in reader.pages)
-        elif fname.endswith(".docx"):
-            import docx
-            doc = docx.Document(io.BytesIO(content))
-            return " ".join(para.text for para in doc.paragraphs)
-    except Exception:
-        pass
-    return ""
+        return await extract_text(content, filename.lower(), separator=" ")
+    except TextExtractionError as e:
+        print(f"[EXTRACT] {filename}: {e}")
+        return ""
 
 
 def _pipeline_result_to_analysis_schema(result: PipelineResult) -> ApplicationAnalysisSchema:
@@ -572,6 +629,15 @@ def _pipeline_result_to_analysis_schema(result: PipelineResult) -> ApplicationAn
         ],
         gap_report=result.gap_report,
         reasoning=result.reasoning,
+        profile=result.profile,
+    )
+
+
+def _stored_score_item(app: JobApplication) -> ApplicationScoreItem:
+    return ApplicationScoreItem(
+        application_id=app.id,
+        score=app.ai_score or 0,
+        analysis=ApplicationAnalysisSchema(**app.ai_analysis) if app.ai_analysis else None,
     )
 
 
@@ -582,7 +648,14 @@ async def score_applications_for_job_service(
     db: AsyncSession,
     job_id: uuid.UUID,
     current_user: User,
+    profile: PipelineProfileName | None = None,
+    upgrade_only: bool = False,
 ) -> ApplicationScoresResponse:
+    """
+    Score every applicant of a job with the given pipeline profile. With
+    ``upgrade_only`` only applicants without a score, or scored by a cheaper
+    profile (e.g. the "fast" preview at apply time), are re-run.
+    """
     if current_user.role != UserRole.RECRUITER:
         raise AppException(ErrorCode.FORBIDDEN, "Only recruiters can run AI scoring")
 
@@ -596,6 +669,8 @@ async def score_applications_for_job_service(
         raise AppException(ErrorCode.UNAUTHORIZED_ACCESS, "Not authorized")
 
     now = datetime.now(timezone.utc)
+    pipeline_profile = get_pipeline_profile(profile)
+    job_features = await get_job_features(db, job)
 
     # Limit concurrent Ollama calls to avoid overloading the local model server
     semaphore = asyncio.Semaphore(2)
@@ -613,20 +688,75 @@ async def score_applications_for_job_service(
         res_result = await db.execute(select(Resume).where(Resume.id.in_(resume_ids)))
         for r in res_result.scalars().all():
             resume_map[r.id] = r
+    features_map = await get_resume_features_map(db, list(resume_map.values()))
+
+    # ── External applications (uploaded PDF/DOCX files) ───────────────────────
+    ext_result = await db.execute(
+        select(ExternalApplication).where(ExternalApplication.job_id == job_id)
+    )
+    external_applications = list(ext_result.scalars().all())
+
+    # Near-duplicates reuse their original's analysis instead of a pipeline run
+    ext_by_id = {ext.id: ext for ext in external_applications}
+    originals = [ext for ext in external_applications if ext.duplicate_of_id not in ext_by_id]
+    duplicates = [ext for ext in external_applications if ext.duplicate_of_id in ext_by_id]
 
-    async def _score_platform(app: JobApplication):
-        resume = resume_map.get(app.resume_id)
-        if not resume:
-            return ApplicationScoreItem(application_id=app.id, score=0, analysis=None)
+    def _to_rescore(row) -> bool:
+        return not upgrade_only or needs_upgrade(row.ai_analysis, pipeline_profile)
+
+    kept_apps = [app for app in applications if app.resume_id in resume_map and not _to_rescore(app)]
+    kept_externals = [ext for ext in originals if not _to_rescore(ext)]
+    platform_apps = [app for app in applications if app.resume_id in resume_map and _to_rescore(app)]
+    originals = [ext for ext in originals if _to_rescore(ext)]
+
+    # ── Resume features: stored ones, plus inline builds for the rest ─────────
+
+    async def _platform_features(app: JobApplication) -> ResumeFeatureSet:
+        resume = resume_map[app.resume_id]
+        if resume.id in features_map:
+            return features_map[resume.id]
+        async with semaphore:
+            return await build_resume_features(resume_data=resume.resume_data, profile=pipeline_profile)
+
+    async def _external_features(ext: ExternalApplication) -> ResumeFeatureSet:
+        text = await _extract_text_from_url(ext.resume_file_url, ext.resume_filename)
+        if ext.notes:
+            text = f"{text} {ext.notes}"
+        async with semaphore:
+            return await build_resume_features(
+                resume_text=text if text.strip() else None, profile=pipeline_profile,
+            )
+
+    platform_features: list[ResumeFeatureSet] = await asyncio.gather(
+        *[_platform_features(app) for app in platform_apps]
+    )
+    external_features: list[ResumeFeatureSet] = await asyncio.gather(
+        *[_external_features(ext) for ext in originals]
+    )
+
+    # ── Stage 3 for the whole pool at once (one cdist + one matmul) ───────────
+    all_features = platform_features + external_features
+    batch_matches = match_skills_batch(
+        [f.skill_tuples for f in all_features],
+        job_features.skill_tuples,
+        embedding_caches=[f.embedding_cache() for f in all_features],
+        jd_embedding_cache=job_features.embedding_cache(),
+        semantic=pipeline_profile.semantic_matching,
+    )
+    platform_matches = batch_matches[:len(platform_features)]
+    external_matches = batch_matches[len(platform_features):]
+
+    async def _score_platform(app: JobApplication, features: ResumeFeatureSet, skill_matches):
         async with semaphore:
             pipeline_result = await run_pipeline(
                 jd_text=job.description,
-                resume_data=resume.resume_data,
+                resume_features=features,
+                job_features=job_features,
+                skill_matches=skill_matches,
+                profile=pipeline_profile,
             )
         analysis = _pipeline_result_to_analysis_schema(pipeline_result)
-        app.ai_score = pipeline_result.ats_score
-        app.ai_analysis = analysis.model_dump()
-        app.ai_scored_at = now
+        set_analysis(app, pipeline_result.ats_score, analysis.model_dump(), now)
         return ApplicationScoreItem(
             application_id=app.id,
             score=pipeline_result.ats_score,
@@ -634,28 +764,25 @@ async def score_applications_for_job_service(
         )
 
     scores: list[ApplicationScoreItem] = await asyncio.gather(
-        *[_score_platform(app) for app in applications]
+        *[_score_platform(*args) for args in zip(platform_apps, platform_features, platform_matches)]
     )
-
-    # ── External applications (uploaded PDF/DOCX files) ───────────────────────
-    ext_result = await db.execute(
-        select(ExternalApplication).where(ExternalApplication.job_id == job_id)
+    scores.extend(
+        ApplicationScoreItem(application_id=app.id, score=0, analysis=None)
+        for app in applications if app.resume_id not in resume_map
     )
-    external_applications = list(ext_result.scalars().all())
+    scores.extend(_stored_score_item(app) for app in kept_apps)
 
-    async def _score_external(ext: ExternalApplication):
-        text = await _extract_text_from_url(ext.resume_file_url, ext.resume_filename)
-        if ext.notes:
-            text = f"{text} {ext.notes}"
+    async def _score_external(ext: ExternalApplication, features: ResumeFeatureSet, skill_matches):
         async with semaphore:
             pipeline_result = await run_pipeline(
                 jd_text=job.description,
-                resume_text=text if text.strip() else None,
+                resume_features=features,
+                job_features=job_features,
+                skill_matches=skill_matches,
+                profile=pipeline_profile,
             )
         analysis = _pipeline_result_to_analysis_schema(pipeline_result)
-        ext.ai_score = pipeline_result.ats_score
-        ext.ai_analysis = analysis.model_dump()
-        ext.ai_scored_at = now
+        set_analysis(ext, pipeline_result.ats_score, analysis.model_dump(), now)
         return ExternalApplicationScoreItem(
             external_application_id=ext.id,
             score=pipeline_result.ats_score,
@@ -663,10 +790,26 @@ async def score_applications_for_job_service(
         )
 
     external_scores: list[ExternalApplicationScoreItem] = await asyncio.gather(
-        *[_score_external(ext) for ext in external_applications]
+        *[_score_external(*args) for args in zip(originals, external_features, external_matches)]
+    )
+    external_scores.extend(
+        ExternalApplicationScoreItem(
+            external_application_id=ext.id,
+            score=ext.ai_score or 0,
+            analysis=ApplicationAnalysisSchema(**ext.ai_analysis) if ext.ai_analysis else None,
+        )
+        for ext in kept_externals
     )
+    for ext in duplicates:
+        copy_analysis(ext, ext_by_id[ext.duplicate_of_id])
+        external_scores.append(ExternalApplicationScoreItem(
+            external_application_id=ext.id,
+            score=ext.ai_score or 0,
+            analysis=ApplicationAnalysisSchema(**ext.ai_analysis) if ext.ai_analysis else None,
+        ))
 
     await db.commit()
+    await invalidate_dashboard(CANDIDATE, *(app.candidate_id for app in platform_apps))
 
     return ApplicationScoresResponse(scores=list(scores), external_scores=list(external_scores))
 
@@ -703,19 +846,27 @@ async def bulk_update_application_status_service(
     )
     applications = list(result.scalars().all())
 
+    changes = []
     for app in applications:
         old_status = app.status
         app.status = new_status
+        changes.append((app, old_status))
         if old_status != new_status:
-            asyncio.create_task(
+            spawn(
                 _notify_candidate_status_change(
                     application_id=app.id,
                     job_title=job.title,
                     new_status=new_status.value,
-                )
+                ),
+                name=f"notify-status-{app.id}",
             )
 
+    await record_status_changes(db, job.recruiter_id, changes)
     await db.commit()
+    changed = [app for app, old_status in changes if old_status != new_status]
+    if changed:
+        await invalidate_dashboard(RECRUITER, job.recruiter_id)
+        await invalidate_dashboard(CANDIDATE, *(app.candidate_id for app in changed))
     return {"updated_count": len(applications), "status": new_status.value}
 
 
@@ -800,13 +951,14 @@ async def notify_shortlisted_candidates_service(
         notified_count += 1
 
         if user.email:
-            asyncio.create_task(
+            spawn(
                 send_shortlist_notification(
                     candidate_email=user.email,
                     candidate_name=candidate_name,
                     job_title=job.title,
                     company_name=company_name,
-                )
+                ),
+                name="notify-shortlisted",
             )
     await create_notification(
         db=db,
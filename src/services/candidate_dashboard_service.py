@@ -1,13 +1,16 @@
 """
 Single-endpoint service that aggregates every piece of data needed
 for the candidate dashboard in one database round-trip set.
+
+Counting, score buckets and the weekly histogram are FILTERed aggregates
+and missing skills are tallied with ``jsonb_array_elements``, so only a
+fixed number of small rows comes back regardless of history size.
 """
 from __future__ import annotations
 
-from collections import Counter
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import and_, case, func, literal_column, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.candidate_profile_model import CandidateProfile
@@ -51,51 +54,69 @@ async def get_candidate_dashboard_service(
         raise AppException(ErrorCode.RESOURCE_NOT_FOUND,
                            "Candidate profile not found")
 
-    # ── 1. Resumes ─────────────────────────────────────────────
-    resume_result = await db.execute(
-        select(Resume).where(Resume.candidate_id == candidate.id)
-    )
-    resumes = list(resume_result.scalars().all())
+    now = datetime.now(timezone.utc)
 
-    # ── 2. Applications ────────────────────────────────────────
-    app_result = await db.execute(
-        select(JobApplication)
+    # ── 1. Resumes ─────────────────────────────────────────────
+    total_resumes = (await db.execute(
+        select(func.count(Resume.id)).where(Resume.candidate_id == candidate.id)
+    )).scalar_one()
+
+    # ── 2. Application aggregates (one row, no application rows loaded) ──
+    weeks = [
+        (now - timedelta(weeks=offset + 1), now - timedelta(weeks=offset))
+        for offset in range(7, -1, -1)
+    ]
+    score = JobApplication.ai_score
+    buckets = {
+        "0–25": score <= 25,
+        "26–50": and_(score > 25, score <= 50),
+        "51–75": and_(score > 50, score <= 75),
+        "76–100": score > 75,
+    }
+    counts = (await db.execute(
+        select(
+            func.count().label("total"),
+            func.avg(score).label("avg_score"),
+            *[func.count().filter(JobApplication.status == s).label(f"status_{s.value}")
+              for s in ApplicationStatus],
+            *[func.count().filter(condition).label(f"bucket_{i}")
+              for i, condition in enumerate(buckets.values())],
+            *[func.count().filter(JobApplication.applied_at >= start, JobApplication.applied_at < end)
+              .label(f"week_{i}") for i, (start, end) in enumerate(weeks)],
+        ).where(JobApplication.candidate_id == candidate.id)
+    )).one()
+
+    # ── 3. Recent applications (job + company joined in) ───────
+    recent_rows = (await db.execute(
+        select(
+            JobApplication.id,
+            JobApplication.status,
+            JobApplication.ai_score,
+            JobApplication.applied_at,
+            Job.title,
+            RecruiterProfile.company_name,
+        )
+        .outerjoin(Job, Job.id == JobApplication.job_id)
+        .outerjoin(RecruiterProfile, RecruiterProfile.id == Job.recruiter_id)
         .where(JobApplication.candidate_id == candidate.id)
         .order_by(JobApplication.applied_at.desc())
-    )
-    applications = list(app_result.scalars().all())
-
-    # ── 3. Recent applications ─────────────────────────────────
-    recent_items: list[RecentApplicationItem] = []
-
-    for app in applications[:5]:
-        job_res = await db.execute(select(Job).where(Job.id == app.job_id))
-        job = job_res.scalar_one_or_none()
-
-        company_name = None
-        if job:
-            rec_res = await db.execute(
-                select(RecruiterProfile).where(
-                    RecruiterProfile.id == job.recruiter_id)
-            )
-            rec = rec_res.scalar_one_or_none()
-            company_name = rec.company_name if rec else None
-
-        recent_items.append(
-            RecentApplicationItem(
-                id=str(app.id),
-                job_title=job.title if job else "Unknown Position",
-                company_name=company_name,
-                status=app.status.value,
-                ai_score=app.ai_score,
-                applied_at=app.applied_at,
-            )
+        .limit(5)
+    )).all()
+
+    recent_items = [
+        RecentApplicationItem(
+            id=str(row.id),
+            job_title=row.title or "Unknown Position",
+            company_name=row.company_name,
+            status=row.status.value,
+            ai_score=row.ai_score,
+            applied_at=row.applied_at,
         )
+        for row in recent_rows
+    ]
 
     # ── 4. Status breakdown ────────────────────────────────────
-    status_counts = {s.value: 0 for s in ApplicationStatus}
-    for app in applications:
-        status_counts[app.status.value] += 1
+    status_counts = {s.value: getattr(counts, f"status_{s.value}") for s in ApplicationStatus}
 
     status_breakdown = [
         StatusBreakdownItem(status=s, count=c)
@@ -103,95 +124,79 @@ async def get_candidate_dashboard_service(
     ]
 
     # ── 5. Weekly applications ─────────────────────────────────
-    now = datetime.now(timezone.utc)
-    weekly_map = {}
-
-    for week_offset in range(7, -1, -1):
-        week_start = now - timedelta(weeks=week_offset + 1)
-        week_end = now - timedelta(weeks=week_offset)
-
-        label = format_day(week_start)  # ✅ fixed here
-
-        count = sum(
-            1 for a in applications
-            if week_start <= _ensure_tz(a.applied_at) < week_end
-        )
-
-        weekly_map[label] = count
-
     weekly_applications = [
-        WeeklyApplicationItem(week=w, count=c)
-        for w, c in weekly_map.items()
+        WeeklyApplicationItem(week=format_day(start), count=getattr(counts, f"week_{i}"))
+        for i, (start, _) in enumerate(weeks)
     ]
 
     # ── 6. AI score distribution ───────────────────────────────
-    scored = [a for a in applications if a.ai_score is not None]
-
-    buckets = {"0–25": 0, "26–50": 0, "51–75": 0, "76–100": 0}
-
-    for a in scored:
-        s = a.ai_score
-        if s <= 25:
-            buckets["0–25"] += 1
-        elif s <= 50:
-            buckets["26–50"] += 1
-        elif s <= 75:
-            buckets["51–75"] += 1
-        else:
-            buckets["76–100"] += 1
-
     score_distribution = [
-        ScoreRangeItem(range=r, count=c) for r, c in buckets.items()
+        ScoreRangeItem(range=r, count=getattr(counts, f"bucket_{i}"))
+        for i, r in enumerate(buckets)
     ]
 
-    avg_ai_score = None
-    if scored:
-        avg_ai_score = round(sum(a.ai_score for a in scored) / len(scored), 1)
+    avg_ai_score = round(float(counts.avg_score), 1) if counts.avg_score is not None else None
 
     # ── 7. Skill gap reports ───────────────────────────────────
-    sgr_result = await db.execute(
-        select(SkillGapReport)
-        .where(SkillGapReport.candidate_id == candidate.id)
-        .order_by(SkillGapReport.created_at.asc())
-    )
-    reports = list(sgr_result.scalars().all())
+    report_totals = (await db.execute(
+        select(
+            func.count(SkillGapReport.id).label("total"),
+            func.avg(SkillGapReport.match_percentage).label("avg_match"),
+        ).where(SkillGapReport.candidate_id == candidate.id)
+    )).one()
 
-    avg_match = None
-    if reports:
-        avg_match = round(
-            sum(r.match_percentage for r in reports) / len(reports), 1)
+    avg_match = round(float(report_totals.avg_match), 1) if report_totals.avg_match is not None else None
+
+    trend_rows = (await db.execute(
+        select(SkillGapReport.created_at, SkillGapReport.match_percentage)
+        .where(SkillGapReport.candidate_id == candidate.id)
+        .order_by(SkillGapReport.created_at.desc())
+        .limit(10)
+    )).all()
 
     match_trend = [
         MatchTrendItem(
-            label=format_day(r.created_at),  # ✅ fixed here
-            match_pct=round(r.match_percentage, 1),
+            label=format_day(row.created_at),
+            match_pct=round(row.match_percentage, 1),
         )
-        for r in reports[-10:]
+        for row in reversed(trend_rows)
     ]
 
     # ── 8. Top missing skills ──────────────────────────────────
-    missing_counter = Counter()
-
-    for r in reports:
-        for skill in (r.missing_skills or []):
-            name = skill.get("name") if isinstance(skill, dict) else str(skill)
-            if name:
-                missing_counter[name] += 1
+    # Entries are {"name": ...} objects (older reports: plain strings)
+    skill = func.jsonb_array_elements(SkillGapReport.missing_skills).table_valued("value").lateral("skill")
+    skill_name = case(
+        (func.jsonb_typeof(skill.c.value) == "object", skill.c.value.op("->>")("name")),
+        else_=skill.c.value.op("#>>")(literal_column("'{}'")),
+    )
+    missing_rows = (await db.execute(
+        select(skill_name.label("name"), func.count().label("count"))
+        .select_from(SkillGapReport)
+        .join(skill, true())
+        .where(
+            SkillGapReport.candidate_id == candidate.id,
+            func.jsonb_typeof(SkillGapReport.missing_skills) == "array",
+        )
+        .group_by(skill_name)
+        .having(func.coalesce(skill_name, "") != "")
+        .order_by(func.count().desc(), skill_name)
+        .limit(8)
+    )).all()
 
     top_missing = [
-        TopMissingSkillItem(skill=s, count=c)
-        for s, c in missing_counter.most_common(8)
+        TopMissingSkillItem(skill=row.name, count=row.count)
+        for row in missing_rows
     ]
 
     # ── 9. KPIs ────────────────────────────────────────────────
     kpi = CandidateKPI(
-        total_applications=len(applications),
+        total_applications=counts.total,
         pending=status_counts.get("PENDING", 0),
         shortlisted=status_counts.get("REVIEWING", 0),
         accepted=status_counts.get("ACCEPTED", 0),
         rejected=status_counts.get("REJECTED", 0),
-        total_resumes=len(resumes),
-        total_skill_gap_reports=len(reports),
+        total_resumes=total_resumes,
+        total_skill_gap_reports=report_totals.total,
         avg_ai_score=avg_ai_score,
         avg_match_percentage=avg_match,
         profile_score=candidate.profile_score,
@@ -222,8 +227,3 @@ async def get_candidate_dashboard_service(
         recent_applications=recent_items,
     )
 
-
-def _ensure_tz(dt: datetime) -> datetime:
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt
@@ -0,0 +1,199 @@
+"""
+Semantic candidate search
+=========================
+Each applicant has one BGE profile vector (skills + summary + experience):
+platform applications take it from ``resume_features.profile_embedding``,
+external uploads store it in ``external_applications.resume_embedding`` when
+they are scored.
+
+Vectors are held per job in an in-memory ``VectorIndex`` (LRU over jobs,
+reloaded from the DB after a TTL so other workers' writes show up). New
+applicants are added incrementally once scored, so a search is one query
+encode plus one mat-vec over the pool.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.candidate_profile_model import CandidateProfile
+from src.models.external_application_model import ExternalApplication
+from src.models.job_application_model import JobApplication
+from src.models.job_model import Job
+from src.models.resume_features_model import ResumeFeatures
+from src.models.user_model import User, UserRole
+from src.schema.application_schema import (
+    CandidateSearchHit,
+    CandidateSearchRequest,
+    CandidateSearchResponse,
+)
+from src.services.ai_pipeline_service import encode_query
+from src.services.model_registry_service import activated_at, on_model_swap
+from src.utils.error_code import ErrorCode
+from src.utils.exceptions import AppException
+from src.utils.vector_index import VectorIndex, from_bytes
+
+_SEARCH_INDEX_CACHE_SIZE = int(os.getenv("CANDIDATE_SEARCH_INDEX_CACHE_SIZE", "128"))
+_SEARCH_INDEX_TTL_SECONDS = float(os.getenv("CANDIDATE_SEARCH_INDEX_TTL_SECONDS", "600"))
+
+PLATFORM = "PLATFORM"
+EXTERNAL = "EXTERNAL"
+
+
+class _JobIndex:
+    def __init__(self):
+        self.index: VectorIndex | None = None   # created on the first vector (dim unknown until then)
+        self.loaded_at = time.monotonic()
+
+    def upsert(self, key: tuple[str, uuid.UUID], vector) -> None:
+        if vector is None:
+            return
+        if self.index is None:
+            self.index = VectorIndex(dim=len(vector))
+        self.index.upsert(key, vector)
+
+    def __len__(self) -> int:
+        return len(self.index) if self.index is not None else 0
+
+
+_job_indexes: "OrderedDict[uuid.UUID, _JobIndex]" = OrderedDict()
+
+
+async def _get_job_index(db: AsyncSession, job_id: uuid.UUID) -> _JobIndex:
+    index = _job_indexes.get(job_id)
+    if index is not None and time.monotonic() - index.loaded_at < _SEARCH_INDEX_TTL_SECONDS:
+        _job_indexes.move_to_end(job_id)
+        return index
+
+    index = _JobIndex()
+    # Only vectors encoded by the active embedding model are comparable with the query.
+    # Rows stamped with an older feature version (e.g. after an NER-only swap) are still
+    # served until the swap's background rebuild replaces them.
+    embeddings_since = activated_at("skill_embeddings")
+    platform_rows = await db.execute(
+        select(JobApplication.id, ResumeFeatures.profile_embedding)
+        .join(ResumeFeatures, ResumeFeatures.resume_id == JobApplication.resume_id)
+        .where(
+            JobApplication.job_id == job_id,
+            ResumeFeatures.profile_embedding.is_not(None),
+            *([ResumeFeatures.computed_at >= embeddings_since] if embeddings_since else []),
+        )
+    )
+    for app_id, data in platform_rows.all():
+        index.upsert((PLATFORM, app_id), from_bytes(data))
+
+    external_rows = await db.execute(
+        select(ExternalApplication.id, ExternalApplication.resume_embedding).where(
+            ExternalApplication.job_id == job_id,
+            ExternalApplication.resume_embedding.is_not(None),
+            *([ExternalApplication.ai_scored_at >= embeddings_since] if embeddings_since else []),
+        )
+    )
+    for ext_id, data in external_rows.all():
+        index.upsert((EXTERNAL, ext_id), from_bytes(data))
+
+    _job_indexes[job_id] = index
+    _job_indexes.move_to_end(job_id)
+    while len(_job_indexes) > _SEARCH_INDEX_CACHE_SIZE:
+        _job_indexes.popitem(last=False)
+    return index
+
+
+def _on_model_swap(kind: str) -> None:
+    if kind == "skill_embeddings":
+        _job_indexes.clear()
+
+
+on_model_swap(_on_model_swap)
+
+
+def index_applicant(job_id: uuid.UUID, source: str, application_id: uuid.UUID, vector) -> None:
+    """Add / refresh one applicant in the job's index (no-op if it isn't loaded yet)."""
+    index = _job_indexes.get(job_id)
+    if index is not None and vector is not None:
+        index.upsert((source, application_id), vector)
+
+
+def _query_text(payload: CandidateSearchRequest) -> str:
+    parts = []
+    if payload.query and payload.query.strip():
+        parts.append(payload.query.strip())
+    if payload.skills:
+        parts.append("Skills: " + ", ".join(s.strip() for s in payload.skills if s.strip()))
+    return " ".join(parts)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# POST /api/applications/job/{job_id}/search
+# ─────────────────────────────────────────────────────────────────────────────
+async def search_candidates_service(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+    payload: CandidateSearchRequest,
+    current_user: User,
+) -> CandidateSearchResponse:
+    if current_user.role != UserRole.RECRUITER:
+        raise AppException(ErrorCode.FORBIDDEN, "Only recruiters can search applicants")
+
+    recruiter_profile = getattr(current_user, "recruiter_profile", None)
+    if recruiter_profile is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Recruiter profile not found")
+
+    job = (await db.execute(select(Job).where(Job.id == job_id))).scalar_one_or_none()
+    if job is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Job not found")
+    if job.recruiter_id != recruiter_profile.id:
+        raise AppException(ErrorCode.UNAUTHORIZED_ACCESS, "You are not authorized to search these applications")
+
+    text = _query_text(payload)
+    if not text:
+        raise AppException(ErrorCode.INVALID_INPUT, "Provide a query or at least one skill")
+
+    t0 = time.perf_counter()
+    index = await _get_job_index(db, job_id)
+    if not len(index):
+        return CandidateSearchResponse(hits=[], pool_size=0, took_ms=0.0)
+
+    query_vector = await asyncio.to_thread(encode_query, text)
+    matches = index.index.search(query_vector, k=payload.top_k, min_score=payload.min_similarity)
+    took_ms = round((time.perf_counter() - t0) * 1000, 1)
+
+    # Hydrate only the top-K rows
+    platform_ids = [key[1] for key, _ in matches if key[0] == PLATFORM]
+    external_ids = [key[1] for key, _ in matches if key[0] == EXTERNAL]
+    platform: dict = {}
+    if platform_ids:
+        rows = await db.execute(
+            select(JobApplication, CandidateProfile.full_name)
+            .join(CandidateProfile, CandidateProfile.id == JobApplication.candidate_id)
+            .where(JobApplication.id.in_(platform_ids))
+        )
+        platform = {app.id: (app, name) for app, name in rows.all()}
+    external: dict = {}
+    if external_ids:
+        rows = await db.execute(
+            select(ExternalApplication).where(ExternalApplication.id.in_(external_ids))
+        )
+        external = {ext.id: ext for ext in rows.scalars().all()}
+
+    hits: list[CandidateSearchHit] = []
+    for (source, app_id), similarity in matches:
+        if source == PLATFORM and app_id in platform:
+            app, name = platform[app_id]
+            hits.append(CandidateSearchHit(
+                application_id=app_id, source=source, candidate_name=name,
+                status=app.status.value, ai_score=app.ai_score, similarity=round(similarity, 4),
+            ))
+        elif source == EXTERNAL and app_id in external:
+            ext = external[app_id]
+            hits.append(CandidateSearchHit(
+                application_id=app_id, source=source, candidate_name=ext.candidate_name,
+                status=ext.status.value, ai_score=ext.ai_score, similarity=round(similarity, 4),
+            ))
+
+    return CandidateSearchResponse(hits=hits, pool_size=len(index), took_ms=took_ms)
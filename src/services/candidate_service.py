@@ -3,6 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import CandidateProfile
 from src.schema.candidate_schema import UpdateCandidateSchema
+from src.services.dashboard_cache_service import CANDIDATE, invalidate_dashboard
+from src.services.identity_cache_service import invalidate_identity
 
 
 async def get_candidate_by_id(db: AsyncSession, candidate_id: str):
@@ -29,5 +31,7 @@ async def update_candidate_profile(db: AsyncSession, candidate_profile_id: str,
 
     await db.commit()
     await db.refresh(candidate)
+    await invalidate_dashboard(CANDIDATE, candidate.id)
+    await invalidate_identity(candidate.user_id)
 
     return candidate
@@ -0,0 +1,184 @@
+"""
+Dashboard response cache
+========================
+Serialized dashboard responses are cached per owner (recruiter profile or
+candidate profile) and served with an ETag, so a client polling an
+unchanged dashboard gets ``304 Not Modified``.
+
+* ``MemoryCacheBackend`` — in-process LRU with TTL (default).
+* ``RedisCacheBackend`` — shared across workers (DASHBOARD_CACHE_BACKEND=redis,
+  needs the ``redis`` package).
+
+Every owner has a generation token stored next to the entries, and the
+entry key includes it. The services that change dashboard data call
+``invalidate_dashboard`` after their commit; it replaces the token, so a
+response computed concurrently from pre-commit data is stored under the old
+token and never served.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+_DASHBOARD_CACHE_BACKEND = os.getenv("DASHBOARD_CACHE_BACKEND", "memory").strip().lower()
+_DASHBOARD_CACHE_URL = os.getenv("DASHBOARD_CACHE_URL", "redis://localhost:6379/0")
+_DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "300"))
+_DASHBOARD_CACHE_SIZE = int(os.getenv("DASHBOARD_CACHE_SIZE", "4096"))
+
+RECRUITER = "recruiter"
+CANDIDATE = "candidate"
+
+_stats = {"hits": 0, "misses": 0, "not_modified": 0, "invalidations": 0}
+
+
+# ─── Backends ─────────────────────────────────────────────────────────────────
+
+class CacheBackend:
+    """Async byte cache. Implementations must be safe to call concurrently."""
+
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, maxsize: int, default_ttl: float | None = None):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        self._entries[key] = (value, time.monotonic() + ttl if ttl else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis  # noqa: optional dependency
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis cache backend needs the 'redis' package: pip install 'backend[redis]'"
+            ) from e
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        await self._client.set(key, value, px=int(ttl * 1000) if ttl else None)
+
+
+_cache: CacheBackend | None = None
+
+
+def get_dashboard_cache() -> CacheBackend:
+    global _cache
+    if _cache is None:
+        if _DASHBOARD_CACHE_BACKEND == "redis":
+            _cache = RedisCacheBackend(_DASHBOARD_CACHE_URL)
+        else:
+            _cache = MemoryCacheBackend(_DASHBOARD_CACHE_SIZE, _DASHBOARD_CACHE_TTL)
+    return _cache
+
+
+def set_dashboard_cache(backend: CacheBackend) -> None:
+    """Swap the active backend (tests / benchmarks)."""
+    global _cache
+    _cache = backend
+
+
+# ─── Public API ───────────────────────────────────────────────────────────────
+
+def _generation_key(kind: str, owner_id: uuid.UUID) -> str:
+    return f"dashboard:{kind}:{owner_id}:generation"
+
+
+async def invalidate_dashboard(kind: str, *owner_ids: uuid.UUID | None) -> None:
+    """Drop the cached dashboards of ``owner_ids``. Call after the change commits."""
+    cache = get_dashboard_cache()
+    for owner_id in {o for o in owner_ids if o is not None}:
+        try:
+            await cache.set(_generation_key(kind, owner_id), uuid.uuid4().hex.encode())
+            _stats["invalidations"] += 1
+        except Exception as e:
+            print(f"[CACHE] Invalidation failed for {kind} {owner_id}: {e}")
+
+
+async def cached_dashboard(
+    kind: str,
+    owner_id: uuid.UUID,
+    build: Callable[[], Awaitable[BaseModel]],
+) -> tuple[bytes, str]:
+    """(JSON body, ETag) of an owner's dashboard, built with ``build()`` on a miss."""
+    cache = get_dashboard_cache()
+    generation_key = _generation_key(kind, owner_id)
+    try:
+        generation = await cache.get(generation_key)
+        if generation is None:
+            generation = uuid.uuid4().hex.encode()
+            await cache.set(generation_key, generation)
+        key = f"dashboard:{kind}:{owner_id}:{generation.decode()}"
+        cached = await cache.get(key)
+    except Exception as e:
+        print(f"[CACHE] Dashboard cache unavailable: {e}")
+        key = cached = None
+
+    if cached is not None:
+        _stats["hits"] += 1
+        etag, _, body = cached.partition(b"\n")
+        return body, etag.decode()
+
+    _stats["misses"] += 1
+    body = (await build()).model_dump_json().encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    if key is not None:
+        try:
+            await cache.set(key, etag.encode() + b"\n" + body, _DASHBOARD_CACHE_TTL)
+        except Exception as e:
+            print(f"[CACHE] Could not store dashboard: {e}")
+    return body, etag
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def dashboard_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        _stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def dashboard_cache_stats() -> dict:
+    return dict(_stats)
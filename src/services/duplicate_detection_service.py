@@ -0,0 +1,109 @@
+"""
+Near-duplicate resume detection
+===============================
+Each external application stores a MinHash signature of its extracted text.
+A per-job LSH index (built lazily from the database and kept in memory) finds
+earlier applications whose estimated Jaccard similarity is above
+NEAR_DUPLICATE_THRESHOLD, so a re-uploaded CV can reuse the original's AI
+analysis instead of running the pipeline again. Duplicates also take the
+original's profile vector, so they still show up in candidate search.
+"""
+
+import os
+import time
+import uuid
+from collections import OrderedDict
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.external_application_model import ExternalApplication
+from src.services.skill_index_service import analysis_values, set_analysis
+from src.utils.minhash import MinHashLSH
+
+_NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.85"))
+_INDEX_CACHE_SIZE = int(os.getenv("NEAR_DUPLICATE_INDEX_CACHE_SIZE", "256"))
+# Other workers insert rows too; reload a job's index from the DB after this long
+_INDEX_TTL_SECONDS = float(os.getenv("NEAR_DUPLICATE_INDEX_TTL_SECONDS", "300"))
+
+
+class _JobIndex:
+    def __init__(self):
+        self.lsh = MinHashLSH()
+        self.loaded_at = time.monotonic()
+
+
+_job_indexes: "OrderedDict[uuid.UUID, _JobIndex]" = OrderedDict()
+
+
+async def _get_job_index(db: AsyncSession, job_id: uuid.UUID) -> _JobIndex:
+    index = _job_indexes.get(job_id)
+    if index is not None and time.monotonic() - index.loaded_at < _INDEX_TTL_SECONDS:
+        _job_indexes.move_to_end(job_id)
+        return index
+
+    # Only originals go into the index — duplicates point at them
+    result = await db.execute(
+        select(ExternalApplication.id, ExternalApplication.resume_minhash).where(
+            ExternalApplication.job_id == job_id,
+            ExternalApplication.resume_minhash.is_not(None),
+            ExternalApplication.duplicate_of_id.is_(None),
+        )
+    )
+    index = _JobIndex()
+    for app_id, signature in result.all():
+        index.lsh.insert(app_id, signature)
+
+    _job_indexes[job_id] = index
+    _job_indexes.move_to_end(job_id)
+    while len(_job_indexes) > _INDEX_CACHE_SIZE:
+        _job_indexes.popitem(last=False)
+    return index
+
+
+async def find_near_duplicate(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+    signature: list[int] | None,
+) -> tuple[uuid.UUID, float] | None:
+    """Return (original_application_id, similarity) for the closest match, if any."""
+    if not signature:
+        return None
+    index = await _get_job_index(db, job_id)
+    matches = index.lsh.query(signature, _NEAR_DUPLICATE_THRESHOLD)
+    return matches[0] if matches else None
+
+
+def register_signature(job_id: uuid.UUID, app_id: uuid.UUID, signature: list[int] | None) -> None:
+    """Add a freshly inserted original to the job's index (no-op if not loaded)."""
+    index = _job_indexes.get(job_id)
+    if index is not None and signature:
+        index.lsh.insert(app_id, signature)
+
+
+def unregister_signature(job_id: uuid.UUID, app_id: uuid.UUID) -> None:
+    index = _job_indexes.get(job_id)
+    if index is not None:
+        index.lsh.remove(app_id)
+
+
+def copy_analysis(target: ExternalApplication, original: ExternalApplication) -> None:
+    set_analysis(target, original.ai_score, original.ai_analysis, original.ai_scored_at)
+    target.resume_embedding = original.resume_embedding
+
+
+async def propagate_analysis_to_duplicates(
+    db: AsyncSession,
+    original: ExternalApplication,
+) -> list[uuid.UUID]:
+    """Mirror a freshly scored original (analysis and vector) onto every row flagged as its duplicate."""
+    result = await db.execute(
+        update(ExternalApplication)
+        .where(ExternalApplication.duplicate_of_id == original.id)
+        .values(
+            **analysis_values(original.ai_score, original.ai_analysis, original.ai_scored_at),
+            resume_embedding=original.resume_embedding,
+        )
+        .returning(ExternalApplication.id)
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,131 @@
+"""
+Email outbox
+============
+Request handlers do not talk to SMTP. They add an ``email_outbox`` row in
+the same transaction as the change that triggers the email, commit, and
+call ``wake_email_sender``. The response therefore never waits for
+STARTTLS / login / delivery, and an email is queued if and only if its
+transaction commits.
+
+``run_email_outbox_sender`` (started from the app lifespan) claims due rows
+with ``FOR UPDATE SKIP LOCKED``, so several app workers can run it without
+sending twice, and sends each batch over one SMTP connection. Sent rows are
+deleted. Failed rows are retried with exponential backoff and marked FAILED
+after ``EMAIL_OUTBOX_MAX_ATTEMPTS``; their body (which may hold an OTP) is
+cleared then.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.email_outbox_model import EmailOutbox, EmailOutboxStatus
+from src.utils.email_service import send_emails_sync
+from src.utils.email_templates import verification_email_template
+
+_POLL_SECONDS = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "5"))
+_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+_RETRY_SECONDS = float(os.getenv("EMAIL_OUTBOX_RETRY_SECONDS", "30"))
+
+_stats = {"sent": 0, "retried": 0, "gave_up": 0, "batches": 0, "last_batch_ms": None}
+
+_wake: asyncio.Event | None = None
+
+
+# ─── Enqueue ──────────────────────────────────────────────────────────────────
+
+def enqueue_email(db: AsyncSession, to: str, subject: str, html: str) -> None:
+    """Queue an email; it is sent only if the caller's transaction commits."""
+    db.add(EmailOutbox(to_address=to, subject=subject, html=html))
+
+
+def queue_verification_email(db: AsyncSession, email: str, token: str) -> None:
+    enqueue_email(db, email, "Verify your ResumeEZ account", verification_email_template(token))
+
+
+def wake_email_sender() -> None:
+    """Send queued emails now instead of at the next poll. Call after commit."""
+    if _wake is not None:
+        _wake.set()
+
+
+# ─── Sender ───────────────────────────────────────────────────────────────────
+
+async def send_pending_emails(db: AsyncSession) -> int:
+    """Send one batch of due emails. Returns the number of rows processed."""
+    now = datetime.now(timezone.utc)
+    rows = (await db.execute(
+        select(EmailOutbox)
+        .where(EmailOutbox.status == EmailOutboxStatus.PENDING.value, EmailOutbox.next_attempt_at <= now)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )).scalars().all()
+    if not rows:
+        return 0
+
+    t0 = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    try:
+        errors = await loop.run_in_executor(
+            None, send_emails_sync, [(row.to_address, row.subject, row.html) for row in rows],
+        )
+    except Exception as e:
+        # Could not connect: nothing in the batch was sent
+        errors = [str(e)] * len(rows)
+
+    for row, error in zip(rows, errors):
+        if error is None:
+            await db.delete(row)
+            _stats["sent"] += 1
+            continue
+        row.attempts += 1
+        row.last_error = error
+        if row.attempts >= _MAX_ATTEMPTS:
+            row.status = EmailOutboxStatus.FAILED.value
+            row.html = ""
+            _stats["gave_up"] += 1
+            print(f"[EMAIL] Giving up on {row.to_address} after {row.attempts} attempts: {error}")
+        else:
+            row.next_attempt_at = now + timedelta(seconds=_RETRY_SECONDS * 2 ** (row.attempts - 1))
+            _stats["retried"] += 1
+    await db.commit()
+
+    _stats["batches"] += 1
+    _stats["last_batch_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return len(rows)
+
+
+async def run_email_outbox_sender() -> None:
+    """Background loop (started from the app lifespan) draining the outbox."""
+    global _wake
+    from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
+    _wake = asyncio.Event()
+    while True:
+        _wake.clear()
+        try:
+            async with AsyncSessionLocal() as session:
+                while await send_pending_emails(session):
+                    pass
+        except Exception as e:
+            print(f"[EMAIL] Outbox sender failed: {e}")
+        try:
+            await asyncio.wait_for(_wake.wait(), _POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def email_outbox_metrics(db: AsyncSession) -> dict:
+    counts = dict((await db.execute(
+        select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+    )).all())
+    return {
+        **_stats,
+        "pending": counts.get(EmailOutboxStatus.PENDING.value, 0),
+        "failed": counts.get(EmailOutboxStatus.FAILED.value, 0),
+    }
@@ -1,12 +1,15 @@
 import asyncio
+import os
+import time
 import uuid
-from uuid import uuid4
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import partial
 
 from fastapi import UploadFile
-from sqlalchemy import select
+from sqlalchemy import func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config.supabase_config import supabase
 from src.models.external_application_model import ExternalApplication, ExternalApplicationStatus
 from src.models.job_model import Job
 from src.models.user_model import User, UserRole
@@ -16,10 +19,89 @@ from src.schema.external_application_schema import (
     BulkUploadResultItem,
     BulkUploadResponse,
 )
+from src.services.storage_service import (
+    StorageError,
+    StoredObject,
+    UploadPayload,
+    UploadTooLargeError,
+    read_upload,
+    store_payload,
+    store_upload,
+)
+from src.services.duplicate_detection_service import (
+    copy_analysis,
+    find_near_duplicate,
+    propagate_analysis_to_duplicates,
+    register_signature,
+    unregister_signature,
+)
+from src.services.dashboard_cache_service import RECRUITER, invalidate_dashboard
+from src.services.recruiter_stats_service import record_applications, record_status_changes
+from src.services.skill_index_service import analysis_values, set_analysis
+from src.services.text_extraction_service import extract_text, TextExtractionError
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
+from src.utils.minhash import minhash_signature
+from src.utils.task_queue import BoundedTaskQueue
+from src.utils.vector_index import from_bytes
+
+STORAGE_PREFIX = "external"
+
+_BULK_UPLOAD_CONCURRENCY = int(os.getenv("BULK_UPLOAD_CONCURRENCY", "8"))
+# Files extracted at once; more than the extraction workers would only queue
+_EXTRACTION_CONCURRENCY = int(os.getenv("TEXT_EXTRACTION_WORKERS", "2"))
+
+# Auto-scoring runs the full AI pipeline; keep the number in flight bounded
+_scoring_queue = BoundedTaskQueue(
+    "auto-score",
+    workers=int(os.getenv("AUTO_SCORE_WORKERS", "2")),
+    maxsize=int(os.getenv("AUTO_SCORE_QUEUE_SIZE", "200")),
+)
+# Uploads the queue had no room for are picked up by run_deferred_scoring;
+# so are rows whose claim is older than the timeout (their process died)
+_DEFERRED_POLL_SECONDS = float(os.getenv("AUTO_SCORE_POLL_SECONDS", "30"))
+_SCORING_CLAIM_TIMEOUT_MINUTES = float(os.getenv("AUTO_SCORE_CLAIM_TIMEOUT_MINUTES", "60"))
+
+
+def _index_duplicates(job_id: uuid.UUID, apps: list[ExternalApplication]) -> None:
+    """Add near-duplicates that inherited their original's vector to candidate search."""
+    from src.services.candidate_search_service import EXTERNAL, index_applicant
+    for app in apps:
+        if app.duplicate_of_id is not None and app.resume_embedding is not None:
+            index_applicant(job_id, EXTERNAL, app.id, from_bytes(app.resume_embedding))
 
-BUCKET_NAME = "document"
+
+def _queue_scoring(
+    external_app_id: uuid.UUID,
+    job_id: uuid.UUID,
+    resume_url: str,
+    resume_filename: str,
+    notes: str | None,
+    resume_text: str | None = None,
+) -> bool:
+    """Queue auto-scoring without waiting; False when the queue is full."""
+    return _scoring_queue.submit_nowait(
+        partial(
+            _score_external_application_bg,
+            external_app_id=external_app_id,
+            job_id=job_id,
+            resume_url=resume_url,
+            resume_filename=resume_filename,
+            notes=notes,
+            resume_text=resume_text,
+        )
+    )
+
+
+async def _release_scoring_claims(db: AsyncSession, app_ids: list[uuid.UUID]) -> None:
+    """Hand rows the queue had no room for over to the deferred-scoring poller."""
+    await db.execute(
+        update(ExternalApplication)
+        .where(ExternalApplication.id.in_(app_ids))
+        .values(scoring_queued_at=None, updated_at=ExternalApplication.updated_at)   # bookkeeping, not an edit
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
 
 
 def _get_recruiter_profile(current_user: User):
@@ -29,24 +111,23 @@ def _get_recruiter_profile(current_user: User):
     return profile
 
 
-async def _upload_file_to_supabase(file: UploadFile) -> tuple[str, str]:
-    """Upload file to Supabase and return (url, original_filename)."""
-    file_ext = (file.filename or "resume").rsplit(".", 1)[-1]
-    unique_filename = f"external/{uuid4().hex}.{file_ext}"
-
-    file_content = await file.read()
-    await file.seek(0)
-
+async def _upload_resume_file(file: UploadFile) -> tuple[UploadPayload, StoredObject]:
+    """Upload file to storage and return the read payload and the stored object."""
     try:
-        supabase.storage.from_(BUCKET_NAME).upload(unique_filename, file_content)
-        public_url = supabase.storage.from_(BUCKET_NAME).get_public_url(unique_filename)
-    except Exception as e:
-        raise AppException(ErrorCode.INTERNAL_ERROR, f"File upload failed: {e}")
+        return await store_upload(file, prefix=STORAGE_PREFIX)
+    except UploadTooLargeError as e:
+        raise AppException(ErrorCode.FILE_TOO_LARGE, str(e))
+    except StorageError as e:
+        raise AppException(ErrorCode.UPLOAD_FAILED, f"File upload failed: {e}")
 
-    if not public_url:
-        raise AppException(ErrorCode.INTERNAL_ERROR, "Failed to get public URL from storage")
 
-    return public_url, file.filename or unique_filename
+async def _extract_resume_text(upload: UploadPayload, filename: str) -> str | None:
+    """Extract resume text at ingestion; None when the file cannot be parsed."""
+    try:
+        return await extract_text(upload.content, filename.lower(), separator=" ")
+    except TextExtractionError as e:
+        print(f"[EXTRACT] {filename}: {e}")
+        return None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -73,7 +154,13 @@ async def upload_external_application_service(
         raise AppException(ErrorCode.UNAUTHORIZED_ACCESS, "You are not authorized to upload resumes for this job")
 
     # Upload file
-    resume_url, original_filename = await _upload_file_to_supabase(file)
+    upload, stored = await _upload_resume_file(file)
+    resume_url = stored.url
+    original_filename = file.filename or stored.key
+
+    resume_text = await _extract_resume_text(upload, original_filename)
+    signature = minhash_signature(resume_text) if resume_text else None
+    near_duplicate = await find_near_duplicate(db, job_id, signature)
 
     external_app = ExternalApplication(
         job_id=job_id,
@@ -82,66 +169,182 @@ async def upload_external_application_service(
         source=payload.source,
         resume_file_url=resume_url,
         resume_filename=original_filename,
+        resume_sha256=upload.sha256,
+        resume_minhash=signature,
         notes=payload.notes,
+        scoring_queued_at=None if near_duplicate is not None else datetime.now(timezone.utc),
     )
 
+    if near_duplicate is not None:
+        original_id, similarity = near_duplicate
+        external_app.duplicate_of_id = original_id
+        external_app.duplicate_similarity = similarity
+        original = await db.get(ExternalApplication, original_id)
+        if original is not None:
+            copy_analysis(external_app, original)
+
     db.add(external_app)
+    await record_applications(db, job.recruiter_id, [external_app])
     await db.commit()
     await db.refresh(external_app)
+    await invalidate_dashboard(RECRUITER, job.recruiter_id)
 
-    # Auto-score in background
-    asyncio.create_task(
-        _score_external_application_bg(
-            external_app_id=external_app.id,
-            job_description=job.description,
-            resume_url=resume_url,
-            resume_filename=original_filename,
-            notes=payload.notes,
-        )
-    )
+    if near_duplicate is not None:
+        # Reuses the original's analysis and vector (now, or once the original is scored)
+        _index_duplicates(job_id, [external_app])
+        return external_app
+
+    register_signature(job_id, external_app.id, signature)
+
+    # Auto-score in background; a full queue defers it to the poller
+    if not _queue_scoring(external_app.id, job.id, resume_url, original_filename, payload.notes, resume_text):
+        await _release_scoring_claims(db, [external_app.id])
+        external_app.scoring_queued_at = None
+        print(f"[AUTO-SCORE] Queue full — scoring of {external_app.id} deferred")
 
     return external_app
 
 
 async def _score_external_application_bg(
     external_app_id: uuid.UUID,
-    job_description: str,
+    job_id: uuid.UUID,
     resume_url: str,
     resume_filename: str,
     notes: str | None,
+    resume_text: str | None = None,
 ) -> None:
-    """Download resume, run AI pipeline, persist scores."""
+    """Download resume (unless its text is already known), run AI pipeline, persist scores."""
     from src.config.db import AsyncSessionLocal
-    from datetime import datetime, timezone
     from src.services.application_service import _extract_text_from_url, _pipeline_result_to_analysis_schema
-    from src.services.ai_pipeline_service import run_pipeline
+    from src.services.ai_pipeline_service import build_resume_features, run_pipeline
+    from src.services.candidate_search_service import EXTERNAL, index_applicant
+    from src.services.job_feature_service import get_job_features
+    from src.utils.vector_index import to_bytes
     try:
-        text = await _extract_text_from_url(resume_url, resume_filename)
+        text = resume_text
+        if not text:
+            text = await _extract_text_from_url(resume_url, resume_filename)
         if notes:
             text = f"{text} {notes}"
-        pipeline_result = await run_pipeline(
-            jd_text=job_description,
+        resume_features = await build_resume_features(
             resume_text=text if text.strip() else None,
+            with_embeddings=True,
+        )
+        # Read the inputs in a short session; no connection is held during inference
+        async with AsyncSessionLocal() as session:
+            job = await session.get(Job, job_id)
+            if job is None:
+                return
+            job_features = await get_job_features(session, job)
+            await session.commit()      # features built on a miss
+
+        pipeline_result = await run_pipeline(
+            jd_text=job.description,
+            resume_features=resume_features,
+            job_features=job_features,
         )
-        from src.schema.application_schema import ApplicationAnalysisSchema
         analysis = _pipeline_result_to_analysis_schema(pipeline_result)
+
         async with AsyncSessionLocal() as session:
             result = await session.execute(
                 select(ExternalApplication).where(ExternalApplication.id == external_app_id)
             )
             ext_app = result.scalar_one_or_none()
             if ext_app:
-                ext_app.ai_score = pipeline_result.ats_score
-                ext_app.ai_analysis = analysis.model_dump()
-                ext_app.ai_scored_at = datetime.now(timezone.utc)
+                set_analysis(ext_app, pipeline_result.ats_score, analysis.model_dump(), datetime.now(timezone.utc))
+                if resume_features.profile_embedding is not None:
+                    ext_app.resume_embedding = to_bytes(resume_features.profile_embedding)
+                duplicate_ids = await propagate_analysis_to_duplicates(session, ext_app)
                 await session.commit()
+                for app_id in [external_app_id, *duplicate_ids]:
+                    index_applicant(job_id, EXTERNAL, app_id, resume_features.profile_embedding)
     except Exception as e:
         print(f"[AUTO-SCORE] External application {external_app_id} failed: {e}")
 
 
+async def queue_deferred_scoring(db: AsyncSession) -> int:
+    """
+    Claim unscored originals nobody is scoring (deferred on a full queue, or
+    claimed by a process that died) and queue as many as the queue has room
+    for. SKIP LOCKED keeps several app workers from claiming the same row.
+    """
+    free = _scoring_queue.free_slots
+    if free <= 0:
+        return 0
+    stale = datetime.now(timezone.utc) - timedelta(minutes=_SCORING_CLAIM_TIMEOUT_MINUTES)
+    claimable = (
+        select(ExternalApplication.id)
+        .where(
+            ExternalApplication.ai_scored_at.is_(None),
+            ExternalApplication.duplicate_of_id.is_(None),
+            or_(ExternalApplication.scoring_queued_at.is_(None), ExternalApplication.scoring_queued_at < stale),
+        )
+        .order_by(ExternalApplication.uploaded_at)
+        .limit(free)
+        .with_for_update(skip_locked=True)
+    )
+    rows = (await db.execute(
+        update(ExternalApplication)
+        .where(ExternalApplication.id.in_(claimable.scalar_subquery()))
+        .values(scoring_queued_at=func.now(), updated_at=ExternalApplication.updated_at)
+        .returning(
+            ExternalApplication.id,
+            ExternalApplication.job_id,
+            ExternalApplication.resume_file_url,
+            ExternalApplication.resume_filename,
+            ExternalApplication.notes,
+        )
+        .execution_options(synchronize_session=False)
+    )).all()
+    await db.commit()
+
+    rejected = [
+        row.id for row in rows
+        if not _queue_scoring(row.id, row.job_id, row.resume_file_url, row.resume_filename, row.notes)
+    ]
+    if rejected:
+        await _release_scoring_claims(db, rejected)
+    return len(rows) - len(rejected)
+
+
+async def run_deferred_scoring() -> None:
+    """Background loop (started from the app lifespan) feeding deferred uploads to the scoring queue."""
+    from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
+    while True:
+        await asyncio.sleep(_DEFERRED_POLL_SECONDS)
+        try:
+            async with AsyncSessionLocal() as session:
+                queued = await queue_deferred_scoring(session)
+            if queued:
+                print(f"[AUTO-SCORE] Queued {queued} deferred external applications")
+        except Exception as e:
+            print(f"[AUTO-SCORE] Deferred scoring poll failed: {e}")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # POST /api/applications/job/{job_id}/external/bulk
 # ─────────────────────────────────────────────────────────────────────────────
+@dataclass
+class _BulkItem:
+    index: int
+    result: BulkUploadResultItem
+    candidate_name: str
+    payload: UploadPayload | None = None
+    resume_url: str | None = None
+    resume_text: str | None = None
+    app_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    signature: list[int] | None = None
+    near_duplicate: tuple[uuid.UUID, float] | None = None
+
+    def advance(self, stage: str) -> None:
+        self.result.stages.append(stage)
+
+    def fail(self, error: str) -> None:
+        self.result.success = False
+        self.result.status = "failed"
+        self.result.error = error
+
+
 async def bulk_upload_external_applications_service(
     db: AsyncSession,
     job_id: uuid.UUID,
@@ -163,12 +366,16 @@ async def bulk_upload_external_applications_service(
     if job.recruiter_id != recruiter_profile.id:
         raise AppException(ErrorCode.UNAUTHORIZED_ACCESS, "You are not authorized to upload resumes for this job")
 
-    results: list[BulkUploadResultItem] = []
+    timings: dict[str, float] = {}
+    stage_start = time.perf_counter()
 
-    # ── Phase 1: upload files to Supabase (independent, no DB involved) ───────
-    # Collect (candidate_name, resume_url, original_filename) for successes
-    upload_successes: list[tuple[str, str, str]] = []  # (name, url, filename)
+    def _mark(stage: str) -> None:
+        nonlocal stage_start
+        now = time.perf_counter()
+        timings[stage] = round((now - stage_start) * 1000, 1)
+        stage_start = now
 
+    items: list[_BulkItem] = []
     for idx, file in enumerate(files):
         raw_filename = file.filename or f"resume_{idx + 1}"
         candidate_name = (
@@ -176,65 +383,186 @@ async def bulk_upload_external_applications_service(
             if idx < len(candidate_names) and candidate_names[idx].strip()
             else raw_filename.rsplit(".", 1)[0]
         )
-        try:
-            resume_url, original_filename = await _upload_file_to_supabase(file)
-            upload_successes.append((candidate_name, resume_url, original_filename))
-            results.append(BulkUploadResultItem(filename=raw_filename, success=True))
-        except Exception as e:
-            results.append(BulkUploadResultItem(filename=raw_filename, success=False, error=str(e)))
-
-    if not upload_successes:
-        return BulkUploadResponse(results=results, uploaded_count=0, failed_count=len(results))
-
-    # ── Phase 2: insert all successful uploads in a single DB transaction ─────
-    new_apps: list[ExternalApplication] = []
-    for candidate_name, resume_url, original_filename in upload_successes:
-        ext_app = ExternalApplication(
-            job_id=job_id,
+        items.append(_BulkItem(
+            index=idx,
+            result=BulkUploadResultItem(filename=raw_filename, success=True),
             candidate_name=candidate_name,
-            source=source,
-            resume_file_url=resume_url,
-            resume_filename=original_filename,
-            notes=notes,
-        )
-        db.add(ext_app)
-        new_apps.append(ext_app)
+        ))
 
-    try:
-        await db.commit()
-        for ext_app in new_apps:
-            await db.refresh(ext_app)
-    except Exception as e:
-        await db.rollback()
-        # Mark all previously-successful results as failed
-        commit_error = f"Database commit failed: {e}"
-        success_idx = 0
-        for r in results:
-            if r.success:
-                r.success = False
-                r.error = commit_error
-                success_idx += 1
-        return BulkUploadResponse(results=results, uploaded_count=0, failed_count=len(results))
-
-    # Attach DB records to their corresponding result items and kick off auto-scoring
-    app_iter = iter(new_apps)
-    for r in results:
-        if r.success:
-            ext_app = next(app_iter)
-            r.data = ExternalApplicationResponse.model_validate(ext_app)
-            asyncio.create_task(
-                _score_external_application_bg(
-                    external_app_id=ext_app.id,
-                    job_description=job.description,
-                    resume_url=ext_app.resume_file_url,
-                    resume_filename=ext_app.resume_filename,
-                    notes=notes,
-                )
+    # ── Stage 1: chunked read + content hash ─────────────────────────────────
+    for item, file in zip(items, files):
+        try:
+            item.payload = await read_upload(file)
+            item.result.content_hash = item.payload.sha256
+            item.advance("read")
+        except StorageError as e:
+            item.fail(str(e))
+    _mark("read")
+
+    # ── Stage 2: dedupe by content hash (within the batch and for this job) ──
+    hashes = {item.payload.sha256 for item in items if item.payload is not None}
+    existing_by_hash: dict[str, ExternalApplication] = {}
+    if hashes:
+        existing = await db.execute(
+            select(ExternalApplication).where(
+                ExternalApplication.job_id == job_id,
+                ExternalApplication.resume_sha256.in_(hashes),
             )
+        )
+        for ext_app in existing.scalars():
+            existing_by_hash.setdefault(ext_app.resume_sha256, ext_app)
+
+    unique: list[_BulkItem] = []
+    first_in_batch: dict[str, _BulkItem] = {}
+    batch_duplicates: list[tuple[_BulkItem, _BulkItem]] = []
+    for item in items:
+        if item.payload is None:
+            continue
+        sha = item.payload.sha256
+        if sha in existing_by_hash:
+            original = existing_by_hash[sha]
+            item.result.status = "duplicate"
+            item.result.duplicate_of = original.id
+            item.result.data = ExternalApplicationResponse.model_validate(original)
+        elif sha in first_in_batch:
+            item.result.status = "duplicate"
+            batch_duplicates.append((item, first_in_batch[sha]))
+        else:
+            first_in_batch[sha] = item
+            unique.append(item)
+        item.advance("deduped")
+    _mark("dedupe")
+
+    # ── Stage 3: upload + extract, both bounded, per file in parallel ────────
+    upload_semaphore = asyncio.Semaphore(_BULK_UPLOAD_CONCURRENCY)
+    extract_semaphore = asyncio.Semaphore(max(1, _EXTRACTION_CONCURRENCY))
+
+    async def _upload_and_extract(item: _BulkItem) -> None:
+        try:
+            async with upload_semaphore:
+                stored = await store_payload(item.payload, prefix=STORAGE_PREFIX)
+            item.resume_url = stored.url
+            item.advance("uploaded")
+        except StorageError as e:
+            item.fail(f"File upload failed: {e}")
+            return
+        # Extraction failure is not fatal — the scorer falls back to downloading the file
+        async with extract_semaphore:
+            item.resume_text = await _extract_resume_text(item.payload, item.result.filename)
+        if item.resume_text:
+            item.advance("extracted")
+
+    await asyncio.gather(*(_upload_and_extract(item) for item in unique))
+    _mark("upload_extract")
+
+    # ── Stage 3b: near-duplicate check (MinHash / LSH over extracted text) ───
+    for item in unique:
+        if not item.result.success or not item.resume_text:
+            continue
+        item.signature = minhash_signature(item.resume_text)
+        item.near_duplicate = await find_near_duplicate(db, job_id, item.signature)
+        if item.near_duplicate is None:
+            # Later files in this batch can match it before it is inserted
+            register_signature(job_id, item.app_id, item.signature)
+        else:
+            item.result.status = "near_duplicate"
+            item.result.duplicate_of = item.near_duplicate[0]
+
+    original_ids = {item.near_duplicate[0] for item in unique if item.near_duplicate}
+    originals: dict[uuid.UUID, ExternalApplication] = {}
+    if original_ids:
+        original_result = await db.execute(
+            select(ExternalApplication).where(ExternalApplication.id.in_(original_ids))
+        )
+        originals = {o.id: o for o in original_result.scalars()}
+    _mark("near_duplicate")
 
-    uploaded = sum(1 for r in results if r.success)
-    failed = len(results) - uploaded
-    return BulkUploadResponse(results=results, uploaded_count=uploaded, failed_count=failed)
+    # ── Stage 4: single multi-row INSERT ... RETURNING ───────────────────────
+    to_insert = [item for item in unique if item.result.success]
+    new_apps: list[ExternalApplication] = []
+    if to_insert:
+        rows = []
+        for item in to_insert:
+            row = {
+                "id": item.app_id,
+                "job_id": job_id,
+                "candidate_name": item.candidate_name,
+                "source": source,
+                "resume_file_url": item.resume_url,
+                "resume_filename": item.result.filename,
+                "resume_sha256": item.payload.sha256,
+                "resume_minhash": item.signature,
+                "notes": notes,
+                "scoring_queued_at": None if item.near_duplicate is not None else datetime.now(timezone.utc),
+            }
+            if item.near_duplicate is not None:
+                original = originals.get(item.near_duplicate[0])
+                row["duplicate_of_id"] = item.near_duplicate[0]
+                row["duplicate_similarity"] = item.near_duplicate[1]
+                if original is not None:
+                    row.update(analysis_values(original.ai_score, original.ai_analysis, original.ai_scored_at))
+                    row["resume_embedding"] = original.resume_embedding
+                else:
+                    row.update(analysis_values(None, None, None))
+            rows.append(row)
+        try:
+            inserted = await db.scalars(
+                insert(ExternalApplication).returning(ExternalApplication, sort_by_parameter_order=True),
+                rows,
+            )
+            new_apps = list(inserted)
+            await record_applications(db, job.recruiter_id, new_apps)
+            await db.commit()
+            await invalidate_dashboard(RECRUITER, job.recruiter_id)
+            _index_duplicates(job_id, new_apps)
+        except Exception as e:
+            await db.rollback()
+            for item in to_insert:
+                item.fail(f"Database commit failed: {e}")
+                unregister_signature(job_id, item.app_id)
+            new_apps = []
+
+    for item, ext_app in zip(to_insert, new_apps):
+        item.result.data = ExternalApplicationResponse.model_validate(ext_app)
+        item.advance("inserted")
+    for item, original in batch_duplicates:
+        if original.result.data is not None:
+            item.result.duplicate_of = original.result.data.id
+            item.result.data = original.result.data
+        else:
+            item.fail(original.result.error or "Original upload failed")
+    _mark("insert")
+
+    # ── Stage 5: enqueue scoring (never waits; a full queue defers to the poller)
+    deferred: list[uuid.UUID] = []
+    for item, ext_app in zip(to_insert, new_apps):
+        if item.near_duplicate is not None:
+            # Reuses the original's analysis (now, or once the original is scored)
+            item.advance("linked")
+            continue
+        if _queue_scoring(
+            ext_app.id, job.id, ext_app.resume_file_url, ext_app.resume_filename, notes, item.resume_text,
+        ):
+            item.advance("queued")
+        else:
+            deferred.append(ext_app.id)
+            item.result.status = "scoring_deferred"
+            item.advance("deferred")
+    if deferred:
+        await _release_scoring_claims(db, deferred)
+    _mark("enqueue")
+
+    results = [item.result for item in items]
+    uploaded = sum(1 for r in results if r.success and r.status in ("queued", "scoring_deferred", "near_duplicate"))
+    duplicates = sum(1 for r in results if r.status in ("duplicate", "near_duplicate"))
+    failed = sum(1 for r in results if not r.success)
+    return BulkUploadResponse(
+        results=results,
+        uploaded_count=uploaded,
+        failed_count=failed,
+        duplicate_count=duplicates,
+        stage_timings_ms=timings,
+    )
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -292,9 +620,13 @@ async def update_external_application_status_service(
     if job is None or job.recruiter_id != recruiter_profile.id:
         raise AppException(ErrorCode.UNAUTHORIZED_ACCESS, "Not authorized to update this application")
 
+    old_status = ext_app.status
     ext_app.status = new_status
+    await record_status_changes(db, job.recruiter_id, [(ext_app, old_status)])
     await db.commit()
     await db.refresh(ext_app)
+    if old_status != new_status:
+        await invalidate_dashboard(RECRUITER, job.recruiter_id)
     return ext_app
 
 
@@ -362,8 +694,12 @@ async def bulk_update_external_status_service(
         )
     )
     applications = list(result.scalars().all())
+    changes = []
     for app in applications:
+        changes.append((app, app.status))
         app.status = new_status
 
+    await record_status_changes(db, job.recruiter_id, changes)
     await db.commit()
+    await invalidate_dashboard(RECRUITER, job.recruiter_id)
     return {"updated_count": len(applications), "status": new_status.value}
@@ -0,0 +1,312 @@
+"""
+Authenticated-user cache
+========================
+``get_current_user`` used to run a user query with two ``selectinload``s
+on every authenticated request. Here, the user and their candidate /
+recruiter profile are cached as a column snapshot for
+``IDENTITY_CACHE_TTL_SECONDS``. On a hit, the snapshot is merged into the
+request session without a query (``make_transient_to_detached`` +
+``merge(load=False)``), so routes still get an attached ``User`` they can
+modify and commit.
+
+Entries are keyed by user id and a generation token (same scheme as the
+dashboard cache). ``invalidate_identity`` must run after any commit that
+changes the user or their profiles.
+
+Access tokens carry ``role``, ``cid`` / ``rid`` (candidate / recruiter
+profile ids) and ``tv`` (``users.token_version``). ``get_identity``
+authorizes from these claims and only checks that the token has not been
+revoked. That check reads one cached integer, falling back to a primary-key
+lookup. ``revoke_tokens`` (role change, "log out everywhere") bumps the
+version, which rejects every older token of the user; a plain logout only
+drops the cached entry, so other devices keep their sessions. With the
+in-memory backend, other workers see the new version only once their TTL
+expires.
+"""
+
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+
+from sqlalchemy import DateTime, Enum as SAEnum, Uuid, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.models.candidate_profile_model import CandidateProfile
+from src.models.recruiter_model import RecruiterProfile
+from src.models.user_model import User, UserRole
+from src.services.dashboard_cache_service import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from src.services.user_services import get_user_by_id_service
+from src.utils.error_code import ErrorCode
+from src.utils.exceptions import AppException
+from src.utils.jwt_utils import create_jwt_token
+
+_IDENTITY_CACHE_BACKEND = os.getenv("IDENTITY_CACHE_BACKEND", "memory").strip().lower()
+_IDENTITY_CACHE_URL = os.getenv("IDENTITY_CACHE_URL", "redis://localhost:6379/0")
+_IDENTITY_CACHE_TTL = float(os.getenv("IDENTITY_CACHE_TTL_SECONDS", "60"))
+_IDENTITY_CACHE_SIZE = int(os.getenv("IDENTITY_CACHE_SIZE", "10000"))
+
+# Never cached (only the login flow reads them, from its own query)
+_EXCLUDED_COLUMNS = {"otp_code", "expires_at"}
+
+_stats = {"hits": 0, "misses": 0, "claims_hits": 0, "version_misses": 0, "invalidations": 0, "revocations": 0}
+
+_cache: CacheBackend | None = None
+
+
+def get_identity_cache() -> CacheBackend:
+    global _cache
+    if _cache is None:
+        if _IDENTITY_CACHE_BACKEND == "redis":
+            _cache = RedisCacheBackend(_IDENTITY_CACHE_URL)
+        else:
+            _cache = MemoryCacheBackend(_IDENTITY_CACHE_SIZE, _IDENTITY_CACHE_TTL)
+    return _cache
+
+
+# ─── Snapshots ────────────────────────────────────────────────────────────────
+
+def _dump(instance) -> dict | None:
+    if instance is None:
+        return None
+    return {
+        attr.key: getattr(instance, attr.key)
+        for attr in instance.__mapper__.column_attrs
+        if attr.key not in _EXCLUDED_COLUMNS
+    }
+
+
+def _load(model, values: dict | None):
+    if values is None:
+        return None
+    decoded = {}
+    for attr in model.__mapper__.column_attrs:
+        if attr.key not in values:
+            continue
+        value, column_type = values[attr.key], attr.columns[0].type
+        if value is not None:
+            if isinstance(column_type, SAEnum) and column_type.enum_class is not None:
+                value = column_type.enum_class(value)
+            elif isinstance(column_type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column_type, Uuid):
+                value = uuid.UUID(value)
+        decoded[attr.key] = value
+    return model(**decoded)
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _snapshot(user: User) -> bytes:
+    return json.dumps({
+        "user": _dump(user),
+        "candidate_profile": _dump(user.candidate_profile),
+        "recruiter_profile": _dump(user.recruiter_profile),
+    }, default=_encode).encode()
+
+
+def _restore(snapshot: bytes) -> User:
+    data = json.loads(snapshot)
+    user = _load(User, data["user"])
+    # Set even when None, so the relationship counts as loaded (no lazy load)
+    user.candidate_profile = _load(CandidateProfile, data["candidate_profile"])
+    user.recruiter_profile = _load(RecruiterProfile, data["recruiter_profile"])
+    for instance in (user, user.candidate_profile, user.recruiter_profile):
+        if instance is not None:
+            make_transient_to_detached(instance)
+    return user
+
+
+# ─── Cache ────────────────────────────────────────────────────────────────────
+
+def _generation_key(user_id: uuid.UUID) -> str:
+    return f"identity:{user_id}:generation"
+
+
+def _version_key(user_id: uuid.UUID) -> str:
+    return f"identity:{user_id}:token_version"
+
+
+async def _entry_key(user_id: uuid.UUID) -> str:
+    cache = get_identity_cache()
+    generation = await cache.get(_generation_key(user_id))
+    if generation is None:
+        generation = uuid.uuid4().hex.encode()
+        await cache.set(_generation_key(user_id), generation)
+    return f"identity:{user_id}:{generation.decode()}"
+
+
+async def load_current_user(db: AsyncSession, user_id: uuid.UUID) -> User | None:
+    """The user with both profiles, attached to ``db`` (from the cache when possible)."""
+    try:
+        key = await _entry_key(user_id)
+        snapshot = await get_identity_cache().get(key)
+    except Exception as e:
+        print(f"[IDENTITY] Cache unavailable: {e}")
+        key = snapshot = None
+
+    if snapshot is not None:
+        _stats["hits"] += 1
+        return await db.merge(_restore(snapshot), load=False)
+
+    _stats["misses"] += 1
+    user = await get_user_by_id_service(db, user_id)
+    if user is not None and key is not None:
+        try:
+            cache = get_identity_cache()
+            await cache.set(key, _snapshot(user), _IDENTITY_CACHE_TTL)
+            await cache.set(_version_key(user_id), str(user.token_version).encode(), _IDENTITY_CACHE_TTL)
+        except Exception as e:
+            print(f"[IDENTITY] Could not cache user {user_id}: {e}")
+    return user
+
+
+async def invalidate_identity(*user_ids: uuid.UUID | None) -> None:
+    """Drop the cached users. Call after the change commits."""
+    cache = get_identity_cache()
+    for user_id in {u for u in user_ids if u is not None}:
+        try:
+            await cache.set(_generation_key(user_id), uuid.uuid4().hex.encode())
+            _stats["invalidations"] += 1
+        except Exception as e:
+            print(f"[IDENTITY] Invalidation failed for {user_id}: {e}")
+
+
+# ─── Tokens ───────────────────────────────────────────────────────────────────
+
+async def issue_access_token(db: AsyncSession, user: User, expires_delta: timedelta) -> str:
+    """JWT for ``user`` with role, profile ids and token version as claims."""
+    row = (await db.execute(
+        select(User.token_version, CandidateProfile.id, RecruiterProfile.id)
+        .select_from(User)
+        .outerjoin(CandidateProfile, CandidateProfile.user_id == User.id)
+        .outerjoin(RecruiterProfile, RecruiterProfile.user_id == User.id)
+        .where(User.id == user.id)
+    )).one()
+    token_version, candidate_profile_id, recruiter_profile_id = row
+    return create_jwt_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "role": user.role.value if user.role else None,
+            "cid": str(candidate_profile_id) if candidate_profile_id else None,
+            "rid": str(recruiter_profile_id) if recruiter_profile_id else None,
+            "tv": token_version,
+        },
+        expires_delta=expires_delta,
+    )
+
+
+async def revoke_tokens(db: AsyncSession, user_id: uuid.UUID) -> int | None:
+    """Invalidate every token issued to the user so far. Commits; returns the new version (None: no such user)."""
+    version = (await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .returning(User.token_version)
+    )).scalar_one_or_none()
+    await db.commit()
+    if version is None:
+        return None
+    _stats["revocations"] += 1
+    try:
+        await get_identity_cache().set(_version_key(user_id), str(version).encode(), _IDENTITY_CACHE_TTL)
+    except Exception as e:
+        print(f"[IDENTITY] Could not cache token version of {user_id}: {e}")
+    await invalidate_identity(user_id)
+    return version
+
+
+async def _token_version(db: AsyncSession, user_id: uuid.UUID) -> int | None:
+    try:
+        cached = await get_identity_cache().get(_version_key(user_id))
+    except Exception as e:
+        print(f"[IDENTITY] Cache unavailable: {e}")
+        cached = None
+    if cached is not None:
+        return int(cached)
+
+    _stats["version_misses"] += 1
+    version = (await db.execute(select(User.token_version).where(User.id == user_id))).scalar_one_or_none()
+    if version is not None:
+        try:
+            await get_identity_cache().set(_version_key(user_id), str(version).encode(), _IDENTITY_CACHE_TTL)
+        except Exception as e:
+            print(f"[IDENTITY] Could not cache token version of {user_id}: {e}")
+    return version
+
+
+def assert_token_current(claims: dict, token_version: int | None) -> None:
+    if token_version is None:
+        raise AppException(ErrorCode.USER_NOT_FOUND, "User not found", status_code=401)
+    if claims.get("tv", 0) != token_version:
+        raise AppException(ErrorCode.SESSION_REVOKED, "Session has been revoked, please log in again")
+
+
+# ─── Claims-only identity ─────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Identity:
+    user_id: uuid.UUID
+    role: UserRole | None
+    candidate_profile_id: uuid.UUID | None
+    recruiter_profile_id: uuid.UUID | None
+
+
+def _optional_uuid(value: str | None) -> uuid.UUID | None:
+    return uuid.UUID(value) if value else None
+
+
+def _invalid_claims() -> AppException:
+    return AppException(ErrorCode.INVALID_TOKEN, "Invalid token payload")
+
+
+def claims_user_id(claims: dict) -> uuid.UUID:
+    """The ``sub`` claim as a user id; a malformed one is a 401, not a 500."""
+    try:
+        return uuid.UUID(claims["sub"])
+    except (KeyError, TypeError, ValueError):
+        raise _invalid_claims()
+
+
+async def get_identity_from_claims(db: AsyncSession, claims: dict) -> Identity:
+    """
+    Who is calling, for authorization checks that only need ids and role.
+    Tokens issued before the claims existed, or before the caller's profile
+    was created, fall back to the cached user.
+    """
+    user_id = claims_user_id(claims)
+    try:
+        role = UserRole(claims["role"]) if claims.get("role") else None
+        candidate_id, recruiter_id = _optional_uuid(claims.get("cid")), _optional_uuid(claims.get("rid"))
+    except (TypeError, ValueError):
+        raise _invalid_claims()
+    profile_claim = {UserRole.JOB_SEEKER: "cid", UserRole.RECRUITER: "rid"}.get(role)
+
+    if "tv" in claims and (profile_claim is None or claims.get(profile_claim)):
+        assert_token_current(claims, await _token_version(db, user_id))
+        _stats["claims_hits"] += 1
+        return Identity(user_id, role, candidate_id, recruiter_id)
+
+    user = await load_current_user(db, user_id)
+    assert_token_current(claims, user.token_version if user else None)
+    return Identity(
+        user_id,
+        user.role,
+        user.candidate_profile.id if user.candidate_profile else None,
+        user.recruiter_profile.id if user.recruiter_profile else None,
+    )
+
+
+def identity_cache_stats() -> dict:
+    lookups = _stats["hits"] + _stats["misses"]
+    return {**_stats, "hit_rate": round(_stats["hits"] / lookups, 4) if lookups else None}
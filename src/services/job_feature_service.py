@@ -0,0 +1,293 @@
+"""
+Job feature store
+=================
+Everything the AI pipeline derives from a job description alone (segments,
+normalized skill tuples incl. the keyword fallback, alternative groups, soft
+skills, BGE skill embeddings) is built in the background when a job is
+created or its description changes, and stored in ``job_features``.
+
+Rows carry ``current_feature_version()``, ``SKILL_ONTOLOGY_VERSION`` and a
+sha256 of the description they were built from; any mismatch is treated as
+a miss. Promoting a new embedding / NER model queues rebuilds of all open
+jobs.
+Build counters and rebuild latency (description change → features ready)
+are kept in-process and reported by ``job_feature_metrics``.
+"""
+
+import hashlib
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import partial
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.job_features_model import JobFeatures
+from src.models.job_model import Job, JobStatus
+from src.services.ai_pipeline_service import (
+    FEATURE_MODEL_KINDS,
+    FEATURE_STORE_PROFILE,
+    SKILL_ONTOLOGY_VERSION,
+    JobFeatureSet,
+    PipelineProfile,
+    build_job_features,
+    current_feature_version,
+    get_pipeline_profile,
+)
+from src.services.job_recommendation_service import sync_job
+from src.services.model_registry_service import on_model_swap
+from src.utils.task_queue import BoundedTaskQueue, spawn
+from src.utils.vector_index import from_bytes, to_bytes
+
+_FEATURE_BUILD_WORKERS = int(os.getenv("JOB_FEATURE_WORKERS", "1"))
+_FEATURE_BUILD_QUEUE_SIZE = int(os.getenv("JOB_FEATURE_QUEUE_SIZE", "500"))
+
+_feature_queue = BoundedTaskQueue("job-features", _FEATURE_BUILD_WORKERS, _FEATURE_BUILD_QUEUE_SIZE)
+
+# job_id → monotonic time the rebuild was requested
+_pending_since: dict[uuid.UUID, float] = {}
+_stats = {
+    "builds": 0,
+    "build_failures": 0,
+    "inline_builds": 0,      # scoring found no fresh row and built on the request path
+    "hits": 0,
+    "misses": 0,
+    "last_build_ms": None,
+    "rebuilds_completed": 0,
+    "rebuild_latency_ms_total": 0.0,
+    "rebuild_latency_ms_max": 0.0,
+    "last_rebuild_latency_ms": None,
+}
+
+
+def description_hash(description: str | None) -> str:
+    return hashlib.sha256((description or "").encode("utf-8")).hexdigest()
+
+
+# ─── (De)serialization ────────────────────────────────────────────────────────
+
+def _to_feature_set(row: JobFeatures) -> JobFeatureSet:
+    embeddings = None
+    if row.skill_embeddings and row.embedding_dim:
+        embeddings = from_bytes(row.skill_embeddings).reshape(-1, row.embedding_dim)
+    return JobFeatureSet(
+        segments=row.segments or {},
+        full_text=row.full_text or "",
+        skill_tuples=[(name, category) for name, category in row.skill_tuples or []],
+        alternatives=[list(group) for group in row.alternatives or []],
+        soft_skills=list(row.soft_skills or []),
+        skill_embeddings=embeddings,
+        profile_embedding=from_bytes(row.profile_embedding),
+        pipeline_version=row.pipeline_version,
+        ontology_version=row.ontology_version,
+    )
+
+
+def _to_row_values(job: Job, features: JobFeatureSet, build_ms: float) -> dict:
+    embeddings = features.skill_embeddings
+    has_embeddings = embeddings is not None and getattr(embeddings, "size", 0) > 0
+    return {
+        "job_id": job.id,
+        "pipeline_version": features.pipeline_version,
+        "ontology_version": features.ontology_version,
+        "description_hash": description_hash(job.description),
+        "segments": features.segments,
+        "full_text": features.full_text,
+        "skill_tuples": [list(t) for t in features.skill_tuples],
+        "alternatives": features.alternatives,
+        "soft_skills": features.soft_skills,
+        "skill_embeddings": to_bytes(embeddings) if has_embeddings else None,
+        "embedding_dim": int(embeddings.shape[1]) if has_embeddings else None,
+        "profile_embedding": to_bytes(features.profile_embedding) if features.profile_embedding is not None else None,
+        "build_ms": build_ms,
+        "built_at": datetime.now(timezone.utc),
+    }
+
+
+def _is_fresh(row: JobFeatures | None, job: Job) -> bool:
+    return (
+        row is not None
+        and row.pipeline_version == current_feature_version()
+        and row.ontology_version == SKILL_ONTOLOGY_VERSION
+        and row.description_hash == description_hash(job.description)
+    )
+
+
+# ─── Build / load ─────────────────────────────────────────────────────────────
+
+async def compute_and_store_job_features(db: AsyncSession, job: Job) -> JobFeatureSet:
+    """Build features for ``job`` and upsert them. Caller commits."""
+    t0 = time.perf_counter()
+    try:
+        features = await build_job_features(
+            job.description or "", with_embeddings=True, profile=FEATURE_STORE_PROFILE,
+        )
+    except Exception:
+        _stats["build_failures"] += 1
+        raise
+    build_ms = round((time.perf_counter() - t0) * 1000, 1)
+    _stats["builds"] += 1
+    _stats["last_build_ms"] = build_ms
+
+    values = _to_row_values(job, features, build_ms)
+    stmt = insert(JobFeatures).values(**values)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[JobFeatures.job_id],
+        set_={k: stmt.excluded[k] for k in values if k != "job_id"},
+    ))
+    return features
+
+
+async def get_job_features(
+    db: AsyncSession,
+    job: Job,
+    profile: str | PipelineProfile | None = None,
+) -> JobFeatureSet:
+    """
+    Stored features for ``job``; rebuilt (and persisted) when missing or
+    stale. For a ``profile`` without NER (the "fast" preview) a miss gets a
+    cheap in-memory set and the stored build is queued instead.
+    """
+    row = await db.get(JobFeatures, job.id)
+    if _is_fresh(row, job):
+        _stats["hits"] += 1
+        return _to_feature_set(row)
+    _stats["misses"] += 1
+    if profile is not None and not get_pipeline_profile(profile).ner:
+        schedule_job_feature_build(job.id)
+        return await build_job_features(job.description or "", profile=profile)
+    _stats["inline_builds"] += 1
+    features = await compute_and_store_job_features(db, job)
+    await db.commit()
+    _record_rebuild_done(job.id)
+    sync_job(job, features)
+    return features
+
+
+def _record_rebuild_done(job_id: uuid.UUID) -> None:
+    requested_at = _pending_since.pop(job_id, None)
+    if requested_at is None:
+        return
+    latency_ms = (time.perf_counter() - requested_at) * 1000
+    _stats["rebuilds_completed"] += 1
+    _stats["rebuild_latency_ms_total"] += latency_ms
+    _stats["rebuild_latency_ms_max"] = max(_stats["rebuild_latency_ms_max"], latency_ms)
+    _stats["last_rebuild_latency_ms"] = round(latency_ms, 1)
+
+
+async def _build_features_bg(job_id: uuid.UUID) -> None:
+    try:
+        await _build_features(job_id)
+    except Exception:
+        _pending_since.pop(job_id, None)     # no longer pending; the next scoring run builds inline
+        raise
+
+
+async def _build_features(job_id: uuid.UUID) -> None:
+    from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
+    async with AsyncSessionLocal() as session:
+        job = await session.get(Job, job_id)
+        if job is None:
+            _pending_since.pop(job_id, None)
+            return
+        row = await session.get(JobFeatures, job_id)
+        if _is_fresh(row, job):
+            features = _to_feature_set(row)
+        else:
+            features = await compute_and_store_job_features(session, job)
+            await session.commit()
+            print(f"[FEATURES] Built job features for {job_id}")
+        _record_rebuild_done(job_id)
+        sync_job(job, features)
+
+
+def schedule_job_feature_build(job_id: uuid.UUID) -> bool:
+    """
+    Queue a background (re)build of a job's features (also re-syncs the
+    open-jobs index) without waiting. Returns False when the queue is full;
+    the next scoring run then builds the features inline.
+    """
+    newly_pending = job_id not in _pending_since
+    _pending_since.setdefault(job_id, time.perf_counter())
+    if _feature_queue.submit_nowait(lambda: _build_features_bg(job_id)):
+        return True
+    if newly_pending:
+        _pending_since.pop(job_id, None)
+    return False
+
+
+async def _rebuild_open_jobs(kind: str) -> None:
+    from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
+    async with AsyncSessionLocal() as session:
+        job_ids = (await session.execute(select(Job.id).where(Job.status == JobStatus.OPEN))).scalars().all()
+    for job_id in job_ids:
+        # Background producer: waits for room instead of dropping rebuilds
+        _pending_since.setdefault(job_id, time.perf_counter())
+        await _feature_queue.submit(partial(_build_features_bg, job_id))
+    print(f"[FEATURES] {kind} model changed — queued {len(job_ids)} open job rebuilds")
+
+
+def _on_model_swap(kind: str) -> None:
+    if kind in FEATURE_MODEL_KINDS:
+        spawn(_rebuild_open_jobs(kind), name=f"rebuild-open-jobs-{kind}")
+
+
+on_model_swap(_on_model_swap)
+
+
+async def invalidate_job_features(db: AsyncSession, job_id: uuid.UUID) -> None:
+    """Drop the stored features in the caller's transaction (rebuild is scheduled separately)."""
+    await db.execute(delete(JobFeatures).where(JobFeatures.job_id == job_id))
+
+
+# ─── Metrics ──────────────────────────────────────────────────────────────────
+
+async def job_feature_metrics(db: AsyncSession) -> dict:
+    """Freshness of stored job features plus in-process build / rebuild latency."""
+    current_hash = func.encode(func.sha256(func.convert_to(Job.description, "UTF8")), "hex")
+    is_fresh = and_(
+        JobFeatures.pipeline_version == current_feature_version(),
+        JobFeatures.ontology_version == SKILL_ONTOLOGY_VERSION,
+        JobFeatures.description_hash == current_hash,
+    )
+    row = (await db.execute(
+        select(
+            func.count(Job.id).label("jobs"),
+            func.count(JobFeatures.job_id).filter(is_fresh).label("fresh"),
+            func.count(JobFeatures.job_id).label("stored"),
+            func.avg(JobFeatures.build_ms).label("avg_build_ms"),
+            func.percentile_cont(0.95).within_group(JobFeatures.build_ms).label("p95_build_ms"),
+            func.max(JobFeatures.built_at).label("last_built_at"),
+        )
+        .select_from(Job)
+        .outerjoin(JobFeatures, JobFeatures.job_id == Job.id)
+    )).one()
+
+    completed = _stats["rebuilds_completed"]
+    return {
+        "pipeline_version": current_feature_version(),
+        "ontology_version": SKILL_ONTOLOGY_VERSION,
+        "jobs": row.jobs,
+        "fresh": row.fresh,
+        "stale": row.stored - row.fresh,
+        "missing": row.jobs - row.stored,
+        "fresh_ratio": round(row.fresh / row.jobs, 4) if row.jobs else 1.0,
+        "avg_build_ms": round(float(row.avg_build_ms), 1) if row.avg_build_ms is not None else None,
+        "p95_build_ms": round(float(row.p95_build_ms), 1) if row.p95_build_ms is not None else None,
+        "last_built_at": row.last_built_at,
+        "rebuilds_pending": len(_pending_since),
+        "rebuilds_completed": completed,
+        "avg_rebuild_latency_ms": round(_stats["rebuild_latency_ms_total"] / completed, 1) if completed else None,
+        "max_rebuild_latency_ms": round(_stats["rebuild_latency_ms_max"], 1) if completed else None,
+        "last_rebuild_latency_ms": _stats["last_rebuild_latency_ms"],
+        "last_build_ms": _stats["last_build_ms"],
+        "builds": _stats["builds"],
+        "build_failures": _stats["build_failures"],
+        "inline_builds": _stats["inline_builds"],
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "queue": _feature_queue.stats(),
+    }
@@ -0,0 +1,217 @@
+"""
+Job recommendations
+===================
+One process-wide ``VectorIndex`` over the profile vectors of all OPEN jobs
+(from ``job_features.profile_embedding``), loaded lazily from the DB and then
+kept current by the job feature builder and the job create / update / delete
+services.
+
+A recommendation takes the resume's stored profile vector, pulls the
+top-``_RECOMMEND_CANDIDATES`` jobs by cosine similarity, and reranks them by
+a blend of that similarity and canonical skill overlap — set arithmetic on
+precomputed skill ids, no pipeline run. Results are cached per
+(resume, resume version, index generation).
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.job_features_model import JobFeatures
+from src.models.job_model import Job, JobStatus
+from src.models.resume_model import Resume
+from src.models.user_model import User, UserRole
+from src.schema.jobs_schema import JobRecommendationItem, JobRecommendationsResponse
+from src.services.ai_pipeline_service import (
+    FEATURE_MODEL_KINDS,
+    JobFeatureSet,
+    canonical_skill_id,
+    current_feature_version,
+)
+from src.services.model_registry_service import activated_at, on_model_swap
+from src.services.resume_feature_service import get_resume_features
+from src.utils.error_code import ErrorCode
+from src.utils.exceptions import AppException
+from src.utils.vector_index import VectorIndex, from_bytes
+
+_RECOMMEND_CANDIDATES = int(os.getenv("RECOMMEND_CANDIDATES", "100"))
+_RECOMMEND_SKILL_WEIGHT = float(os.getenv("RECOMMEND_SKILL_WEIGHT", "0.4"))
+_RECOMMEND_CACHE_SIZE = int(os.getenv("RECOMMEND_CACHE_SIZE", "2048"))
+
+
+class _OpenJobIndex:
+    def __init__(self):
+        self.index: VectorIndex | None = None
+        self.skills: dict[uuid.UUID, frozenset[str]] = {}
+        self.generation = 0     # bumped on every change; part of the result cache key
+        self.loaded = False
+        self.lock = asyncio.Lock()
+
+    def upsert(self, job_id: uuid.UUID, vector, skill_ids) -> None:
+        if vector is None:
+            self.remove(job_id)
+            return
+        if self.index is None:
+            self.index = VectorIndex(dim=len(vector))
+        self.index.upsert(job_id, vector)
+        self.skills[job_id] = frozenset(skill_ids)
+        self.generation += 1
+
+    def remove(self, job_id: uuid.UUID) -> None:
+        if job_id in self.skills:
+            self.index.remove(job_id)
+            del self.skills[job_id]
+            self.generation += 1
+
+    def reset(self) -> None:
+        """Drop everything; the next request reloads from job_features."""
+        self.index = None
+        self.skills = {}
+        self.generation += 1
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+
+_open_jobs = _OpenJobIndex()
+_result_cache: "OrderedDict[tuple, list[tuple[uuid.UUID, float, float, list[str]]]]" = OrderedDict()
+
+
+def _skill_ids(skill_tuples) -> list[str]:
+    return [canonical_skill_id(name) for name, _ in skill_tuples or []]
+
+
+async def _ensure_loaded(db: AsyncSession) -> _OpenJobIndex:
+    if _open_jobs.loaded:
+        return _open_jobs
+    async with _open_jobs.lock:
+        if _open_jobs.loaded:
+            return _open_jobs
+        embeddings_since = activated_at("skill_embeddings")
+        rows = await db.execute(
+            select(JobFeatures.job_id, JobFeatures.profile_embedding, JobFeatures.skill_tuples)
+            .join(Job, Job.id == JobFeatures.job_id)
+            .where(
+                Job.status == JobStatus.OPEN,
+                JobFeatures.profile_embedding.is_not(None),
+                # Stale rows are fine until rebuilt, as long as the same embedding model encoded them
+                *([JobFeatures.built_at >= embeddings_since] if embeddings_since else []),
+            )
+        )
+        for job_id, data, skill_tuples in rows.all():
+            _open_jobs.upsert(job_id, from_bytes(data), _skill_ids(skill_tuples))
+        _open_jobs.loaded = True
+        print(f"[RECOMMEND] Loaded {len(_open_jobs)} open jobs into the index")
+    return _open_jobs
+
+
+# ─── Incremental maintenance (called by the job services) ────────────────────
+
+def sync_job(job: Job, features: JobFeatureSet | None) -> None:
+    """Reflect a job's current status / features in the index (no-op until it is loaded)."""
+    if not _open_jobs.loaded:
+        return
+    if job.status == JobStatus.OPEN and features is not None:
+        _open_jobs.upsert(job.id, features.profile_embedding, _skill_ids(features.skill_tuples))
+    else:
+        _open_jobs.remove(job.id)
+
+
+def remove_job(job_id: uuid.UUID) -> None:
+    if _open_jobs.loaded:
+        _open_jobs.remove(job_id)
+
+
+def _on_model_swap(kind: str) -> None:
+    # Vectors from another embedding model are not comparable with new ones. An NER
+    # swap keeps the vectors; the job rebuilds it queues re-sync them one by one.
+    if kind == "skill_embeddings":
+        _open_jobs.reset()
+    if kind in FEATURE_MODEL_KINDS:
+        _result_cache.clear()
+
+
+on_model_swap(_on_model_swap)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GET /api/jobs/recommendations?resume_id=...
+# ─────────────────────────────────────────────────────────────────────────────
+async def recommend_jobs_service(
+    db: AsyncSession,
+    resume_id: uuid.UUID,
+    current_user: User,
+    limit: int = 10,
+) -> JobRecommendationsResponse:
+    if current_user.role != UserRole.JOB_SEEKER:
+        raise AppException(ErrorCode.FORBIDDEN, "Only candidates can get job recommendations")
+
+    candidate_profile = getattr(current_user, "candidate_profile", None)
+    if candidate_profile is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Candidate profile not found")
+
+    resume = (await db.execute(
+        select(Resume).where(Resume.id == resume_id, Resume.candidate_id == candidate_profile.id)
+    )).scalar_one_or_none()
+    if resume is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Resume not found")
+
+    t0 = time.perf_counter()
+    index = await _ensure_loaded(db)
+
+    cache_key = (resume.id, resume.updated_at, current_feature_version(), index.generation)
+    ranked = _result_cache.get(cache_key)
+    cached = ranked is not None
+    if cached:
+        _result_cache.move_to_end(cache_key)
+    else:
+        ranked = []
+        features = await get_resume_features(db, resume)
+        if features.profile_embedding is not None and len(index):
+            resume_skills = set(_skill_ids(features.skill_tuples))
+            for job_id, similarity in index.index.search(features.profile_embedding, k=_RECOMMEND_CANDIDATES):
+                job_skills = index.skills.get(job_id, frozenset())
+                matched = sorted(resume_skills & job_skills)
+                overlap = len(matched) / len(job_skills) if job_skills else 0.0
+                score = (1 - _RECOMMEND_SKILL_WEIGHT) * similarity + _RECOMMEND_SKILL_WEIGHT * overlap
+                ranked.append((job_id, score, similarity, matched))
+            ranked.sort(key=lambda r: r[1], reverse=True)
+        _result_cache[cache_key] = ranked
+        while len(_result_cache) > _RECOMMEND_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+    top = ranked[:limit]
+    jobs: dict = {}
+    if top:
+        rows = await db.execute(
+            select(Job).where(Job.id.in_([job_id for job_id, *_ in top]), Job.status == JobStatus.OPEN)
+        )
+        jobs = {job.id: job for job in rows.scalars().all()}
+
+    items = [
+        JobRecommendationItem(
+            job_id=job_id,
+            title=jobs[job_id].title,
+            location=jobs[job_id].location,
+            employment_type=jobs[job_id].employment_type,
+            score=round(score, 4),
+            similarity=round(similarity, 4),
+            skill_overlap=len(matched),
+            total_job_skills=len(index.skills.get(job_id, ())),
+            matched_skills=matched,
+        )
+        for job_id, score, similarity, matched in top
+        if job_id in jobs
+    ]
+    return JobRecommendationsResponse(
+        resume_id=resume.id,
+        recommendations=items,
+        cached=cached,
+        took_ms=round((time.perf_counter() - t0) * 1000, 1),
+    )
@@ -0,0 +1,43 @@
+"""
+Job board search
+================
+Full-text search runs against ``jobs.search_vector``, a generated tsvector
+over title (weight A), description (B) and location (C) with a GIN index.
+Queries are parsed with ``websearch_to_tsquery`` (quoted phrases, ``or``,
+``-term``), ranked with ``ts_rank`` and get a ``ts_headline`` snippet of
+the description.
+
+Title / location filters are substring-or-fuzzy matches backed by pg_trgm
+GIN indexes: ``ILIKE '%x%'`` uses the trigram index, and ``%>``
+(word similarity) tolerates typos such as "pyhton".
+"""
+
+from sqlalchemy import func, or_
+
+from src.models.job_model import JOB_SEARCH_CONFIG, Job
+
+# Markdown-style bold so clients never have to render HTML from job text
+_HEADLINE_OPTIONS = "StartSel=**, StopSel=**, MaxFragments=2, MaxWords=30, MinWords=10, FragmentDelimiter=' … '"
+
+
+def search_query(text: str):
+    return func.websearch_to_tsquery(JOB_SEARCH_CONFIG, text)
+
+
+def matches(query):
+    return Job.search_vector.op("@@")(query)
+
+
+def rank(query):
+    return func.ts_rank(Job.search_vector, query)
+
+
+def headline(query):
+    # Only computed for the rows of the page: Postgres postpones expensive
+    # target-list functions until after ORDER BY / LIMIT.
+    return func.ts_headline(JOB_SEARCH_CONFIG, Job.description, query, _HEADLINE_OPTIONS)
+
+
+def fuzzy_match(column, term: str):
+    """Substring or word-similarity match of ``term`` in ``column`` (pg_trgm indexed)."""
+    return or_(column.ilike(f"%{term}%"), column.op("%>")(term))
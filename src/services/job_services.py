@@ -1,15 +1,28 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.job_application_model import JobApplication
 from src.models.job_model import Job, JobStatus
 from src.models.user_model import User, UserRole
-from src.schema.jobs_schema import JobCreateSchema, JobUpdateSchema, JobFilterSchema
+from src.schema.jobs_schema import JobCreateSchema, JobUpdateSchema, JobFilterSchema, JobListItem, JobResponse
+from src.services import job_search_service as job_search
+from src.services.dashboard_cache_service import CANDIDATE, RECRUITER, invalidate_dashboard
+from src.services.job_feature_service import invalidate_job_features, schedule_job_feature_build
+from src.services.job_recommendation_service import remove_job
+from src.utils import pagination
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
 
+# Job board list view: descriptions are cut to a preview unless asked for
+_LIST_DESCRIPTION_CHARS = 300
+_LIST_FIELDS = [name for name in JobResponse.model_fields if name != "description"]
+
+_INT_MAX = 2 ** 31 - 1
+_INT_MIN = -(2 ** 31)
+
 
 def _assert_salary_range(salary_min: int | None, salary_max: int | None) -> None:
     if salary_min is not None and salary_max is not None and salary_max < salary_min:
@@ -58,10 +71,32 @@ async def create_job_service(db: AsyncSession, payload: JobCreateSchema, current
     db.add(job)
     await db.commit()
     await db.refresh(job)
+    await invalidate_dashboard(RECRUITER, recruiter_profile_id)
+
+    # Precompute AI pipeline features off the request path
+    schedule_job_feature_build(job.id)
     return job
 
 
-async def list_jobs_service(db: AsyncSession, current_user: User, filters: JobFilterSchema) -> list[Job]:
+def _job_sort_key(sort_by: str, descending: bool):
+    """(sort expression, cursor value type). Nullable columns sort their NULLs last."""
+    column = getattr(Job, sort_by)
+    python_type = Job.__table__.c[sort_by].type.python_type
+    key_type = datetime.fromisoformat if python_type is datetime else python_type
+    if not Job.__table__.c[sort_by].nullable:
+        return column, key_type
+    if python_type is datetime:
+        last = datetime.min if descending else datetime.max
+        return func.coalesce(column, last.replace(tzinfo=timezone.utc)), key_type
+    return func.coalesce(column, _INT_MIN if descending else _INT_MAX), key_type
+
+
+async def list_jobs_service(
+    db: AsyncSession,
+    current_user: User,
+    filters: JobFilterSchema,
+) -> tuple[list[JobListItem], str | None, int]:
+    """One page of jobs, the cursor of the next page and the planner's estimate of the total."""
     conditions = []
 
     if filters.status is not None:
@@ -69,14 +104,18 @@ async def list_jobs_service(db: AsyncSession, current_user: User, filters: JobFi
     else:
         conditions.append(Job.status == JobStatus.OPEN)
 
+    query = job_search.search_query(filters.q) if filters.q else None
+    if query is not None:
+        conditions.append(job_search.matches(query))
+
     if filters.title:
-        conditions.append(Job.title.ilike(f"%{filters.title}%"))
+        conditions.append(job_search.fuzzy_match(Job.title, filters.title))
 
     if filters.description:
-        conditions.append(Job.description.ilike(f"%{filters.description}%"))
+        conditions.append(job_search.matches(job_search.search_query(filters.description)))
 
     if filters.location:
-        conditions.append(Job.location.ilike(f"%{filters.location}%"))
+        conditions.append(job_search.fuzzy_match(Job.location, filters.location))
 
     if filters.employment_types:
         conditions.append(Job.employment_type.in_(filters.employment_types))
@@ -111,13 +150,36 @@ async def list_jobs_service(db: AsyncSession, current_user: User, filters: JobFi
     if filters.created_before:
         conditions.append(Job.created_at <= filters.created_before)
 
-    sort_col_name = filters.sort_by or "created_at"
-    sort_column = getattr(Job, sort_col_name)
-    order_expr = sort_column.asc() if filters.order == "asc" else sort_column.desc()
-
-    stmt = select(Job).where(and_(*conditions)).order_by(order_expr)
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    descending = filters.order != "asc"
+    sort_by = filters.sort_by or ("relevance" if query is not None else "created_at")
+    extra = []
+    if query is not None:
+        extra = [job_search.rank(query).label("rank"), job_search.headline(query).label("highlight")]
+    if sort_by == "relevance" and query is not None:
+        sort_key, key_type = job_search.rank(query), float
+    else:
+        sort_key, key_type = _job_sort_key("created_at" if sort_by == "relevance" else sort_by, descending)
+    keyset = (sort_key, Job.id)
+
+    description = Job.description if filters.full_description else func.left(Job.description, _LIST_DESCRIPTION_CHARS)
+    base = select(
+        *[getattr(Job, name) for name in _LIST_FIELDS],
+        description.label("description"),
+        *extra,
+        sort_key.label("sort_key"),
+    ).where(and_(*conditions))
+    estimated_total = await pagination.estimate_count(db, base)
+
+    stmt = base.order_by(*pagination.order_by(keyset, descending)).limit(filters.limit + 1)
+    if filters.cursor:
+        after = pagination.decode_cursor(filters.cursor, key_type, uuid.UUID)
+        stmt = stmt.where(pagination.keyset_after(keyset, after, descending))
+    elif filters.page > 1:
+        stmt = stmt.offset((filters.page - 1) * filters.limit)
+
+    rows = (await db.execute(stmt)).all()
+    page, next_cursor = pagination.split_page(rows, filters.limit, lambda row: (row.sort_key, row.id))
+    return [JobListItem.model_validate(row) for row in page], next_cursor, estimated_total
 
 
 async def get_job_by_id_service(db: AsyncSession, job_id: uuid.UUID, current_user: User) -> Job:
@@ -149,6 +211,12 @@ async def get_job_by_id_service(db: AsyncSession, job_id: uuid.UUID, current_use
     return job
 
 
+async def _applicant_ids(db: AsyncSession, job_id: uuid.UUID) -> list[uuid.UUID]:
+    """Candidate profile ids of the job's applicants (their dashboards show the job)."""
+    result = await db.execute(select(JobApplication.candidate_id).where(JobApplication.job_id == job_id))
+    return list(result.scalars().all())
+
+
 async def update_job_service(
         db: AsyncSession,
         job_id: uuid.UUID,
@@ -178,11 +246,27 @@ async def update_job_service(
     next_salary_max = update_data.get("salary_max", job.salary_max)
     _assert_salary_range(next_salary_min, next_salary_max)
 
+    description_changed = (
+        "description" in update_data and update_data["description"] != job.description
+    )
+    status_changed = "status" in update_data and update_data["status"] != job.status
+
     for field, value in update_data.items():
         setattr(job, field, value)
 
+    if description_changed:
+        await invalidate_job_features(db, job.id)
+
     await db.commit()
     await db.refresh(job)
+    await invalidate_dashboard(RECRUITER, recruiter_profile_id)
+    if "title" in update_data:
+        # Applicants' dashboards list the job title under recent applications
+        await invalidate_dashboard(CANDIDATE, *await _applicant_ids(db, job.id))
+
+    if description_changed or status_changed:
+        # Rebuild is a no-op for fresh features but re-syncs the recommendations index
+        schedule_job_feature_build(job.id)
     return job
 
 
@@ -204,8 +288,12 @@ async def delete_job_service(db: AsyncSession, job_id: uuid.UUID, current_user:
             "You are not authorized to delete this job",
         )
 
+    applicant_ids = await _applicant_ids(db, job.id)
     await db.delete(job)
     await db.commit()
+    await invalidate_dashboard(RECRUITER, recruiter_profile_id)
+    await invalidate_dashboard(CANDIDATE, *applicant_ids)
+    remove_job(job_id)
 
 
 
@@ -0,0 +1,674 @@
+"""
+Model registry
+==============
+The pipeline's models (``skill_embeddings`` BGE, ``skill_ner`` spaCy,
+``ats_scorer`` cross-encoder) are resolved through a manifest,
+``models/registry.json`` by default (``MODEL_REGISTRY_PATH``):
+
+    {
+      "skill_ner": {
+        "active": "2026-10-19",
+        "activated_at": "2026-10-19T09:12:00+00:00",
+        "candidate": {"version": "2026-11-02", "mode": "shadow", "percent": 10},
+        "versions": {
+          "2026-10-19": {"path": "skill_ner/2026-10-19/model-best", "sha256": "...",
+                         "metrics": {"f1": 0.91}, "registered_at": "..."}
+        }
+      }
+    }
+
+Paths are relative to ``models/``. A kind with no manifest entry uses the
+path the pipeline always used, reported as version ``legacy``.
+
+Swaps are atomic: the new model is loaded and its checksum verified in a
+worker thread, then the slot's reference is replaced. Calls already running
+keep the object they fetched, so nothing in flight is dropped.
+
+A candidate version can take a percentage of calls:
+- ``canary``: the candidate's output is used for that call.
+- ``shadow``: the active model's output is used; the candidate also runs on
+  the same input and latency / output drift are recorded.
+
+Loaded models count against ``MODEL_MEMORY_BUDGET_MB`` (0 = unlimited) by
+their estimated resident size (parameter bytes for torch models, RSS growth
+during the load otherwise). Before a load would exceed the budget, the
+least recently used idle models are unloaded; models idle for longer than
+``MODEL_IDLE_UNLOAD_SECONDS`` are unloaded by ``run_idle_unloader``. An
+unloaded model is reloaded transparently on its next use.
+
+Every app worker process has its own slots. The manifest is re-read when its
+mtime changes (checked at most every ``MODEL_REGISTRY_REFRESH_SECONDS``), and
+``run_registry_watcher`` swaps in versions another process activated. Swap
+callbacks fire whenever a process starts serving a different active version,
+whether through an activation, the watcher, or a reload after an unload.
+"""
+
+import asyncio
+import gc
+import hashlib
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, TypeVar
+
+from src.utils.error_code import ErrorCode
+from src.utils.exceptions import AppException
+from src.utils.task_queue import spawn
+
+MODELS_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../models")
+)
+MODEL_REGISTRY_PATH = os.getenv("MODEL_REGISTRY_PATH", os.path.join(MODELS_DIR, "registry.json"))
+
+_MEMORY_BUDGET_BYTES = int(float(os.getenv("MODEL_MEMORY_BUDGET_MB", "0")) * 1024 * 1024)
+_IDLE_UNLOAD_SECONDS = float(os.getenv("MODEL_IDLE_UNLOAD_SECONDS", "0"))
+_REFRESH_SECONDS = float(os.getenv("MODEL_REGISTRY_REFRESH_SECONDS", "10"))
+
+LEGACY_VERSION = "legacy"
+CANARY = "canary"
+SHADOW = "shadow"
+
+T = TypeVar("T")
+
+
+@dataclass
+class LoadedModel:
+    version: str
+    model: Any
+    loaded_at: datetime
+    load_ms: float
+    resident_bytes: int = 0
+
+
+class _Slot:
+    def __init__(self, kind: str, loader: Callable[[str], Any], legacy_path: str, canary_allowed: bool):
+        self.kind = kind
+        self.loader = loader
+        self.legacy_path = legacy_path
+        self.canary_allowed = canary_allowed
+        self.active: LoadedModel | None = None
+        self.served_version: str | None = None       # last active version this process used (kept across unloads)
+        self.candidate: LoadedModel | None = None
+        self.mode: str | None = None
+        self.percent = 0.0
+        self.lock = threading.Lock()
+        self.calls: dict[str, list[float]] = {}      # version → [calls, total ms]
+        self.shadow = {"comparisons": 0, "drift_total": 0.0, "drift_max": 0.0,
+                       "primary_ms_total": 0.0, "candidate_ms_total": 0.0}
+        self.events: deque = deque(maxlen=20)
+        self.last_used = 0.0                          # time.monotonic() of the last call
+        self.in_use = 0                               # calls currently running; never evicted meanwhile
+        self.expected_bytes = 0                       # size of the last load, to make room up front
+        self.loads = 0
+        self.unloads = 0
+
+    def resident_bytes(self) -> int:
+        return sum(m.resident_bytes for m in (self.active, self.candidate) if m is not None)
+
+
+_slots: dict[str, _Slot] = {}
+_swap_callbacks: list[Callable[[str], Any]] = []
+_manifest_lock = threading.Lock()
+_memory_lock = threading.RLock()
+_manifest_cache: tuple[tuple[int, int], dict] | None = None     # ((mtime_ns, inode), manifest)
+_manifest_checked = 0.0                                          # time.monotonic() of the last stat
+_loop: asyncio.AbstractEventLoop | None = None                   # app loop, for swap callbacks from threads
+
+
+# ─── Manifest ─────────────────────────────────────────────────────────────────
+
+def _read_manifest() -> dict:
+    try:
+        with open(MODEL_REGISTRY_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"[MODELS] Could not read {MODEL_REGISTRY_PATH}: {e}")
+        return {}
+
+
+def _write_manifest(data: dict) -> None:
+    """Atomic replace, so a crash never leaves a half-written manifest."""
+    os.makedirs(os.path.dirname(MODEL_REGISTRY_PATH), exist_ok=True)
+    tmp = f"{MODEL_REGISTRY_PATH}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp, MODEL_REGISTRY_PATH)
+
+
+def _update_entry(kind: str, update: Callable[[dict], None]) -> dict:
+    with _manifest_lock:
+        data = _read_manifest()
+        entry = data.setdefault(kind, {})
+        entry.setdefault("versions", {})
+        update(entry)
+        _write_manifest(data)
+        _invalidate_manifest_cache()
+        return entry
+
+
+def _invalidate_manifest_cache() -> None:
+    global _manifest_cache
+    _manifest_cache = None
+
+
+def _cached_manifest() -> dict:
+    """
+    The manifest, re-read only when the file changed. The file is stat-ed at
+    most every MODEL_REGISTRY_REFRESH_SECONDS, so other processes' writes are
+    seen within that interval and this process's own writes at once.
+    """
+    global _manifest_cache, _manifest_checked
+    now = time.monotonic()
+    if _manifest_cache is not None and now - _manifest_checked < _REFRESH_SECONDS:
+        return _manifest_cache[1]
+    _manifest_checked = now
+    try:
+        st = os.stat(MODEL_REGISTRY_PATH)
+        stamp = (st.st_mtime_ns, st.st_ino)
+    except OSError:
+        stamp = (0, 0)
+    if _manifest_cache is None or _manifest_cache[0] != stamp:
+        _manifest_cache = (stamp, _read_manifest())
+    return _manifest_cache[1]
+
+
+def _manifest_entry(kind: str) -> dict:
+    return _cached_manifest().get(kind, {})
+
+
+def artifact_checksum(path: str) -> str:
+    """sha256 of a file, or of every file under a directory (relative paths included)."""
+    digest = hashlib.sha256()
+    if os.path.isfile(path):
+        files = [(os.path.basename(path), path)]
+    else:
+        files = sorted(
+            (os.path.relpath(os.path.join(root, name), path), os.path.join(root, name))
+            for root, _, names in os.walk(path)
+            for name in names
+        )
+    for rel, full in files:
+        digest.update(rel.encode("utf-8"))
+        with open(full, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ─── Loading ──────────────────────────────────────────────────────────────────
+
+def register_model(
+    kind: str,
+    loader: Callable[[str], Any],
+    legacy_path: str,
+    canary_allowed: bool = True,
+) -> None:
+    """
+    Declare a model kind. ``loader(path)`` returns the model object (or None
+    when the artifact is unusable). Kinds whose outputs are stored and
+    compared later (embeddings, extracted skills) should disallow canaries — mixing two
+    models' outputs per call would make them incomparable.
+    """
+    _slots[kind] = _Slot(kind, loader, legacy_path, canary_allowed)
+
+
+def _slot(kind: str) -> _Slot:
+    slot = _slots.get(kind)
+    if slot is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, f"Unknown model '{kind}'")
+    return slot
+
+
+def _version_path(slot: _Slot, entry: dict, version: str) -> tuple[str, str | None]:
+    """(absolute path, expected sha256) of a version."""
+    if version == LEGACY_VERSION:
+        return slot.legacy_path, None
+    info = entry.get("versions", {}).get(version)
+    if info is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, f"{slot.kind} version '{version}' is not registered")
+    return os.path.join(MODELS_DIR, info["path"]), info.get("sha256")
+
+
+def _load(slot: _Slot, version: str, entry: dict | None = None, verify: bool = True) -> LoadedModel:
+    entry = entry if entry is not None else _read_manifest().get(slot.kind, {})
+    path, expected = _version_path(slot, entry, version)
+    if verify and expected and artifact_checksum(path) != expected:
+        raise AppException(ErrorCode.INVALID_INPUT, f"{slot.kind} {version}: checksum mismatch for {path}")
+    _make_room(slot, slot.expected_bytes)
+    rss_before = process_rss_bytes()
+    t0 = time.perf_counter()
+    model = slot.loader(path)
+    load_ms = round((time.perf_counter() - t0) * 1000, 1)
+    size = _model_bytes(model) or max(0, process_rss_bytes() - rss_before)
+    slot.expected_bytes = size
+    _make_room(slot, size)      # first load of a kind: its size was unknown up front
+    slot.loads += 1
+    slot.events.append({"event": "loaded", "version": version, "mb": round(size / 2**20, 1),
+                        "at": datetime.now(timezone.utc)})
+    print(f"[MODELS] Loaded {slot.kind} {version} in {load_ms}ms (~{size / 2**20:.0f} MB)")
+    return LoadedModel(version=version, model=model, loaded_at=datetime.now(timezone.utc),
+                       load_ms=load_ms, resident_bytes=size)
+
+
+def _load_initial(slot: _Slot) -> None:
+    entry = _read_manifest().get(slot.kind, {})
+    version = entry.get("active") or LEGACY_VERSION
+    try:
+        # Startup trusts the manifest; checksums are verified when a version is activated
+        slot.active = _load(slot, version, entry, verify=False)
+    except Exception as e:
+        if version == LEGACY_VERSION:
+            raise
+        print(f"[MODELS] {slot.kind} {version} failed to load ({e}); using legacy model")
+        slot.active = _load(slot, LEGACY_VERSION, entry)
+    _note_served(slot)
+
+    candidate = entry.get("candidate")
+    if candidate and (candidate.get("mode") != CANARY or slot.canary_allowed):
+        try:
+            slot.candidate = _load(slot, candidate["version"], entry, verify=False)
+            slot.mode = candidate.get("mode", SHADOW)
+            slot.percent = float(candidate.get("percent", 0))
+        except Exception as e:
+            print(f"[MODELS] {slot.kind} candidate {candidate.get('version')} failed to load: {e}")
+
+
+def get_model(kind: str) -> Any:
+    """The active model object for ``kind`` (loaded on first use)."""
+    slot = _slots[kind]
+    slot.last_used = time.monotonic()
+    active = slot.active
+    if active is None:
+        with slot.lock:
+            if slot.active is None:
+                _load_initial(slot)
+            active = slot.active
+    return active.model
+
+
+def active_version(kind: str) -> str:
+    slot = _slots.get(kind)
+    if slot is not None and slot.active is not None:
+        return slot.active.version
+    return _manifest_entry(kind).get("active") or LEGACY_VERSION
+
+
+def activated_at(kind: str) -> datetime | None:
+    """When the active version was switched in (None if the kind was never switched)."""
+    entry = _manifest_entry(kind)
+    if not entry.get("activated_at"):
+        return None
+    return datetime.fromisoformat(entry["activated_at"])
+
+
+# ─── Routing (canary / shadow) ────────────────────────────────────────────────
+
+def _record_call(slot: _Slot, version: str, ms: float) -> None:
+    stats = slot.calls.setdefault(version, [0, 0.0])
+    stats[0] += 1
+    stats[1] += ms
+
+
+def run_model(
+    kind: str,
+    call: Callable[[Any], T],
+    drift: Callable[[T, T], float] | None = None,
+) -> T:
+    """
+    Run ``call(model)`` on the model routed for this call. With a shadow
+    candidate, the candidate also runs and ``drift(primary, candidate)`` is
+    recorded; its output is discarded and its failures never surface.
+    """
+    slot = _slots[kind]
+    slot.in_use += 1
+    try:
+        return _run_routed(slot, call, drift)
+    finally:
+        slot.in_use -= 1
+        slot.last_used = time.monotonic()
+
+
+def _run_routed(slot: _Slot, call: Callable[[Any], T], drift: Callable[[T, T], float] | None) -> T:
+    kind = slot.kind
+    primary, shadow = None, None
+    while primary is None:      # may be unloaded between get_model and here
+        get_model(kind)
+        primary, candidate = slot.active, slot.candidate
+    if candidate is not None and random.random() * 100 < slot.percent:
+        if slot.mode == CANARY:
+            primary = candidate
+        elif drift is not None:
+            shadow = candidate
+
+    t0 = time.perf_counter()
+    result = call(primary.model)
+    primary_ms = (time.perf_counter() - t0) * 1000
+    _record_call(slot, primary.version, primary_ms)
+
+    if shadow is not None:
+        try:
+            t1 = time.perf_counter()
+            shadow_result = call(shadow.model)
+            candidate_ms = (time.perf_counter() - t1) * 1000
+            value = float(drift(result, shadow_result))
+            stats = slot.shadow
+            stats["comparisons"] += 1
+            stats["drift_total"] += value
+            stats["drift_max"] = max(stats["drift_max"], value)
+            stats["primary_ms_total"] += primary_ms
+            stats["candidate_ms_total"] += candidate_ms
+        except Exception as e:
+            print(f"[MODELS] Shadow {kind} {shadow.version} failed: {e}")
+    return result
+
+
+# ─── Memory budget ────────────────────────────────────────────────────────────
+
+def process_rss_bytes() -> int:
+    """Current resident set size of this process (Linux /proc; 0 elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _model_bytes(model: Any) -> int:
+    """Parameter + buffer bytes of torch modules inside ``model`` (0 if none found)."""
+    total = 0
+    parts = model if isinstance(model, tuple) else (model,)
+    for part in parts:
+        for module in (part, getattr(part, "_net", None)):
+            if module is not None and callable(getattr(module, "parameters", None)):
+                try:
+                    total += sum(p.numel() * p.element_size() for p in module.parameters())
+                    total += sum(b.numel() * b.element_size() for b in module.buffers())
+                except Exception:
+                    pass
+                break
+    return total
+
+
+def _release_memory() -> None:
+    gc.collect()
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6").malloc_trim(0)     # hand freed arenas back to the OS
+    except Exception:
+        pass
+
+
+def unload_model(kind: str, reason: str = "manual") -> bool:
+    """Drop a kind's loaded models (reloaded on next use). Running calls keep their reference."""
+    slot = _slot(kind)
+    with _memory_lock:
+        if slot.active is None and slot.candidate is None:
+            return False
+        freed = slot.resident_bytes()
+        slot.active, slot.candidate, slot.mode, slot.percent = None, None, None, 0.0
+        slot.unloads += 1
+        slot.events.append({"event": f"unloaded:{reason}", "mb": round(freed / 2**20, 1),
+                            "at": datetime.now(timezone.utc)})
+    print(f"[MODELS] Unloaded {kind} ({reason}, ~{freed / 2**20:.0f} MB)")
+    _release_memory()
+    return True
+
+
+def _make_room(incoming: _Slot, needed: int) -> None:
+    """Unload least recently used idle models until ``needed`` more bytes fit the budget."""
+    if not _MEMORY_BUDGET_BYTES:
+        return
+    with _memory_lock:
+        resident = sum(s.resident_bytes() for s in _slots.values())
+        victims = sorted(
+            (s for s in _slots.values() if s is not incoming and s.in_use == 0 and s.resident_bytes()),
+            key=lambda s: s.last_used,
+        )
+        for victim in victims:
+            if resident + needed <= _MEMORY_BUDGET_BYTES:
+                break
+            resident -= victim.resident_bytes()
+            unload_model(victim.kind, reason="budget")
+        if resident + needed > _MEMORY_BUDGET_BYTES:
+            print(f"[MODELS] {incoming.kind}: memory budget exceeded with nothing left to unload")
+
+
+def unload_idle_models() -> list[str]:
+    if not _IDLE_UNLOAD_SECONDS:
+        return []
+    cutoff = time.monotonic() - _IDLE_UNLOAD_SECONDS
+    return [
+        slot.kind for slot in list(_slots.values())
+        if slot.in_use == 0 and slot.active is not None
+        and slot.last_used < cutoff and unload_model(slot.kind, reason="idle")
+    ]
+
+
+async def run_idle_unloader() -> None:
+    """Background loop (started from the app lifespan) unloading idle models."""
+    if not _IDLE_UNLOAD_SECONDS:
+        return
+    interval = max(5.0, min(60.0, _IDLE_UNLOAD_SECONDS / 4))
+    while True:
+        await asyncio.sleep(interval)
+        unload_idle_models()
+
+
+def memory_status() -> dict:
+    return {
+        "budget_mb": round(_MEMORY_BUDGET_BYTES / 2**20, 1) if _MEMORY_BUDGET_BYTES else None,
+        "idle_unload_seconds": _IDLE_UNLOAD_SECONDS or None,
+        "process_rss_mb": round(process_rss_bytes() / 2**20, 1),
+        "models_resident_mb": round(sum(s.resident_bytes() for s in _slots.values()) / 2**20, 1),
+    }
+
+
+# ─── Admin operations ─────────────────────────────────────────────────────────
+
+def on_model_swap(callback: Callable[[str], Any]) -> None:
+    """``callback(kind)`` (sync or async) runs after a kind's active model changes."""
+    _swap_callbacks.append(callback)
+
+
+async def _notify_swap(kind: str) -> None:
+    for callback in _swap_callbacks:
+        try:
+            result = callback(kind)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            print(f"[MODELS] Swap callback failed for {kind}: {e}")
+
+
+def _note_served(slot: _Slot) -> None:
+    """
+    Record the version a (re)load put in service. When it differs from the
+    one this process served before (e.g. another process activated a version
+    while this slot was unloaded), swap callbacks run on the app loop.
+    """
+    previous, slot.served_version = slot.served_version, slot.active.version
+    if previous is None or previous == slot.active.version:
+        return
+    slot.events.append({"event": "reloaded", "version": slot.active.version, "previous": previous,
+                        "at": datetime.now(timezone.utc)})
+    print(f"[MODELS] {slot.kind}: {previous} → {slot.active.version} (manifest changed)")
+    if _loop is None:
+        return
+    kind = slot.kind
+    _loop.call_soon_threadsafe(lambda: spawn(_notify_swap(kind), name=f"model-swap-{kind}"))
+
+
+def _swap_in(slot: _Slot, loaded: LoadedModel) -> None:
+    previous = slot.active.version if slot.active is not None else None
+    slot.active = loaded
+    slot.served_version = loaded.version
+    if slot.candidate is not None and slot.candidate.version == loaded.version:
+        slot.candidate, slot.mode, slot.percent = None, None, 0.0
+    slot.events.append({"event": "activated", "version": loaded.version, "previous": previous,
+                        "at": loaded.loaded_at})
+    print(f"[MODELS] {slot.kind}: {previous} → {loaded.version}")
+
+
+async def sync_with_manifest() -> list[str]:
+    """Swap in the manifest's active version wherever this process has another one loaded."""
+    swapped = []
+    for kind, slot in list(_slots.items()):
+        entry = _manifest_entry(kind)
+        version = entry.get("active") or LEGACY_VERSION
+        if slot.active is None or slot.active.version == version:
+            continue
+        try:
+            # Verified by the process that activated it
+            loaded = await asyncio.to_thread(_load, slot, version, entry, False)
+        except Exception as e:
+            print(f"[MODELS] Could not follow {kind} → {version}: {e}")
+            continue
+        if loaded.model is None:
+            continue
+        _swap_in(slot, loaded)
+        await _notify_swap(kind)
+        swapped.append(kind)
+    return swapped
+
+
+async def run_registry_watcher() -> None:
+    """Background loop (started from the app lifespan) following other processes' activations."""
+    global _loop
+    _loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(_REFRESH_SECONDS)
+        try:
+            await sync_with_manifest()
+        except Exception as e:
+            print(f"[MODELS] Registry watcher failed: {e}")
+
+
+async def register_version(kind: str, version: str, path: str, metrics: dict | None = None) -> dict:
+    """Add a trained artifact (path relative to models/) to the manifest, with its checksum."""
+    slot = _slot(kind)
+    if version == LEGACY_VERSION:
+        raise AppException(ErrorCode.INVALID_INPUT, f"'{LEGACY_VERSION}' is reserved")
+    full = os.path.normpath(os.path.join(MODELS_DIR, path))
+    if not full.startswith(MODELS_DIR + os.sep) or not os.path.exists(full):
+        raise AppException(ErrorCode.INVALID_INPUT, f"Artifact not found under models/: {path}")
+    sha256 = await asyncio.to_thread(artifact_checksum, full)
+
+    def update(entry: dict) -> None:
+        if version in entry["versions"]:
+            raise AppException(ErrorCode.DUPLICATE_RESOURCE, f"{slot.kind} version '{version}' already exists")
+        entry["versions"][version] = {
+            "path": os.path.relpath(full, MODELS_DIR),
+            "sha256": sha256,
+            "metrics": metrics or {},
+            "registered_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    _update_entry(kind, update)
+    return {"version": version, "sha256": sha256}
+
+
+async def activate_version(kind: str, version: str) -> LoadedModel:
+    """Load ``version`` in the background, then swap it in atomically."""
+    slot = _slot(kind)
+    loaded = await asyncio.to_thread(_load, slot, version)
+    if loaded.model is None:
+        raise AppException(ErrorCode.INVALID_INPUT, f"{kind} {version} could not be loaded")
+
+    def update(entry: dict) -> None:
+        entry["active"] = None if version == LEGACY_VERSION else version
+        entry["activated_at"] = loaded.loaded_at.isoformat()
+        if (entry.get("candidate") or {}).get("version") == version:
+            entry.pop("candidate", None)
+
+    _update_entry(kind, update)
+    _swap_in(slot, loaded)
+    await _notify_swap(kind)
+    return loaded
+
+
+async def set_candidate(kind: str, version: str, mode: str, percent: float) -> LoadedModel:
+    slot = _slot(kind)
+    if mode == CANARY and not slot.canary_allowed:
+        raise AppException(ErrorCode.INVALID_INPUT, f"{kind} outputs are stored; only shadow mode is allowed")
+    loaded = await asyncio.to_thread(_load, slot, version)
+    if loaded.model is None:
+        raise AppException(ErrorCode.INVALID_INPUT, f"{kind} {version} could not be loaded")
+    _update_entry(kind, lambda entry: entry.update(candidate={"version": version, "mode": mode, "percent": percent}))
+    slot.candidate, slot.mode, slot.percent = loaded, mode, percent
+    slot.shadow = {key: 0 if key == "comparisons" else 0.0 for key in slot.shadow}
+    slot.events.append({"event": f"candidate:{mode}", "version": version, "percent": percent, "at": loaded.loaded_at})
+    return loaded
+
+
+def clear_candidate(kind: str) -> None:
+    slot = _slot(kind)
+    _update_entry(kind, lambda entry: entry.pop("candidate", None))
+    if slot.candidate is not None:
+        slot.events.append({"event": "candidate:cleared", "version": slot.candidate.version,
+                            "at": datetime.now(timezone.utc)})
+    slot.candidate, slot.mode, slot.percent = None, None, 0.0
+
+
+async def promote_candidate(kind: str) -> LoadedModel:
+    slot = _slot(kind)
+    if slot.candidate is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, f"{kind} has no candidate")
+    return await activate_version(kind, slot.candidate.version)
+
+
+# ─── Status ───────────────────────────────────────────────────────────────────
+
+def _loaded_info(loaded: LoadedModel | None) -> dict | None:
+    if loaded is None:
+        return None
+    return {"version": loaded.version, "loaded": loaded.model is not None,
+            "loaded_at": loaded.loaded_at, "load_ms": loaded.load_ms,
+            "resident_mb": round(loaded.resident_bytes / 2**20, 1)}
+
+
+def registry_status() -> list[dict]:
+    manifest = _read_manifest()
+    out = []
+    for kind, slot in _slots.items():
+        entry = manifest.get(kind, {})
+        shadow = slot.shadow
+        n = shadow["comparisons"]
+        out.append({
+            "kind": kind,
+            "active": _loaded_info(slot.active),
+            "configured_version": entry.get("active") or LEGACY_VERSION,
+            "candidate": _loaded_info(slot.candidate),
+            "candidate_mode": slot.mode,
+            "candidate_percent": slot.percent,
+            "canary_allowed": slot.canary_allowed,
+            "versions": [
+                {"version": version, **info} for version, info in sorted(entry.get("versions", {}).items())
+            ],
+            "calls": [
+                {"version": version, "calls": int(count), "avg_ms": round(total / count, 2) if count else None}
+                for version, (count, total) in slot.calls.items()
+            ],
+            "shadow": {
+                "comparisons": n,
+                "avg_drift": round(shadow["drift_total"] / n, 4) if n else None,
+                "max_drift": round(shadow["drift_max"], 4) if n else None,
+                "avg_primary_ms": round(shadow["primary_ms_total"] / n, 2) if n else None,
+                "avg_candidate_ms": round(shadow["candidate_ms_total"] / n, 2) if n else None,
+            },
+            "resident_mb": round(slot.resident_bytes() / 2**20, 1),
+            "idle_seconds": round(time.monotonic() - slot.last_used, 1) if slot.last_used else None,
+            "in_use": slot.in_use,
+            "loads": slot.loads,
+            "unloads": slot.unloads,
+            "events": list(slot.events),
+        })
+    return out
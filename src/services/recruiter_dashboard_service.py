@@ -1,16 +1,13 @@
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 
-from sqlalchemy import select, func, literal_column
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.external_application_model import (
-    ExternalApplication,
-    ExternalApplicationSource,
-    ExternalApplicationStatus,
-)
-from src.models.job_application_model import JobApplication, ApplicationStatus
+from src.models.external_application_model import ExternalApplicationSource
+from src.models.job_application_model import ApplicationStatus
 from src.models.job_model import Job
 from src.models.recruiter_model import RecruiterProfile
+from src.models.recruiter_stats_model import RecruiterStats
 from src.models.user_model import User, UserRole
 from src.schema.recruiter_dashboard_schema import (
     ApplicationSourceItem,
@@ -24,6 +21,13 @@ from src.schema.recruiter_dashboard_schema import (
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
 
+# GROUPING(status, source, job_id, month) of each grouping set: a bit is set
+# for every column the set does not group by (leftmost argument = highest bit)
+_BY_STATUS = 0b0111
+_BY_SOURCE = 0b1011
+_BY_JOB = 0b1101
+_BY_MONTH = 0b1110
+
 
 async def get_recruiter_dashboard_data(
     db: AsyncSession,
@@ -43,225 +47,92 @@ async def get_recruiter_dashboard_data(
         raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Recruiter profile not found")
 
     recruiter_id = profile.id
+    stats = RecruiterStats
 
-    # Subquery for all job IDs owned by this recruiter — used with .in_()
-    job_ids_subquery = select(Job.id).where(Job.recruiter_id == recruiter_id)
-
-    # ── SUMMARY STATS ──────────────────────────────────────────────────────
-
-    total_jobs_result = await db.execute(
-        select(func.count(Job.id)).where(Job.recruiter_id == recruiter_id)
-    )
-    total_jobs = total_jobs_result.scalar() or 0
-
-    platform_total_result = await db.execute(
-        select(func.count(JobApplication.id)).where(
-            JobApplication.job_id.in_(job_ids_subquery)
-        )
-    )
-    platform_total = platform_total_result.scalar() or 0
-
-    external_total_result = await db.execute(
-        select(func.count(ExternalApplication.id)).where(
-            ExternalApplication.job_id.in_(job_ids_subquery)
-        )
-    )
-    external_total = external_total_result.scalar() or 0
-
-    platform_accepted_result = await db.execute(
-        select(func.count(JobApplication.id)).where(
-            JobApplication.job_id.in_(job_ids_subquery),
-            JobApplication.status == ApplicationStatus.ACCEPTED,
+    # ── ONE PASS OVER THE RECRUITER'S ROLLUP ROWS ─────────────────────────
+    # recruiter_stats is kept in step with both application tables (see
+    # recruiter_stats_service). Each grouping set yields one breakdown;
+    # GROUPING() tells them apart.
+    rows = (
+        await db.execute(
+            select(
+                func.grouping(stats.status, stats.source, stats.job_id, stats.month).label("grouping"),
+                stats.status,
+                stats.source,
+                stats.job_id,
+                stats.month,
+                func.sum(stats.count).label("count"),
+                func.sum(stats.count).filter(stats.status == ApplicationStatus.ACCEPTED.value).label("accepted"),
+            )
+            .where(stats.recruiter_id == recruiter_id)
+            .group_by(func.grouping_sets(stats.status, stats.source, stats.job_id, stats.month))
         )
-    )
-    platform_accepted = platform_accepted_result.scalar() or 0
+    ).all()
 
-    external_accepted_result = await db.execute(
-        select(func.count(ExternalApplication.id)).where(
-            ExternalApplication.job_id.in_(job_ids_subquery),
-            ExternalApplication.status == ExternalApplicationStatus.ACCEPTED,
+    jobs = (
+        await db.execute(
+            select(Job.id, Job.title, Job.status).where(Job.recruiter_id == recruiter_id)
         )
-    )
-    external_accepted = external_accepted_result.scalar() or 0
+    ).all()
 
-    platform_pending_result = await db.execute(
-        select(func.count(JobApplication.id)).where(
-            JobApplication.job_id.in_(job_ids_subquery),
-            JobApplication.status == ApplicationStatus.PENDING,
-        )
-    )
-    platform_pending = platform_pending_result.scalar() or 0
+    status_counts: dict[str, int] = {}
+    source_counts: dict[str, int] = {}
+    job_counts: dict = {}
+    monthly_counts: dict[str, int] = {}
+    for row in rows:
+        if row.grouping == _BY_STATUS:
+            status_counts[row.status] = row.count
+        elif row.grouping == _BY_SOURCE:
+            source_counts[row.source] = row.count
+        elif row.grouping == _BY_JOB and row.count:
+            job_counts[row.job_id] = (row.count, row.accepted or 0)
+        elif row.grouping == _BY_MONTH:
+            key = row.month.strftime("%b %Y")
+            monthly_counts[key] = monthly_counts.get(key, 0) + row.count
 
-    external_pending_result = await db.execute(
-        select(func.count(ExternalApplication.id)).where(
-            ExternalApplication.job_id.in_(job_ids_subquery),
-            ExternalApplication.status == ExternalApplicationStatus.PENDING,
-        )
-    )
-    external_pending = external_pending_result.scalar() or 0
+    # ── SUMMARY STATS ──────────────────────────────────────────────────────
 
     summary = DashboardSummary(
-        total_jobs=total_jobs,
-        total_applications=platform_total + external_total,
-        accepted_count=platform_accepted + external_accepted,
-        pending_count=platform_pending + external_pending,
+        total_jobs=len(jobs),
+        total_applications=sum(status_counts.values()),
+        accepted_count=status_counts.get("ACCEPTED", 0),
+        pending_count=status_counts.get("PENDING", 0),
     )
 
     # ── APPLICATION STATUS BREAKDOWN ──────────────────────────────────────
 
-    platform_status_rows = (
-        await db.execute(
-            select(JobApplication.status, func.count(JobApplication.id))
-            .where(JobApplication.job_id.in_(job_ids_subquery))
-            .group_by(JobApplication.status)
-        )
-    ).all()
-
-    external_status_rows = (
-        await db.execute(
-            select(ExternalApplication.status, func.count(ExternalApplication.id))
-            .where(ExternalApplication.job_id.in_(job_ids_subquery))
-            .group_by(ExternalApplication.status)
-        )
-    ).all()
-
-    status_counts: dict[str, int] = {}
-    for status_enum, count in platform_status_rows:
-        status_counts[status_enum.value] = status_counts.get(status_enum.value, 0) + count
-    for status_enum, count in external_status_rows:
-        status_counts[status_enum.value] = status_counts.get(status_enum.value, 0) + count
-
-    status_order = ["PENDING", "REVIEWING", "ACCEPTED", "REJECTED"]
     application_status_breakdown = [
         ApplicationStatusItem(status=s, count=status_counts.get(s, 0))
-        for s in status_order
+        for s in ["PENDING", "REVIEWING", "ACCEPTED", "REJECTED"]
     ]
 
     # ── TOP 5 JOBS BY APPLICATIONS NUMBER ────────────────────────────────────────
 
-    platform_job_counts_rows = (
-        await db.execute(
-            select(JobApplication.job_id, func.count(JobApplication.id).label("cnt"))
-            .where(JobApplication.job_id.in_(job_ids_subquery))
-            .group_by(JobApplication.job_id)
-        )
-    ).all()
-
-    external_job_counts_rows = (
-        await db.execute(
-            select(ExternalApplication.job_id, func.count(ExternalApplication.id).label("cnt"))
-            .where(ExternalApplication.job_id.in_(job_ids_subquery))
-            .group_by(ExternalApplication.job_id)
+    job_titles = {job.id: job.title for job in jobs}
+    top5_ids = sorted(job_counts, key=lambda k: job_counts[k][0], reverse=True)[:5]
+    top_jobs_by_applications = [
+        TopJobItem(
+            job_id=str(job_id),
+            title=job_titles.get(job_id, "Unknown"),
+            application_count=job_counts[job_id][0],
+            accepted_count=job_counts[job_id][1],
         )
-    ).all()
-
-    job_app_counts: dict = {}
-    for job_id, cnt in platform_job_counts_rows:
-        job_app_counts[job_id] = job_app_counts.get(job_id, 0) + cnt
-    for job_id, cnt in external_job_counts_rows:
-        job_app_counts[job_id] = job_app_counts.get(job_id, 0) + cnt
-
-    top5_ids = sorted(job_app_counts, key=lambda k: job_app_counts[k], reverse=True)[:5]
-
-    top_jobs_by_applications: list[TopJobItem] = []
-    if top5_ids:
-        jobs_rows = (
-            await db.execute(
-                select(Job.id, Job.title).where(Job.id.in_(top5_ids))
-            )
-        ).all()
-        job_titles = {row.id: row.title for row in jobs_rows}
-
-        # Per-job accepted counts (platform + external)
-        platform_accepted_per_job_rows = (
-            await db.execute(
-                select(JobApplication.job_id, func.count(JobApplication.id))
-                .where(
-                    JobApplication.job_id.in_(top5_ids),
-                    JobApplication.status == ApplicationStatus.ACCEPTED,
-                )
-                .group_by(JobApplication.job_id)
-            )
-        ).all()
-
-        external_accepted_per_job_rows = (
-            await db.execute(
-                select(ExternalApplication.job_id, func.count(ExternalApplication.id))
-                .where(
-                    ExternalApplication.job_id.in_(top5_ids),
-                    ExternalApplication.status == ExternalApplicationStatus.ACCEPTED,
-                )
-                .group_by(ExternalApplication.job_id)
-            )
-        ).all()
-
-        accepted_per_job: dict = {}
-        for job_id, cnt in platform_accepted_per_job_rows:
-            accepted_per_job[job_id] = accepted_per_job.get(job_id, 0) + cnt
-        for job_id, cnt in external_accepted_per_job_rows:
-            accepted_per_job[job_id] = accepted_per_job.get(job_id, 0) + cnt
-
-        for job_id in top5_ids:
-            top_jobs_by_applications.append(
-                TopJobItem(
-                    job_id=str(job_id),
-                    title=job_titles.get(job_id, "Unknown"),
-                    application_count=job_app_counts[job_id],
-                    accepted_count=accepted_per_job.get(job_id, 0),
-                )
-            )
+        for job_id in top5_ids
+    ]
 
     # ── APPLICATIONS OVER TIME (last 6 months) ────────────────────────────
 
-    six_months_ago = datetime.now(timezone.utc) - timedelta(days=183)
-
-    platform_monthly_rows = (
-        await db.execute(
-            select(
-                func.date_trunc(literal_column("'month'"), JobApplication.applied_at).label("month"),
-                func.count(JobApplication.id).label("count"),
-            )
-            .where(
-                JobApplication.job_id.in_(job_ids_subquery),
-                JobApplication.applied_at >= six_months_ago,
-            )
-            .group_by(func.date_trunc(literal_column("'month'"), JobApplication.applied_at))
-        )
-    ).all()
-
-    external_monthly_rows = (
-        await db.execute(
-            select(
-                func.date_trunc(literal_column("'month'"), ExternalApplication.uploaded_at).label("month"),
-                func.count(ExternalApplication.id).label("count"),
-            )
-            .where(
-                ExternalApplication.job_id.in_(job_ids_subquery),
-                ExternalApplication.uploaded_at >= six_months_ago,
-            )
-            .group_by(func.date_trunc(literal_column("'month'"), ExternalApplication.uploaded_at))
-        )
-    ).all()
-
-    monthly_counts: dict[str, int] = {}
-    for month_dt, count in platform_monthly_rows:
-        key = month_dt.strftime("%b %Y")
-        monthly_counts[key] = monthly_counts.get(key, 0) + count
-    for month_dt, count in external_monthly_rows:
-        key = month_dt.strftime("%b %Y")
-        monthly_counts[key] = monthly_counts.get(key, 0) + count
-
     # Generate all 6 month labels so the chart always has 6 points
     now = datetime.now(timezone.utc)
     ordered_months: list[str] = []
     for i in range(5, -1, -1):
         # Go back i months from current month
-        month = now.month - i
+        month_number = now.month - i
         year = now.year
-        while month <= 0:
-            month += 12
+        while month_number <= 0:
+            month_number += 12
             year -= 1
-        label = datetime(year, month, 1).strftime("%b %Y")
+        label = datetime(year, month_number, 1).strftime("%b %Y")
         ordered_months.append(label)
 
     applications_over_time = [
@@ -271,17 +142,9 @@ async def get_recruiter_dashboard_data(
 
     # ── JOB STATUS DISTRIBUTION ───────────────────────────────────────────
 
-    job_status_rows = (
-        await db.execute(
-            select(Job.status, func.count(Job.id))
-            .where(Job.recruiter_id == recruiter_id)
-            .group_by(Job.status)
-        )
-    ).all()
-
     job_status_counts: dict[str, int] = {}
-    for status_enum, count in job_status_rows:
-        job_status_counts[status_enum.value] = count
+    for job in jobs:
+        job_status_counts[job.status.value] = job_status_counts.get(job.status.value, 0) + 1
 
     job_status_distribution = [
         JobStatusItem(status=s, count=job_status_counts.get(s, 0))
@@ -290,30 +153,9 @@ async def get_recruiter_dashboard_data(
 
     # ── APPLICATION SOURCE BREAKDOWN ──────────────────────────────────────
 
-    platform_count_result = await db.execute(
-        select(func.count(JobApplication.id)).where(
-            JobApplication.job_id.in_(job_ids_subquery)
-        )
-    )
-    platform_source_count = platform_count_result.scalar() or 0
-
-    external_source_rows = (
-        await db.execute(
-            select(ExternalApplication.source, func.count(ExternalApplication.id))
-            .where(ExternalApplication.job_id.in_(job_ids_subquery))
-            .group_by(ExternalApplication.source)
-        )
-    ).all()
-
-    external_source_counts: dict[str, int] = {}
-    for source_enum, count in external_source_rows:
-        external_source_counts[source_enum.value] = count
-
     application_source_breakdown = [
-        ApplicationSourceItem(source="PLATFORM", count=platform_source_count),
-    ] + [
-        ApplicationSourceItem(source=s, count=external_source_counts.get(s, 0))
-        for s in [src.value for src in ExternalApplicationSource]
+        ApplicationSourceItem(source=s, count=source_counts.get(s, 0))
+        for s in ["PLATFORM"] + [src.value for src in ExternalApplicationSource]
     ]
 
     return RecruiterDashboardResponse(
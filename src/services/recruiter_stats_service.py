@@ -0,0 +1,221 @@
+"""
+Recruiter stats rollup
+======================
+``recruiter_stats`` holds application counts per (recruiter, job, status,
+source, month). Every write that creates applications or changes their
+status records its +1 / -1 deltas through ``record_applications`` /
+``record_status_changes`` in the same transaction, so the rollup commits or
+rolls back together with the rows it counts. Deleting a job drops its rollup
+rows through the foreign key.
+
+``rebuild_recruiter_stats`` recomputes the rollup from the application
+tables. It is the reconciliation job: run every
+``RECRUITER_STATS_RECONCILE_HOURS`` from the app lifespan (0 disables) and
+on demand from the admin metrics route; the migration uses the same query
+for the backfill.
+
+Writers and the rebuild serialize per recruiter through a transaction-level
+advisory lock: every delta takes it shared, the rebuild of one recruiter
+takes it exclusively and commits before moving on. A rebuild therefore only
+delays writes for the recruiter it is recounting, for that recount's
+duration.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import (
+    Date, String, cast, delete, func, literal, literal_column, select, tuple_, union, union_all, update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.external_application_model import ExternalApplication
+from src.models.job_application_model import JobApplication
+from src.models.job_model import Job
+from src.models.recruiter_stats_model import RecruiterStats
+
+_RECONCILE_HOURS = float(os.getenv("RECRUITER_STATS_RECONCILE_HOURS", "24"))
+
+PLATFORM_SOURCE = "PLATFORM"
+_KEY_COLUMNS = ("recruiter_id", "job_id", "status", "source", "month")
+_LOCK_NAMESPACE = 0x52530001     # first key of the per-recruiter advisory locks
+
+
+# ─── Incremental updates ──────────────────────────────────────────────────────
+
+def _month(at: datetime | None) -> date:
+    at = (at or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    return date(at.year, at.month, 1)
+
+
+def _key(recruiter_id: uuid.UUID, app: JobApplication | ExternalApplication, status=None) -> tuple:
+    # Rows that are not flushed yet have no column defaults applied (status
+    # PENDING, created now), so fall back to the same defaults here.
+    status = status or app.status
+    if isinstance(app, ExternalApplication):
+        source, created_at = app.source.value, app.uploaded_at
+    else:
+        source, created_at = PLATFORM_SOURCE, app.applied_at
+    return (recruiter_id, app.job_id, status.value if status else "PENDING", source, _month(created_at))
+
+
+async def _lock_recruiter(db: AsyncSession, recruiter_id: uuid.UUID, shared: bool) -> None:
+    lock = func.pg_advisory_xact_lock_shared if shared else func.pg_advisory_xact_lock
+    await db.execute(select(lock(_LOCK_NAMESPACE, func.hashtext(cast(recruiter_id, String)))))
+
+
+async def _bump(db: AsyncSession, deltas: Counter) -> None:
+    # Sorted keys: concurrent bulk updates lock rollup rows in the same order
+    items = [(key, n) for key, n in sorted(deltas.items(), key=str) if n]
+    if not items:
+        return
+    for recruiter_id in sorted({key[0] for key, _ in items}, key=str):
+        await _lock_recruiter(db, recruiter_id, shared=True)
+    stmt = insert(RecruiterStats).values([dict(zip(_KEY_COLUMNS, key), count=n) for key, n in items])
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=list(_KEY_COLUMNS),
+        set_={"count": func.greatest(RecruiterStats.count + stmt.excluded.count, 0)},
+    ))
+    # Never below zero: a -1 for an application the rollup never counted is
+    # drift (the reconciliation job corrects it). Those rows were just inserted
+    # by this transaction, so this takes no new row locks.
+    negative = [key for key, n in items if n < 0]
+    if negative:
+        await db.execute(
+            update(RecruiterStats)
+            .where(tuple_(*(getattr(RecruiterStats, c) for c in _KEY_COLUMNS)).in_(negative),
+                   RecruiterStats.count < 0)
+            .values(count=0)
+        )
+
+
+async def record_applications(
+    db: AsyncSession,
+    recruiter_id: uuid.UUID,
+    apps: Iterable[JobApplication | ExternalApplication],
+    sign: int = 1,
+) -> None:
+    """Count new (``sign=1``) or deleted (``sign=-1``) applications. Caller commits."""
+    deltas = Counter()
+    for app in apps:
+        deltas[_key(recruiter_id, app)] += sign
+    await _bump(db, deltas)
+
+
+async def record_status_changes(
+    db: AsyncSession,
+    recruiter_id: uuid.UUID,
+    changes: Iterable[tuple[JobApplication | ExternalApplication, object]],
+) -> None:
+    """Move ``(app, old_status)`` pairs from their old status to ``app.status``. Caller commits."""
+    deltas = Counter()
+    for app, old_status in changes:
+        if old_status != app.status:
+            deltas[_key(recruiter_id, app, old_status)] -= 1
+            deltas[_key(recruiter_id, app)] += 1
+    await _bump(db, deltas)
+
+
+# ─── Reconciliation ───────────────────────────────────────────────────────────
+
+def _utc_month(column):
+    return cast(func.date_trunc(literal_column("'month'"), func.timezone("UTC", column)), Date)
+
+
+def rollup_from_applications(recruiter_id: uuid.UUID | None = None):
+    """SELECT of the rollup rows recomputed from both application tables."""
+    platform = (
+        select(
+            Job.recruiter_id.label("recruiter_id"),
+            JobApplication.job_id.label("job_id"),
+            cast(JobApplication.status, String).label("status"),
+            literal(PLATFORM_SOURCE).label("source"),
+            _utc_month(JobApplication.applied_at).label("month"),
+        )
+        .join(Job, Job.id == JobApplication.job_id)
+    )
+    external = (
+        select(
+            Job.recruiter_id.label("recruiter_id"),
+            ExternalApplication.job_id.label("job_id"),
+            cast(ExternalApplication.status, String).label("status"),
+            cast(ExternalApplication.source, String).label("source"),
+            _utc_month(ExternalApplication.uploaded_at).label("month"),
+        )
+        .join(Job, Job.id == ExternalApplication.job_id)
+    )
+    if recruiter_id is not None:
+        platform = platform.where(Job.recruiter_id == recruiter_id)
+        external = external.where(Job.recruiter_id == recruiter_id)
+    apps = union_all(platform, external).subquery("apps")
+    keys = [apps.c[name] for name in _KEY_COLUMNS]
+    return select(*keys, func.count().label("count")).group_by(*keys)
+
+
+async def _counted(db: AsyncSession, recruiter_id: uuid.UUID | None) -> int:
+    stmt = select(func.coalesce(func.sum(RecruiterStats.count), 0))
+    if recruiter_id is not None:
+        stmt = stmt.where(RecruiterStats.recruiter_id == recruiter_id)
+    return int((await db.execute(stmt)).scalar_one())
+
+
+async def _rebuild_one(db: AsyncSession, recruiter_id: uuid.UUID) -> tuple[int, int, int]:
+    """(rows, before, after) for one recruiter. Commits, releasing its lock."""
+    # Waits for in-flight writers of this recruiter, blocks new ones until the commit
+    await _lock_recruiter(db, recruiter_id, shared=False)
+    before = await _counted(db, recruiter_id)
+    await db.execute(delete(RecruiterStats).where(RecruiterStats.recruiter_id == recruiter_id))
+    result = await db.execute(
+        insert(RecruiterStats).from_select([*_KEY_COLUMNS, "count"], rollup_from_applications(recruiter_id))
+    )
+    after = await _counted(db, recruiter_id)
+    await db.commit()
+    return result.rowcount, before, after
+
+
+async def rebuild_recruiter_stats(db: AsyncSession, recruiter_id: uuid.UUID | None = None) -> dict:
+    """
+    Recompute the rollup (one recruiter, or everyone) from the base tables.
+    Commits after each recruiter, so writers for other recruiters are never
+    blocked and each recruiter is blocked only for its own recount.
+    """
+    t0 = time.perf_counter()
+    if recruiter_id is not None:
+        recruiter_ids = [recruiter_id]
+    else:
+        recruiter_ids = (await db.execute(
+            union(select(Job.recruiter_id), select(RecruiterStats.recruiter_id))
+        )).scalars().all()
+        await db.commit()
+
+    rows = before = after = 0
+    for rid in recruiter_ids:
+        r, b, a = await _rebuild_one(db, rid)
+        rows, before, after = rows + r, before + b, after + a
+    return {
+        "rows": rows,
+        "applications": after,
+        "drift": after - before,    # non-zero: some write path missed its delta
+        "rebuild_ms": round((time.perf_counter() - t0) * 1000, 1),
+    }
+
+
+async def run_recruiter_stats_reconciler() -> None:
+    """Background loop (started from the app lifespan) rebuilding the rollup."""
+    if not _RECONCILE_HOURS:
+        return
+    from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
+    while True:
+        await asyncio.sleep(_RECONCILE_HOURS * 3600)
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await rebuild_recruiter_stats(session)
+            print(f"[STATS] Rebuilt recruiter_stats: {result}")
+        except Exception as e:
+            print(f"[STATS] recruiter_stats rebuild failed: {e}")
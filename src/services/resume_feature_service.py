@@ -0,0 +1,199 @@
+"""
+Resume feature store
+====================
+Everything the AI pipeline derives from a resume alone (segments, normalized
+skill tuples, soft skills, years of experience, BGE skill embeddings) is
+computed once when the resume is saved and stored in ``resume_features``.
+Scoring then only runs the JD-dependent stages.
+
+Rows are keyed by resume and stamped with ``current_feature_version()``
+(``PIPELINE_VERSION`` plus the active embedding / NER model versions) and
+the resume's ``updated_at``; a mismatch on either is treated as a miss and
+the features are rebuilt on demand. Promoting a new embedding / NER model
+also queues background rebuilds of every stale row.
+"""
+
+import os
+import uuid
+from datetime import datetime, timezone
+from functools import partial
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.resume_features_model import ResumeFeatures
+from src.models.resume_model import Resume
+from src.services.ai_pipeline_service import (
+    FEATURE_MODEL_KINDS,
+    FEATURE_STORE_PROFILE,
+    PipelineProfile,
+    ResumeFeatureSet,
+    build_resume_features,
+    current_feature_version,
+    get_pipeline_profile,
+)
+from src.services.model_registry_service import on_model_swap
+from src.utils.task_queue import BoundedTaskQueue, spawn
+from src.utils.vector_index import from_bytes, to_bytes
+
+_FEATURE_BUILD_WORKERS = int(os.getenv("RESUME_FEATURE_WORKERS", "1"))
+_FEATURE_BUILD_QUEUE_SIZE = int(os.getenv("RESUME_FEATURE_QUEUE_SIZE", "500"))
+
+_feature_queue = BoundedTaskQueue("resume-features", _FEATURE_BUILD_WORKERS, _FEATURE_BUILD_QUEUE_SIZE)
+
+
+# ─── (De)serialization ────────────────────────────────────────────────────────
+
+def _to_feature_set(row: ResumeFeatures) -> ResumeFeatureSet:
+    embeddings = None
+    if row.skill_embeddings and row.embedding_dim:
+        embeddings = from_bytes(row.skill_embeddings).reshape(-1, row.embedding_dim)
+    return ResumeFeatureSet(
+        segments=row.segments or {},
+        skill_text=row.skill_text or "",
+        skill_tuples=[(name, category) for name, category in row.skill_tuples or []],
+        soft_skills=list(row.soft_skills or []),
+        years_experience=row.years_experience or 0,
+        skill_embeddings=embeddings,
+        profile_embedding=from_bytes(row.profile_embedding),
+        pipeline_version=row.pipeline_version,
+    )
+
+
+def _to_row_values(resume: Resume, features: ResumeFeatureSet) -> dict:
+    embeddings = features.skill_embeddings
+    has_embeddings = embeddings is not None and getattr(embeddings, "size", 0) > 0
+    return {
+        "resume_id": resume.id,
+        "pipeline_version": features.pipeline_version,
+        "segments": features.segments,
+        "skill_text": features.skill_text,
+        "skill_tuples": [list(t) for t in features.skill_tuples],
+        "soft_skills": features.soft_skills,
+        "years_experience": features.years_experience,
+        "skill_embeddings": to_bytes(embeddings) if has_embeddings else None,
+        "embedding_dim": int(embeddings.shape[1]) if has_embeddings else None,
+        "profile_embedding": to_bytes(features.profile_embedding) if features.profile_embedding is not None else None,
+        "resume_updated_at": resume.updated_at,
+        "computed_at": datetime.now(timezone.utc),
+    }
+
+
+def _is_fresh(row: ResumeFeatures | None, resume: Resume) -> bool:
+    return (
+        row is not None
+        and row.pipeline_version == current_feature_version()
+        and row.resume_updated_at == resume.updated_at
+    )
+
+
+# ─── Public API ───────────────────────────────────────────────────────────────
+
+async def compute_and_store_features(db: AsyncSession, resume: Resume) -> ResumeFeatureSet:
+    """Build features for ``resume`` and upsert them. Caller commits."""
+    features = await build_resume_features(
+        resume_data=resume.resume_data, with_embeddings=True, profile=FEATURE_STORE_PROFILE,
+    )
+    values = _to_row_values(resume, features)
+    stmt = insert(ResumeFeatures).values(**values)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[ResumeFeatures.resume_id],
+        set_={k: stmt.excluded[k] for k in values if k != "resume_id"},
+    ))
+    return features
+
+
+async def get_resume_features(
+    db: AsyncSession,
+    resume: Resume,
+    profile: str | PipelineProfile | None = None,
+) -> ResumeFeatureSet:
+    """
+    Stored features for ``resume``; rebuilt (and persisted) when missing or
+    stale. For a ``profile`` without NER (the "fast" preview) a miss is not
+    worth a full build: it gets a cheap in-memory set and the stored build is
+    queued instead.
+    """
+    row = await db.get(ResumeFeatures, resume.id)
+    if _is_fresh(row, resume):
+        return _to_feature_set(row)
+    if profile is not None and not get_pipeline_profile(profile).ner:
+        schedule_resume_feature_build(resume.id)
+        return await build_resume_features(resume_data=resume.resume_data, profile=profile)
+    features = await compute_and_store_features(db, resume)
+    await db.commit()
+    return features
+
+
+async def get_resume_features_map(
+    db: AsyncSession,
+    resumes: list[Resume],
+) -> dict[uuid.UUID, ResumeFeatureSet]:
+    """
+    Fresh stored features for several resumes in one query. Resumes without a
+    fresh row are left out — the pipeline builds those inline — and queued for
+    a background rebuild so the next run hits the store.
+    """
+    if not resumes:
+        return {}
+    result = await db.execute(
+        select(ResumeFeatures).where(ResumeFeatures.resume_id.in_([r.id for r in resumes]))
+    )
+    rows = {row.resume_id: row for row in result.scalars().all()}
+
+    features: dict[uuid.UUID, ResumeFeatureSet] = {}
+    for resume in resumes:
+        row = rows.get(resume.id)
+        if _is_fresh(row, resume):
+            features[resume.id] = _to_feature_set(row)
+        else:
+            schedule_resume_feature_build(resume.id)
+    return features
+
+
+async def _build_features_bg(resume_id: uuid.UUID) -> None:
+    from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
+    async with AsyncSessionLocal() as session:
+        resume = await session.get(Resume, resume_id)
+        if resume is None:
+            return
+        row = await session.get(ResumeFeatures, resume_id)
+        if _is_fresh(row, resume):
+            return
+        await compute_and_store_features(session, resume)
+        await session.commit()
+        print(f"[FEATURES] Built resume features for {resume_id}")
+
+
+def schedule_resume_feature_build(resume_id: uuid.UUID) -> bool:
+    """
+    Queue a background (re)build of a resume's features without waiting.
+    Returns False (job dropped) when the queue is full; scoring builds the
+    features inline on a miss anyway.
+    """
+    return _feature_queue.submit_nowait(lambda: _build_features_bg(resume_id))
+
+
+async def _rebuild_stale_resumes(kind: str) -> None:
+    from src.config.db import AsyncSessionLocal  # noqa: avoid circular import at module level
+    async with AsyncSessionLocal() as session:
+        resume_ids = (await session.execute(
+            select(ResumeFeatures.resume_id).where(ResumeFeatures.pipeline_version != current_feature_version())
+        )).scalars().all()
+    for resume_id in resume_ids:
+        # Background producer: waits for room instead of dropping rebuilds
+        await _feature_queue.submit(partial(_build_features_bg, resume_id))
+    print(f"[FEATURES] {kind} model changed — queued {len(resume_ids)} resume rebuilds")
+
+
+def _on_model_swap(kind: str) -> None:
+    if kind in FEATURE_MODEL_KINDS:
+        spawn(_rebuild_stale_resumes(kind), name=f"rebuild-resumes-{kind}")
+
+
+on_model_swap(_on_model_swap)
+
+
+def feature_queue_stats() -> dict:
+    return _feature_queue.stats()
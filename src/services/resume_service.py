@@ -8,6 +8,8 @@ from src.models.resume_model import Resume
 from src.models.skill_gap_report_model import SkillGapReport
 from src.models.learning_roadmap_model import LearningRoadmap
 from src.models.job_application_model import JobApplication
+from src.services.dashboard_cache_service import CANDIDATE, invalidate_dashboard
+from src.services.resume_feature_service import schedule_resume_feature_build
 from src.schema.resume_schema import (
     ResumeCreateSchema,
     ResumeUpdateSchema,
@@ -28,6 +30,10 @@ class ResumeService:
         db.add(resume)
         await db.commit()
         await db.refresh(resume)
+        await invalidate_dashboard(CANDIDATE, candidate_id)
+
+        # Precompute AI pipeline features off the request path
+        schedule_resume_feature_build(resume.id)
 
         return resume
 
@@ -101,6 +107,9 @@ class ResumeService:
         await db.commit()
         await db.refresh(resume)
 
+        if "resume_data" in update_data:
+            schedule_resume_feature_build(resume.id)
+
         return resume
 
     # ------------------------- Delete Resume ---------------------------------------------
@@ -156,4 +165,5 @@ class ResumeService:
                 details={"error": str(e)},
             )
 
+        await invalidate_dashboard(CANDIDATE, candidate_id)
         return True
@@ -34,6 +34,8 @@ from src.schema.application_schema import (
     LearningRoadmapResponse,
 )
 from src.services.ai_pipeline_service import run_pipeline
+from src.services.dashboard_cache_service import CANDIDATE, invalidate_dashboard
+from src.services.resume_feature_service import get_resume_features
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
 
@@ -67,6 +69,7 @@ async def analyze_skill_gap_service(
     resume_id: uuid.UUID,
     jd_text: str,
     current_user: User,
+    profile: str | None = None,
 ) -> SkillGapAnalysisResponse:
     """Run the AI pipeline for a candidate's resume vs a job description
     and persist the result + roadmap to the database."""
@@ -95,6 +98,8 @@ async def analyze_skill_gap_service(
     pipeline_result = await run_pipeline(
         jd_text=jd_text,
         resume_data=resume.resume_data,
+        resume_features=await get_resume_features(db, resume),
+        profile=profile,
     )
 
     # Map pipeline dataclasses → Pydantic schemas
@@ -173,6 +178,7 @@ async def analyze_skill_gap_service(
     await db.commit()
     await db.refresh(report)
     await db.refresh(roadmap_record)
+    await invalidate_dashboard(CANDIDATE, candidate_profile.id)
 
     return SkillGapAnalysisResponse(
         analysis_id=str(report.id),
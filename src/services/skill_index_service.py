@@ -0,0 +1,176 @@
+"""
+Skill inverted index
+====================
+The canonical ids of matched / missing skills in each ``ai_analysis`` are
+materialized into ``matched_skill_ids`` / ``missing_skill_ids`` (``text[]``
+with GIN indexes) on both application tables. Every code path that writes a
+score goes through ``set_analysis`` / ``analysis_values`` so the arrays never
+drift from the JSONB.
+
+``filter_applicants_by_skills_service`` answers "has X / missing Y" queries
+with ``@>`` / ``&&`` array predicates over a UNION ALL of platform and
+external applicants, sorted and paginated in SQL.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import String, cast, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.candidate_profile_model import CandidateProfile
+from src.models.external_application_model import ExternalApplication
+from src.models.job_application_model import JobApplication
+from src.models.job_model import Job
+from src.models.user_model import User, UserRole
+from src.schema.application_schema import (
+    SkillFilterItem,
+    SkillFilterRequest,
+    SkillFilterResponse,
+)
+from src.services.ai_pipeline_service import canonical_skill_id
+from src.utils.error_code import ErrorCode
+from src.utils.exceptions import AppException
+
+
+def _ids(items) -> list[str]:
+    seen: dict[str, None] = {}
+    for item in items or []:
+        cid = item.get("canonical_id") if isinstance(item, dict) else None
+        if cid:
+            seen.setdefault(cid, None)
+    return list(seen)
+
+
+def skill_ids_from_analysis(analysis: dict | None) -> tuple[list[str], list[str]]:
+    """(matched_ids, missing_ids) from a stored ApplicationAnalysisSchema dict."""
+    if not analysis:
+        return [], []
+    return _ids(analysis.get("matched_skills")), _ids(analysis.get("missing_skills"))
+
+
+def analysis_values(score: int | None, analysis: dict | None, scored_at: datetime | None) -> dict:
+    """Column values for a score write (UPDATE ... VALUES / bulk insert rows)."""
+    matched, missing = skill_ids_from_analysis(analysis)
+    return {
+        "ai_score": score,
+        "ai_analysis": analysis,
+        "ai_scored_at": scored_at,
+        "matched_skill_ids": matched,
+        "missing_skill_ids": missing,
+    }
+
+
+def set_analysis(
+    row: JobApplication | ExternalApplication,
+    score: int | None,
+    analysis: dict | None,
+    scored_at: datetime | None,
+) -> None:
+    """Write a score onto an ORM row together with its skill id arrays."""
+    for column, value in analysis_values(score, analysis, scored_at).items():
+        setattr(row, column, value)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# POST /api/applications/job/{job_id}/skill-filter
+# ─────────────────────────────────────────────────────────────────────────────
+def _skill_predicates(model, payload: SkillFilterRequest) -> list:
+    def canon(names: list[str]) -> list[str]:
+        return [cid for cid in {canonical_skill_id(n) for n in names} if cid]
+
+    conditions = []
+    if payload.has_all:
+        conditions.append(model.matched_skill_ids.contains(canon(payload.has_all)))
+    if payload.has_any:
+        conditions.append(model.matched_skill_ids.overlap(canon(payload.has_any)))
+    if payload.missing_any:
+        conditions.append(model.missing_skill_ids.overlap(canon(payload.missing_any)))
+    if payload.missing_none:
+        conditions.append(~model.missing_skill_ids.overlap(canon(payload.missing_none)))
+    if payload.min_score is not None:
+        conditions.append(model.ai_score >= payload.min_score)
+    return conditions
+
+
+async def filter_applicants_by_skills_service(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+    payload: SkillFilterRequest,
+    current_user: User,
+) -> SkillFilterResponse:
+    if current_user.role != UserRole.RECRUITER:
+        raise AppException(ErrorCode.FORBIDDEN, "Only recruiters can filter applicants")
+
+    recruiter_profile = getattr(current_user, "recruiter_profile", None)
+    if recruiter_profile is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Recruiter profile not found")
+
+    job = (await db.execute(select(Job).where(Job.id == job_id))).scalar_one_or_none()
+    if job is None:
+        raise AppException(ErrorCode.RESOURCE_NOT_FOUND, "Job not found")
+    if job.recruiter_id != recruiter_profile.id:
+        raise AppException(ErrorCode.UNAUTHORIZED_ACCESS, "You are not authorized to view these applications")
+
+    platform = (
+        select(
+            literal("PLATFORM").label("source"),
+            JobApplication.id.label("id"),
+            CandidateProfile.full_name.label("candidate_name"),
+            cast(JobApplication.status, String).label("status"),
+            JobApplication.ai_score.label("ai_score"),
+            JobApplication.applied_at.label("applied_at"),
+            JobApplication.matched_skill_ids.label("matched_skill_ids"),
+            JobApplication.missing_skill_ids.label("missing_skill_ids"),
+        )
+        .join(CandidateProfile, CandidateProfile.id == JobApplication.candidate_id)
+        .where(JobApplication.job_id == job_id, *_skill_predicates(JobApplication, payload))
+    )
+    external = (
+        select(
+            literal("EXTERNAL").label("source"),
+            ExternalApplication.id.label("id"),
+            ExternalApplication.candidate_name.label("candidate_name"),
+            cast(ExternalApplication.status, String).label("status"),
+            ExternalApplication.ai_score.label("ai_score"),
+            ExternalApplication.uploaded_at.label("applied_at"),
+            ExternalApplication.matched_skill_ids.label("matched_skill_ids"),
+            ExternalApplication.missing_skill_ids.label("missing_skill_ids"),
+        )
+        .where(ExternalApplication.job_id == job_id, *_skill_predicates(ExternalApplication, payload))
+    )
+    applicants = union_all(platform, external).subquery("applicants")
+
+    sort_column = {
+        "ai_score": applicants.c.ai_score,
+        "applied_at": applicants.c.applied_at,
+        "matched_count": func.cardinality(applicants.c.matched_skill_ids),
+    }[payload.sort]
+    sort_key = sort_column.desc().nulls_last() if payload.order == "desc" else sort_column.asc().nulls_last()
+
+    total = (await db.execute(select(func.count()).select_from(applicants))).scalar_one()
+    rows = (await db.execute(
+        select(applicants)
+        .order_by(sort_key, applicants.c.id)
+        .limit(payload.limit)
+        .offset(payload.offset)
+    )).all()
+
+    return SkillFilterResponse(
+        items=[
+            SkillFilterItem(
+                application_id=row.id,
+                source=row.source,
+                candidate_name=row.candidate_name,
+                status=row.status,
+                ai_score=row.ai_score,
+                applied_at=row.applied_at,
+                matched_skill_ids=list(row.matched_skill_ids or []),
+                missing_skill_ids=list(row.missing_skill_ids or []),
+            )
+            for row in rows
+        ],
+        total=total,
+        limit=payload.limit,
+        offset=payload.offset,
+    )
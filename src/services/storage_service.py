@@ -0,0 +1,262 @@
+"""
+Object storage layer
+====================
+Async facade over the file store used for resumes and uploads.
+
+* ``SupabaseStorageBackend`` — production bucket; the blocking supabase client
+  runs in a worker thread so uploads never block the event loop.
+* ``LocalStorageBackend`` — plain directory on disk for local runs, tests and
+  benchmarks (STORAGE_BACKEND=local).
+
+Uploads are read in chunks while hashing, and keys are content-addressed
+(``<prefix>/<sha256>.<ext>``), so the same file uploaded twice maps to the same
+object and is only written once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+
+from fastapi import UploadFile
+from storage3.exceptions import StorageApiError
+
+_STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "supabase").strip().lower()
+_STORAGE_BUCKET = os.getenv("STORAGE_BUCKET", "document")
+_LOCAL_STORAGE_DIR = os.getenv("LOCAL_STORAGE_DIR", "storage")
+_LOCAL_STORAGE_BASE_URL = os.getenv(
+    "LOCAL_STORAGE_BASE_URL",
+    f"{os.getenv('LOCAL_BASE_URL', 'http://localhost:8000')}/storage",
+)
+_UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(256 * 1024)))
+_UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+_UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", "8"))
+
+
+class StorageError(Exception):
+    """Raised when the storage backend rejects or fails an operation."""
+
+
+class UploadTooLargeError(StorageError):
+    """Raised when an upload exceeds UPLOAD_MAX_BYTES."""
+
+
+@dataclass
+class UploadPayload:
+    """A fully read upload, ready to be stored."""
+    filename: str
+    content: bytes
+    sha256: str
+    content_type: str | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def extension(self) -> str:
+        if "." in self.filename:
+            return self.filename.rsplit(".", 1)[-1].lower()
+        return "bin"
+
+    def key(self, prefix: str = "") -> str:
+        name = f"{self.sha256}.{self.extension}"
+        return f"{prefix.strip('/')}/{name}" if prefix else name
+
+
+@dataclass
+class StoredObject:
+    key: str
+    url: str
+    sha256: str
+    size: int
+    deduplicated: bool = False   # object already existed, nothing was written
+
+
+# ─── Backends ─────────────────────────────────────────────────────────────────
+
+class StorageBackend:
+    """Async storage interface. Implementations must be safe to call concurrently."""
+
+    async def put(self, key: str, content: bytes, content_type: str | None = None) -> bool:
+        """Store ``content`` under ``key``. Returns False if the key already existed."""
+        raise NotImplementedError
+
+    async def get(self, key: str) -> bytes:
+        raise NotImplementedError
+
+    def public_url(self, key: str) -> str:
+        raise NotImplementedError
+
+
+class SupabaseStorageBackend(StorageBackend):
+    def __init__(self, bucket: str):
+        self.bucket = bucket
+
+    def _bucket(self):
+        from src.config.supabase_config import supabase  # noqa: lazy, needs env config
+        return supabase.storage.from_(self.bucket)
+
+    async def put(self, key: str, content: bytes, content_type: str | None = None) -> bool:
+        options = {"content-type": content_type} if content_type else None
+        try:
+            await asyncio.to_thread(self._bucket().upload, key, content, options)
+        except StorageApiError as e:
+            # Content-addressed key already present → same bytes, nothing to do
+            if str(e.status) == "409" or e.code == "Duplicate":
+                return False
+            raise StorageError(e.message) from e
+        except Exception as e:
+            raise StorageError(str(e)) from e
+        return True
+
+    async def get(self, key: str) -> bytes:
+        try:
+            return await asyncio.to_thread(self._bucket().download, key)
+        except Exception as e:
+            raise StorageError(str(e)) from e
+
+    def public_url(self, key: str) -> str:
+        # get_public_url only formats a string, no network round trip
+        url = self._bucket().get_public_url(key)
+        if not url:
+            raise StorageError("Failed to get public URL from storage")
+        return url
+
+
+class LocalStorageBackend(StorageBackend):
+    def __init__(self, root: str, base_url: str):
+        self.root = os.path.abspath(root)
+        self.base_url = base_url.rstrip("/")
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise StorageError(f"Invalid storage key: {key}")
+        return path
+
+    def _write(self, path: str, content: bytes) -> bool:
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"     # unique per write: concurrent puts of one key
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        return True
+
+    def _read(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    async def put(self, key: str, content: bytes, content_type: str | None = None) -> bool:
+        try:
+            return await asyncio.to_thread(self._write, self._path(key), content)
+        except OSError as e:
+            raise StorageError(str(e)) from e
+
+    async def get(self, key: str) -> bytes:
+        try:
+            return await asyncio.to_thread(self._read, self._path(key))
+        except OSError as e:
+            raise StorageError(str(e)) from e
+
+    def public_url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+_storage: StorageBackend | None = None
+
+
+def get_storage() -> StorageBackend:
+    global _storage
+    if _storage is None:
+        if _STORAGE_BACKEND == "local":
+            _storage = LocalStorageBackend(_LOCAL_STORAGE_DIR, _LOCAL_STORAGE_BASE_URL)
+        else:
+            _storage = SupabaseStorageBackend(_STORAGE_BUCKET)
+    return _storage
+
+
+def set_storage(backend: StorageBackend) -> None:
+    """Swap the active backend (tests / benchmarks)."""
+    global _storage
+    _storage = backend
+
+
+def local_storage_dir() -> str | None:
+    """Directory to serve at /storage when the local backend is active."""
+    if _STORAGE_BACKEND == "local":
+        return os.path.abspath(_LOCAL_STORAGE_DIR)
+    return None
+
+
+# ─── Public API ───────────────────────────────────────────────────────────────
+
+async def read_upload(file: UploadFile, max_bytes: int | None = None) -> UploadPayload:
+    """
+    Read an UploadFile in fixed-size chunks, hashing as it goes, and stop early
+    once ``max_bytes`` is exceeded instead of buffering an oversized body.
+    """
+    max_bytes = _UPLOAD_MAX_BYTES if max_bytes is None else max_bytes
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    while True:
+        chunk = await file.read(_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        if len(buffer) > max_bytes:
+            raise UploadTooLargeError(
+                f"{file.filename} exceeds the {max_bytes // (1024 * 1024)} MB upload limit"
+            )
+        digest.update(chunk)
+    await file.seek(0)
+    return UploadPayload(
+        filename=file.filename or "upload",
+        content=bytes(buffer),
+        sha256=digest.hexdigest(),
+        content_type=file.content_type,
+    )
+
+
+async def store_payload(payload: UploadPayload, prefix: str = "") -> StoredObject:
+    storage = get_storage()
+    key = payload.key(prefix)
+    created = await storage.put(key, payload.content, payload.content_type)
+    return StoredObject(
+        key=key,
+        url=storage.public_url(key),
+        sha256=payload.sha256,
+        size=payload.size,
+        deduplicated=not created,
+    )
+
+
+async def store_upload(file: UploadFile, prefix: str = "") -> tuple[UploadPayload, StoredObject]:
+    payload = await read_upload(file)
+    return payload, await store_payload(payload, prefix)
+
+
+async def store_many(
+    payloads: list[UploadPayload],
+    prefix: str = "",
+    concurrency: int | None = None,
+) -> list[StoredObject | Exception]:
+    """
+    Store several payloads in parallel with at most ``concurrency`` uploads in
+    flight. Results keep the input order; failures are returned, not raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency or _UPLOAD_CONCURRENCY))
+
+    async def _one(payload: UploadPayload) -> StoredObject | Exception:
+        async with semaphore:
+            try:
+                return await store_payload(payload, prefix)
+            except Exception as e:
+                return e
+
+    return await asyncio.gather(*(_one(p) for p in payloads))
@@ -0,0 +1,252 @@
+"""
+Document text extraction service
+================================
+PDF / DOCX parsing is CPU bound and PyPDF2 can spin for a long time on large or
+malformed files, so extraction never runs on the event loop. Documents are
+parsed in a fixed set of worker processes with a wall-clock timeout, a page
+limit and an output character limit. Parsers are pluggable through ``ExtractionBackend`` so a faster
+PDF engine can be registered without touching the callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import multiprocessing
+import os
+
+_EXTRACTION_WORKERS = int(os.getenv("TEXT_EXTRACTION_WORKERS", "2"))
+_EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("TEXT_EXTRACTION_TIMEOUT_SECONDS", "20"))
+_EXTRACTION_MAX_PAGES = int(os.getenv("TEXT_EXTRACTION_MAX_PAGES", "30"))
+_EXTRACTION_MAX_CHARS = int(os.getenv("TEXT_EXTRACTION_MAX_CHARS", "100000"))
+
+
+class TextExtractionError(Exception):
+    """Raised when a document cannot be parsed."""
+
+
+class TextExtractionTimeout(TextExtractionError):
+    """Raised when a document exceeds the extraction wall-clock timeout."""
+
+
+# ─── Backends ─────────────────────────────────────────────────────────────────
+
+class ExtractionBackend:
+    """
+    Base class for document parsers.
+
+    Backends are pickled into the worker process, so they must be defined at
+    module level and keep no unpicklable state.
+    """
+
+    name: str = ""
+    extensions: tuple[str, ...] = ()
+
+    def supports(self, filename: str) -> bool:
+        return filename.lower().endswith(self.extensions)
+
+    def extract(self, data: bytes, max_pages: int, max_chars: int, separator: str) -> str:
+        raise NotImplementedError
+
+
+def _join_limited(parts, max_chars: int, separator: str) -> str:
+    """Join text parts, stopping as soon as ``max_chars`` is reached."""
+    out: list[str] = []
+    total = 0
+    for part in parts:
+        if total >= max_chars:
+            break
+        out.append(part)
+        total += len(part) + len(separator)
+    return separator.join(out)[:max_chars]
+
+
+class PyPDF2Backend(ExtractionBackend):
+    name = "pypdf2"
+    extensions = (".pdf",)
+
+    def extract(self, data: bytes, max_pages: int, max_chars: int, separator: str) -> str:
+        import PyPDF2
+
+        reader = PyPDF2.PdfReader(io.BytesIO(data), strict=False)
+        pages = reader.pages[:max_pages] if max_pages > 0 else reader.pages
+        return _join_limited((page.extract_text() or "" for page in pages), max_chars, separator)
+
+
+class DocxBackend(ExtractionBackend):
+    name = "python-docx"
+    extensions = (".docx",)
+
+    def extract(self, data: bytes, max_pages: int, max_chars: int, separator: str) -> str:
+        import docx
+
+        doc = docx.Document(io.BytesIO(data))
+        return _join_limited((para.text for para in doc.paragraphs), max_chars, separator)
+
+
+_BACKENDS: list[ExtractionBackend] = [PyPDF2Backend(), DocxBackend()]
+
+
+def register_backend(backend: ExtractionBackend, *, replace: bool = True) -> None:
+    """
+    Register a parser. Backends registered later take precedence, so a faster
+    PDF engine can be slotted in front of PyPDF2. With ``replace`` any existing
+    backend handling the same extensions is dropped.
+    """
+    if replace:
+        _BACKENDS[:] = [
+            b for b in _BACKENDS
+            if not set(b.extensions) & set(backend.extensions)
+        ]
+    _BACKENDS.insert(0, backend)
+
+
+def get_backend(filename: str) -> ExtractionBackend | None:
+    for backend in _BACKENDS:
+        if backend.supports(filename):
+            return backend
+    return None
+
+
+def is_supported(filename: str) -> bool:
+    return get_backend(filename) is not None
+
+
+# ─── Worker processes ─────────────────────────────────────────────────────────
+# Each worker is a single "spawn" process (free of the parent's torch / FAISS
+# state) fed over its own pipe. A job is only handed to an idle worker, so the
+# timeout measures parsing time rather than time spent queueing, and a worker
+# that overruns it is killed and replaced — the number of processes never
+# exceeds TEXT_EXTRACTION_WORKERS.
+
+class _Worker:
+    def __init__(self) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+def _worker_main(conn) -> None:
+    """Worker entry point: parse jobs from the pipe until it is closed."""
+    while True:
+        try:
+            backend, data, max_pages, max_chars, separator = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            conn.send(("ok", backend.extract(data, max_pages, max_chars, separator)))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+
+def _run_job(worker: _Worker, job: tuple, timeout: float) -> tuple[str, str | None]:
+    """
+    Blocking round trip with one worker (runs in a thread). The worker is
+    killed here when it overruns ``timeout`` or dies, so it never takes new work.
+    """
+    try:
+        worker.conn.send(job)
+        if worker.conn.poll(timeout):
+            return worker.conn.recv()
+        outcome = ("timeout", None)
+    except (EOFError, OSError):
+        outcome = ("crashed", None)
+    worker.kill()
+    return outcome
+
+
+_idle: asyncio.Queue[_Worker | None] | None = None
+_workers: set[_Worker] = set()
+
+
+def _idle_queue() -> asyncio.Queue[_Worker | None]:
+    """Idle slots; ``None`` is a free slot whose worker is started on demand."""
+    global _idle
+    if _idle is None:
+        _idle = asyncio.Queue()
+        for _ in range(max(1, _EXTRACTION_WORKERS)):
+            _idle.put_nowait(None)
+    return _idle
+
+
+async def _acquire_worker() -> _Worker:
+    worker = await _idle_queue().get()
+    if worker is None or not worker.is_alive():
+        _workers.discard(worker)
+        worker = _Worker()
+        _workers.add(worker)
+    return worker
+
+
+def _release_worker(worker: _Worker, future: asyncio.Future) -> None:
+    """Return the slot once the round trip is over, whatever the caller did meanwhile."""
+    if future.cancelled() or future.exception() or future.result()[0] in ("timeout", "crashed"):
+        _workers.discard(worker)
+        if worker.is_alive():
+            worker.kill()
+        worker = None
+    if _idle is not None:
+        _idle.put_nowait(worker)
+
+
+def shutdown_extraction_pool() -> None:
+    global _idle
+    for worker in list(_workers):
+        worker.kill()
+    _workers.clear()
+    _idle = None
+
+
+# ─── Public API ───────────────────────────────────────────────────────────────
+
+async def extract_text(
+    data: bytes,
+    filename: str,
+    *,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    timeout: float | None = None,
+    separator: str = "\n",
+) -> str:
+    """
+    Extract plain text from a PDF / DOCX payload in a worker process.
+
+    Waits for an idle worker first; ``timeout`` starts once the worker has the
+    document. Raises TextExtractionError for unsupported or unreadable files and
+    TextExtractionTimeout when the document takes longer than ``timeout``.
+    """
+    backend = get_backend(filename)
+    if backend is None:
+        raise TextExtractionError(f"Unsupported file type: {filename}")
+
+    max_pages = _EXTRACTION_MAX_PAGES if max_pages is None else max_pages
+    max_chars = _EXTRACTION_MAX_CHARS if max_chars is None else max_chars
+    timeout = _EXTRACTION_TIMEOUT_SECONDS if timeout is None else timeout
+
+    worker = await _acquire_worker()
+    future = asyncio.get_running_loop().run_in_executor(
+        None, _run_job, worker, (backend, data, max_pages, max_chars, separator), timeout
+    )
+    future.add_done_callback(lambda f: _release_worker(worker, f))
+    # Shielded so a cancelled caller leaves the worker to finish (or be killed
+    # on timeout) before its slot is reused.
+    status, result = await asyncio.shield(future)
+
+    if status == "ok":
+        return result
+    if status == "timeout":
+        print(f"[EXTRACT] Timed out after {timeout}s on {filename} — killed its worker")
+        raise TextExtractionTimeout(f"Extraction timed out after {timeout}s")
+    if status == "crashed":
+        raise TextExtractionError("Extraction worker crashed")
+    raise TextExtractionError(result)
@@ -5,7 +5,6 @@ from email.mime.text import MIMEText
 
 from src.config.env_config import ENV_CONFIG
 from src.utils.email_templates import (
-    verification_email_template,
     new_application_notification_template,
     application_status_update_template,
     shortlist_notification_template,
@@ -16,19 +15,55 @@ _SMTP_PORT = 587
 _FROM_NAME = "ResumeEZ"
 
 
-def _send_email_sync(to: str, subject: str, html: str) -> None:
-    """Blocking SMTP send — called via run_in_executor so it never blocks the event loop."""
+def _build_message(to: str, subject: str, html: str) -> MIMEMultipart:
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
     msg["From"] = f"{_FROM_NAME} <{ENV_CONFIG.APP_EMAIL}>"
     msg["To"] = to
     msg.attach(MIMEText(html, "html"))
+    return msg
+
+
+def _smtp_connection() -> smtplib.SMTP:
+    server = smtplib.SMTP(_SMTP_HOST, _SMTP_PORT)
+    server.ehlo()
+    server.starttls()
+    server.login(ENV_CONFIG.APP_EMAIL, ENV_CONFIG.APP_PASS)
+    return server
 
-    with smtplib.SMTP(_SMTP_HOST, _SMTP_PORT) as server:
-        server.ehlo()
-        server.starttls()
-        server.login(ENV_CONFIG.APP_EMAIL, ENV_CONFIG.APP_PASS)
-        server.sendmail(ENV_CONFIG.APP_EMAIL, to, msg.as_string())
+
+def _send_email_sync(to: str, subject: str, html: str) -> None:
+    """Blocking SMTP send — called via run_in_executor so it never blocks the event loop."""
+    with _smtp_connection() as server:
+        server.sendmail(ENV_CONFIG.APP_EMAIL, to, _build_message(to, subject, html).as_string())
+
+
+def send_emails_sync(messages: list[tuple[str, str, str]]) -> list[str | None]:
+    """
+    Blocking send of ``(to, subject, html)`` messages over one SMTP connection
+    (one STARTTLS + login for the whole batch). Returns an error per message,
+    None when it was accepted. Raises only if the connection cannot be opened,
+    i.e. when nothing was sent.
+    """
+    errors: list[str | None] = []
+    server = _smtp_connection()
+    try:
+        for to, subject, html in messages:
+            try:
+                server.sendmail(ENV_CONFIG.APP_EMAIL, to, _build_message(to, subject, html).as_string())
+                errors.append(None)
+            except (smtplib.SMTPServerDisconnected, ConnectionError) as e:
+                # Connection dropped: this message and the rest of the batch were not sent
+                errors.extend([str(e)] * (len(messages) - len(errors)))
+                break
+            except (smtplib.SMTPException, OSError) as e:
+                errors.append(str(e))
+    finally:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    return errors
 
 
 async def _send_email(to: str, subject: str, html: str) -> None:
@@ -40,18 +75,6 @@ async def _send_email(to: str, subject: str, html: str) -> None:
         print(f"[EMAIL] Failed to send to {to}: {e}")
 
 
-async def send_verification_email(email: str, token: str) -> None:
-    """Send account verification email — raises on failure (intentional, used during signup)."""
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(
-        None,
-        _send_email_sync,
-        email,
-        "Verify your ResumeEZ account",
-        verification_email_template(token),
-    )
-
-
 async def send_new_application_notification(
     recruiter_email: str,
     candidate_name: str,
@@ -0,0 +1,106 @@
+"""
+MinHash signatures + LSH banding for near-duplicate text detection.
+
+Signatures are plain ``list[int]`` so they can be stored as JSONB. The hash
+family is seeded, so signatures are stable across processes and restarts.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+
+import numpy as np
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+# 32 bands x 4 rows → ~50% chance of candidacy at Jaccard 0.42 and >99.9% at 0.85,
+# the exact similarity is then verified against the signatures.
+LSH_BANDS = 32
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.RandomState(1337)
+_PERM_A = _rng.randint(1, (1 << 31) - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_PERM_B = _rng.randint(0, (1 << 31) - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+
+_RE_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> set[str]:
+    """Word k-grams over the lower-cased, punctuation-free token stream."""
+    tokens = _RE_TOKEN.findall((text or "").lower())
+    if len(tokens) < k:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+
+
+def minhash_signature(text: str) -> list[int] | None:
+    """Return a NUM_PERM-long MinHash signature, or None for empty text."""
+    grams = shingles(text)
+    if not grams:
+        return None
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(g.encode(), digest_size=4).digest(), "little") for g in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    )
+    # (a * x + b) mod p for every permutation x shingle, min over shingles
+    permuted = (np.outer(hashes, _PERM_A) + _PERM_B) % _MERSENNE_PRIME
+    return permuted.min(axis=0).astype(np.int64).tolist()
+
+
+def estimate_jaccard(sig_a: list[int], sig_b: list[int]) -> float:
+    if not sig_a or not sig_b or len(sig_a) != len(sig_b):
+        return 0.0
+    return float(np.mean(np.asarray(sig_a) == np.asarray(sig_b)))
+
+
+class MinHashLSH:
+    """Banded LSH index mapping item ids to MinHash signatures."""
+
+    def __init__(self, bands: int = LSH_BANDS, num_perm: int = NUM_PERM):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: list[dict[tuple, set]] = [defaultdict(set) for _ in range(bands)]
+        self._signatures: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: list[int]):
+        for b in range(self.bands):
+            yield b, tuple(signature[b * self.rows:(b + 1) * self.rows])
+
+    def insert(self, key, signature: list[int]) -> None:
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = signature
+        for b, band in self._band_keys(signature):
+            self._buckets[b][band].add(key)
+
+    def remove(self, key) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for b, band in self._band_keys(signature):
+            bucket = self._buckets[b].get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[b][band]
+
+    def query(self, signature: list[int], threshold: float) -> list[tuple[object, float]]:
+        """Items sharing at least one band, verified against ``threshold``, best first."""
+        candidates = set()
+        for b, band in self._band_keys(signature):
+            candidates |= self._buckets[b].get(band, set())
+        scored = [
+            (key, estimate_jaccard(signature, self._signatures[key]))
+            for key in candidates
+        ]
+        return sorted(
+            [(key, sim) for key, sim in scored if sim >= threshold],
+            key=lambda t: t[1],
+            reverse=True,
+        )
@@ -0,0 +1,99 @@
+"""
+Keyset (cursor) pagination.
+
+A page is requested with the sort key of the last row the client saw instead
+of an offset, so the database seeks straight to it through the sort index and
+page N costs the same as page 1. Every sort ends with the row id as a
+tie-breaker, which makes the order total and the cursor unambiguous.
+
+Cursors are opaque to clients: urlsafe base64 of the JSON array of the last
+row's sort values. Routes return the next one in the ``X-Next-Cursor``
+header (absent on the last page).
+
+Totals are the planner's row estimate (``EXPLAIN``) instead of a
+``COUNT(*)`` that would scan every matching row; routes send it as
+``X-Total-Count-Estimate``.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.utils.error_code import ErrorCode
+from src.utils.exceptions import AppException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_ESTIMATE_HEADER = "X-Total-Count-Estimate"
+
+
+def encode_cursor(*values: Any) -> str:
+    def default(value):
+        return value.isoformat() if isinstance(value, datetime) else str(value)
+
+    raw = json.dumps(values, default=default, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """Decode ``cursor`` and convert its values with ``types`` (e.g. ``datetime.fromisoformat``)."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError) as e:
+        raise AppException(ErrorCode.INVALID_INPUT, "Invalid pagination cursor") from e
+
+
+def keyset_after(columns: Sequence, values: Sequence, descending: bool = True):
+    """WHERE clause selecting the rows that follow ``values`` in ``ORDER BY columns``."""
+    key = tuple_(*columns)
+    return key < tuple_(*values) if descending else key > tuple_(*values)
+
+
+def order_by(columns: Sequence, descending: bool = True) -> list:
+    return [column.desc() if descending else column.asc() for column in columns]
+
+
+def split_page(rows: Sequence, limit: int, key: Callable[[Any], tuple]) -> tuple[list, str | None]:
+    """
+    ``rows`` were fetched with ``LIMIT limit + 1``: return the page and the
+    cursor for the next one (None when this is the last page).
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    return page, encode_cursor(*key(page[-1]))
+
+
+# ─── Count estimates ──────────────────────────────────────────────────────────
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def explain(db: AsyncSession, stmt) -> dict:
+    """Top plan node of ``EXPLAIN (FORMAT JSON) stmt``: plans the query, runs nothing."""
+    plan = (await db.execute(_Explain(stmt))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def estimate_count(db: AsyncSession, stmt) -> int:
+    """Planner's estimate of the rows ``stmt`` (without LIMIT) returns."""
+    return int((await explain(db, stmt))["Plan Rows"])
@@ -5,8 +5,9 @@ from uuid import UUID
 from typing import Type
 
 from src.config.db import get_db
-from src.middlewares.auth_middleware import require_role
-from src.models.user_model import User, UserRole
+from src.middlewares.auth_middleware import get_identity
+from src.models.user_model import UserRole
+from src.services.identity_cache_service import Identity
 from src.utils.error_code import ErrorCode
 from src.utils.exceptions import AppException
 
@@ -19,8 +20,14 @@ def ownership_required(
     async def dependency(
         resource_id: UUID,
         db: AsyncSession = Depends(get_db),
-        user: User = Depends(require_role(*allowed_roles)),
+        identity: Identity = Depends(get_identity),
     ):
+        if identity.role not in allowed_roles:
+            raise AppException(
+                ErrorCode.UNAUTHORIZED_ACCESS,
+                "You are not authorized to perform this action",
+            )
+
         # Fetch resource
         stmt = select(model).where(model.id == resource_id)
         result = await db.execute(stmt)
@@ -35,13 +42,11 @@ def ownership_required(
         # Ownership check using logged-in user's ID or profile IDs
         owner_id = getattr(instance, owner_field)
 
-        authorized = False
-        if owner_id == user.id:
-            authorized = True
-        elif hasattr(user, "candidate_profile") and user.candidate_profile and owner_id == user.candidate_profile.id:
-            authorized = True
-        elif hasattr(user, "recruiter_profile") and user.recruiter_profile and owner_id == user.recruiter_profile.id:
-            authorized = True
+        authorized = owner_id is not None and owner_id in (
+            identity.user_id,
+            identity.candidate_profile_id,
+            identity.recruiter_profile_id,
+        )
 
         if not authorized:
             raise AppException(
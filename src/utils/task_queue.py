@@ -0,0 +1,96 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Coroutine
+
+# Strong references to fire-and-forget tasks; the loop only keeps weak ones
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _on_background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"[TASKS] {task.get_name()} failed: {task.exception()}")
+
+
+def spawn(coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task:
+    """``create_task`` for background work nobody awaits: kept alive until done, failures logged."""
+    task = asyncio.get_running_loop().create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+
+class BoundedTaskQueue:
+    """
+    Fixed pool of background workers fed by a bounded queue.
+
+    ``submit`` waits while the queue is full, so background producers get
+    backpressure instead of spawning an unbounded number of tasks. Request
+    handlers use ``submit_nowait``, which never waits and reports whether the
+    job was taken. Workers are started lazily on the running event loop.
+    """
+
+    def __init__(self, name: str, workers: int, maxsize: int):
+        self.name = name
+        self.workers = max(1, workers)
+        self.maxsize = max(1, maxsize)
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.processed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def _ensure_started(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._tasks = [
+                loop.create_task(self._worker(), name=f"{self.name}-worker-{i}")
+                for i in range(self.workers)
+            ]
+        return self._queue
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            try:
+                await job()
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"[{self.name.upper()}] Job failed: {e}")
+            finally:
+                queue.task_done()
+
+    async def submit(self, job: Callable[[], Awaitable[None]]) -> None:
+        """Enqueue ``job`` (a zero-arg coroutine factory), waiting if the queue is full."""
+        await self._ensure_started().put(job)
+
+    def submit_nowait(self, job: Callable[[], Awaitable[None]]) -> bool:
+        """Enqueue ``job`` without waiting; False (job not taken) when the queue is full."""
+        try:
+            self._ensure_started().put_nowait(job)
+            return True
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def free_slots(self) -> int:
+        return self.maxsize - self.pending
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "maxsize": self.maxsize,
+            "pending": self.pending,
+            "processed": self.processed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
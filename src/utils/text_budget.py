@@ -0,0 +1,121 @@
+"""
+Token budgets for model inputs.
+
+Sections are consumed lazily, line by line, in priority order: each gets a
+share of the budget first, then whatever is left over flows back to the
+sections in the same order. Lines are only pulled (and cleaned by the
+caller's generator) until the budget is spent, so the work done on a very
+long document is bounded by the budget rather than by the document.
+
+Token counts are a cheap estimate (no tokenizer needed), not a bound: rare
+words, identifiers and non-English text split into more WordPiece / BPE
+pieces than the estimate assumes. The scoring windows are still built by the
+real tokenizer, which truncates whatever the estimate let through.
+"""
+
+import math
+from typing import Callable, Iterable, Iterator
+
+_CHARS_PER_TOKEN = 4
+_TOKENS_PER_WORD = 1.3
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough WordPiece / BPE token count: the larger of a characters-per-token
+    and a tokens-per-word estimate. Usually high for English prose, but it
+    can undercount text with many rare words or symbols.
+    """
+    if not text:
+        return 0
+    return max(math.ceil(len(text) / _CHARS_PER_TOKEN), math.ceil(len(text.split()) * _TOKENS_PER_WORD))
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Lazily yield the lines of ``text`` (no up-front split of the whole string)."""
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        yield text[start:end]
+        start = end + 1
+
+
+def _truncate_to_tokens(line: str, tokens: int, estimator: Callable[[str], int]) -> str:
+    cut = line[:tokens * _CHARS_PER_TOKEN]
+    if estimator(cut) > tokens:
+        # Binary search for the longest prefix within budget: O(log n) estimator calls
+        lo, hi = 0, len(cut) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if estimator(cut[:mid]) <= tokens:
+                lo = mid
+            else:
+                hi = mid - 1
+        cut = cut[:lo]
+    return cut.rsplit(" ", 1)[0] if " " in cut else cut
+
+
+class _Section:
+    def __init__(self, name: str, lines: Iterable[str], share: float):
+        self.name = name
+        self.lines = iter(lines)
+        self.share = share
+        self.taken: list[str] = []
+        self.pending: str | None = None    # a line that did not fit the quota
+        self.exhausted = False
+        self.spent = 0
+
+    def take(self, allowance: int, estimator: Callable[[str], int], truncate_last: bool) -> int:
+        """Append lines until ``allowance`` tokens are used; returns tokens spent."""
+        used = 0
+        while not self.exhausted:
+            line = self.pending if self.pending is not None else next(self.lines, None)
+            self.pending = None
+            if line is None:
+                self.exhausted = True
+                break
+            cost = estimator(line)
+            if used + cost <= allowance:
+                self.taken.append(line)
+                used += cost
+                continue
+            if truncate_last:
+                head = _truncate_to_tokens(line, allowance - used, estimator)
+                if head:
+                    self.taken.append(head)
+                    used += estimator(head)
+                self.exhausted = True
+            else:
+                self.pending = line
+            break
+        self.spent += used
+        return used
+
+
+def budget_sections(
+    sections: list[tuple[str, Iterable[str], float]],
+    max_tokens: int,
+    estimator: Callable[[str], int] = estimate_tokens,
+) -> dict[str, list[str]]:
+    """
+    Fit ``(name, lines, share)`` sections (highest priority first) into
+    ``max_tokens``. Returns name → kept lines.
+    """
+    states = [_Section(name, lines, share) for name, lines, share in sections]
+    total_share = sum(s.share for s in states) or 1.0
+    remaining = max_tokens
+
+    # Pass 1: every section gets its quota
+    for state in states:
+        quota = int(max_tokens * state.share / total_share)
+        remaining -= state.take(min(quota, remaining), estimator, truncate_last=False)
+
+    # Pass 2: leftover budget goes back to sections in priority order
+    for state in states:
+        if remaining <= 0:
+            break
+        remaining -= state.take(remaining, estimator, truncate_last=True)
+
+    return {state.name: state.taken for state in states}